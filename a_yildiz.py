@@ -0,0 +1,38 @@
+import heapq
+from cift_yonlu_dijkstra import mesafe_maliyeti
+
+def a_yildiz(graph, baslangic, hedef, sezgisel, maliyet=mesafe_maliyeti):
+    """
+    Hedefe olan tahmini kalan maliyeti (sezgisel) kuyruk önceliğine ekleyerek Dijkstra'yı hedefe yönlendirir.
+    sezgisel(dugum) hiçbir zaman gerçek kalan maliyetten büyük olmamalıdır, aksi halde en kısa yol garanti edilmez.
+    Dönüş: (yol, toplam maliyet, genişletilen düğüm sayısı)
+    """
+    mesafeler = {baslangic: 0}
+    onceki = {baslangic: None}
+    kesinlesen = set()
+    #Kuyrukta gerçek mesafe yerine mesafe + sezgisel tahmin tutuyoruz
+    pq = [(sezgisel(baslangic), 0, baslangic)]
+
+    while pq:
+        _, mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+        if mevcut_dugum in kesinlesen: continue
+        kesinlesen.add(mevcut_dugum)
+        if mevcut_dugum == hedef: break
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+            if yeni_mesafe < mesafeler.get(komsu, float('infinity')):
+                mesafeler[komsu] = yeni_mesafe
+                onceki[komsu] = mevcut_dugum
+                heapq.heappush(pq, (yeni_mesafe + sezgisel(komsu), yeni_mesafe, komsu))
+
+    if hedef not in kesinlesen:
+        return [], float('infinity'), len(kesinlesen)
+
+    #ROTAYI OLUŞTURMA
+    yol = []
+    adim = hedef
+    while adim is not None:
+        yol.insert(0, adim)
+        adim = onceki[adim]
+    return yol, mesafeler[hedef], len(kesinlesen)
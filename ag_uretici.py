@@ -0,0 +1,196 @@
+import math
+import networkx as nx
+import numpy as np
+from kompakt_graf import KompaktGraf
+
+#Bütün üreteçler kenarları doğrudan NumPy dizileri (u, v) olarak üretir; Python döngüsü sadece
+#isteğe bağlı nx.Graph kurulumunda vardır. Rastgelelik her zaman açıkça verilen bir Generator'dan gelir.
+
+
+def _sirali_tekil(dizi):
+    #np.unique'in hash tabanlı yolu büyük tam sayı dizilerinde sıralamadan yavaş, doğrudan sıralıyoruz
+    dizi = np.sort(dizi)
+    if len(dizi) == 0:
+        return dizi
+    return dizi[np.concatenate(([True], dizi[1:] != dizi[:-1]))]
+
+
+def _tekil_kenarlar(u, v, n):
+    #Kendine bağlantıları ve tekrar eden çiftleri atıp (küçük, büyük) sıralı tekil kenarlar döndürür
+    a, b = np.minimum(u, v), np.maximum(u, v)
+    farkli = a != b
+    anahtar = _sirali_tekil(a[farkli].astype(np.int64) * n + b[farkli])
+    return anahtar // n, anahtar % n
+
+
+def _orneklenmis_kenarlar(n, kenar_sayisi, rng, uc_sec):
+    #Uçları uc_sec(boy) ile seçilen kenarları, tekrarlar atıldıktan sonra hedef sayıya ulaşana kadar ekleyerek üretir
+    kenar_sayisi = min(kenar_sayisi, n * (n - 1) // 2)
+    anahtar = np.zeros(0, dtype=np.int64)
+    eksik = kenar_sayisi
+    while eksik > 0:
+        #Tekrar oranını karşılamak için biraz fazla örnekliyoruz
+        boy = int(eksik * 1.1) + 16
+        u, v = _tekil_kenarlar(uc_sec(boy), uc_sec(boy), n)
+        anahtar = _sirali_tekil(np.concatenate([anahtar, u * n + v]))
+        eksik = kenar_sayisi - len(anahtar)
+    if len(anahtar) > kenar_sayisi:
+        anahtar = rng.choice(anahtar, size=kenar_sayisi, replace=False)
+        anahtar.sort()
+    return anahtar // n, anahtar % n
+
+
+def er_kenarlari(n, ortalama_derece, rng):
+    """
+    Erdos-Renyi G(n, m): ortalama derece hedefine göre m = n * d / 2 kenar düzgün rastgele seçilir.
+    nx.erdos_renyi_graph'ın O(n^2) çift taramasına gerek kalmaz.
+    """
+    kenar_sayisi = int(round(n * ortalama_derece / 2))
+    return _orneklenmis_kenarlar(n, kenar_sayisi, rng, lambda boy: rng.integers(0, n, size=boy))
+
+
+def olceksiz_kenarlari(n, ortalama_derece, rng, us=2.5):
+    """
+    Chung-Lu modeliyle ölçeksiz (scale-free) ağ: düğüm i'nin beklenen derecesi i^(-1/(us-1)) ile orantılıdır,
+    derece dağılımı P(k) ~ k^-us kuyruğuna sahip olur. Barabasi-Albert'in sıralı eklemesi vektörleşmediği için
+    uçlar bu ağırlıklarla tek seferde örneklenir.
+    """
+    kenar_sayisi = int(round(n * ortalama_derece / 2))
+    agirlik = np.arange(1, n + 1, dtype=np.float64) ** (-1.0 / (us - 1.0))
+    birikimli = np.cumsum(agirlik)
+    birikimli /= birikimli[-1]
+    #Hub'ları karıştırıyoruz ki düşük kimlikli düğümler her zaman en yüksek dereceli olmasın
+    karisim = rng.permutation(n)
+    uc_sec = lambda boy: karisim[np.minimum(np.searchsorted(birikimli, rng.random(boy)), n - 1)]
+    return _orneklenmis_kenarlar(n, kenar_sayisi, rng, uc_sec)
+
+
+def geometrik_kenarlari(n, yaricap, rng):
+    """
+    Birim karede rastgele noktalar; aralarındaki uzaklık yaricap'tan küçük olan çiftler bağlanır.
+    Kare, kenarı en az yaricap olan hücrelere bölünür; her nokta sadece kendi satırındaki sonraki noktalar
+    ve üst satırdaki üç komşu hücreyle karşılaştırılır. Dönüş: (u, v, noktalar).
+    """
+    noktalar = rng.random((n, 2))
+    k = max(1, int(1.0 / yaricap))
+    hx = np.minimum((noktalar[:, 0] * k).astype(np.int64), k - 1)
+    hy = np.minimum((noktalar[:, 1] * k).astype(np.int64), k - 1)
+    hucre = hy * k + hx
+    sira = np.argsort(hucre, kind='stable')
+    #Düğüm kimlikleri hücre sırasına göre verilir; bir satırdaki yan yana hücreler dizide ardışık olur
+    noktalar, hx, hy, hucre = noktalar[sira], hx[sira], hy[sira], hucre[sira]
+    indeks = np.arange(n)
+
+    u_parcalari, v_parcalari = [], []
+    #Aynı satır: kendi hücresi ve sağdaki hücrede, kendisinden sonra gelen noktalar
+    alt = indeks + 1
+    ust = np.searchsorted(hucre, hy * k + np.minimum(hx + 1, k - 1), side='right')
+    araliklar = [(indeks, alt, ust)]
+    #Üst satır: sol üst, üst ve sağ üst hücreler
+    ustte = hy + 1 < k
+    i = indeks[ustte]
+    satir = (hy[ustte] + 1) * k
+    araliklar.append((i,
+                      np.searchsorted(hucre, satir + np.maximum(hx[ustte] - 1, 0), side='left'),
+                      np.searchsorted(hucre, satir + np.minimum(hx[ustte] + 1, k - 1), side='right')))
+
+    for kaynak, bas, son in araliklar:
+        adet = np.maximum(son - bas, 0)
+        toplam = int(adet.sum())
+        if toplam == 0:
+            continue
+        #Her (nokta, aday aralığı) çiftini tek bir düz aday listesine açıyoruz
+        u = np.repeat(kaynak, adet)
+        v = np.repeat(bas, adet) + (np.arange(toplam) - np.repeat(np.cumsum(adet) - adet, adet))
+        fark = noktalar[v] - noktalar[u]
+        yakin = np.einsum('ij,ij->i', fark, fark) < yaricap ** 2
+        u_parcalari.append(u[yakin])
+        v_parcalari.append(v[yakin])
+    bos = np.zeros(0, dtype=np.int64)
+    u = np.concatenate(u_parcalari) if u_parcalari else bos
+    v = np.concatenate(v_parcalari) if v_parcalari else bos
+    return u, v, noktalar
+
+
+def izgara_kenarlari(satir, sutun):
+    #satir x sutun ızgara; düğüm kimliği satır * sutun + sütun. Dönüş: (u, v, noktalar)
+    kimlik = np.arange(satir * sutun).reshape(satir, sutun)
+    u = np.concatenate([kimlik[:, :-1].ravel(), kimlik[:-1, :].ravel()])
+    v = np.concatenate([kimlik[:, 1:].ravel(), kimlik[1:, :].ravel()])
+    y, x = np.divmod(np.arange(satir * sutun), sutun)
+    noktalar = np.column_stack([x, y]).astype(np.float64)
+    return u, v, noktalar
+
+
+def rastgele_agirliklar(kenar_sayisi, rng, en_kucuk=1, en_buyuk=100):
+    #rastgele_ag_olustur ile aynı dağılım: en_kucuk..en_buyuk arası tam sayı gecikmeler
+    return rng.integers(en_kucuk, en_buyuk + 1, size=kenar_sayisi)
+
+
+def oklid_agirliklari(u, v, noktalar, olcek=100, ondalik=1):
+    #Koordinatlı ağlarda kablonun uzunluğu: kuş uçuşu mesafe * olcek (InteraktifAgSimulasyonu ile aynı)
+    uzunluk = np.hypot(*(noktalar[v] - noktalar[u]).T) * olcek
+    return np.round(uzunluk, ondalik)
+
+
+def rastgele_trafikler(kenar_sayisi, rng):
+    return rng.random(kenar_sayisi)
+
+
+def nx_grafi(n, u, v, agirliklar, trafikler=None, noktalar=None):
+    """
+    Kenar dizilerinden NetworkX ağı kurar. Düğümler 0..n-1'dir; noktalar verilirse 'pos' özelliğine yazılır.
+    Ağırlıklar Python sayılarına çevrilir (tam sayı dizisi Python int olarak kalır).
+    """
+    G = nx.Graph()
+    if noktalar is not None:
+        G.add_nodes_from((i, {'pos': (x, y)}) for i, (x, y) in enumerate(noktalar.tolist()))
+    else:
+        G.add_nodes_from(range(n))
+    if trafikler is None:
+        G.add_edges_from((a, b, {'weight': w}) for a, b, w in zip(u.tolist(), v.tolist(), agirliklar.tolist()))
+    else:
+        G.add_edges_from((a, b, {'weight': w, 'traffic': t})
+                         for a, b, w, t in zip(u.tolist(), v.tolist(), agirliklar.tolist(), trafikler.tolist()))
+    return G
+
+
+TOPOLOJILER = ('erdos_renyi', 'geometrik', 'izgara', 'olceksiz')
+
+
+def uret(topoloji, dugum_sayisi, ortalama_derece=8, seed=42, cikti='nx', en_buyuk_agirlik=100, trafik=True):
+    """
+    Tohumlu test ağı üretir. topoloji: 'erdos_renyi', 'geometrik', 'izgara' ya da 'olceksiz'.
+    cikti='nx' ise nx.Graph, 'kompakt' ise doğrudan KompaktGraf döner (nx.Graph hiç kurulmaz).
+    Geometrik ağda ağırlıklar Öklid uzunluğundan, diğerlerinde 1..en_buyuk_agirlik tam sayılarından gelir.
+    trafik=False verilirse kenarlara trafik yazılmaz.
+    """
+    rng = np.random.default_rng(seed)
+    noktalar = None
+    if topoloji == 'erdos_renyi':
+        u, v = er_kenarlari(dugum_sayisi, ortalama_derece, rng)
+    elif topoloji == 'olceksiz':
+        u, v = olceksiz_kenarlari(dugum_sayisi, ortalama_derece, rng)
+    elif topoloji == 'geometrik':
+        #Beklenen derece n * pi * r^2 olacak şekilde yarıçap seçilir
+        yaricap = math.sqrt(ortalama_derece / (math.pi * max(dugum_sayisi, 1)))
+        u, v, noktalar = geometrik_kenarlari(dugum_sayisi, yaricap, rng)
+    elif topoloji == 'izgara':
+        #Düğüm sayısına en yakın kare ızgara; ortalama derece yaklaşık 4'tür
+        kenar = max(2, round(math.sqrt(dugum_sayisi)))
+        dugum_sayisi = kenar * kenar
+        u, v, noktalar = izgara_kenarlari(kenar, kenar)
+    else:
+        raise ValueError(f"Bilinmeyen topoloji: {topoloji}")
+
+    if topoloji == 'geometrik':
+        agirliklar = oklid_agirliklari(u, v, noktalar)
+    else:
+        agirliklar = rastgele_agirliklar(len(u), rng, en_buyuk=en_buyuk_agirlik)
+    trafikler = rastgele_trafikler(len(u), rng) if trafik else None
+
+    if cikti == 'nx':
+        return nx_grafi(dugum_sayisi, u, v, agirliklar, trafikler, noktalar)
+    if cikti == 'kompakt':
+        return KompaktGraf.kenarlardan(dugum_sayisi, u, v, agirliklar, trafikler)
+    raise ValueError(f"Bilinmeyen çıktı: {cikti}")
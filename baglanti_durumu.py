@@ -0,0 +1,378 @@
+import asyncio
+import time
+from kompakt_graf import KompaktGraf
+from dinamik_agac import DinamikEnKisaYolAgaci
+from mesafe_vektoru import SanalZamanDongusu
+
+#OSPF (RFC 2328) boyları: paket başlığı 24 bayt, LS Update'te LSA sayısı 4 bayt, LSA başlığı 20 bayt,
+#router-LSA gövdesi 4 bayt + bağlantı başına 12 bayt
+OSPF_BASLIK = 24
+LSU_SAYAC = 4
+LSA_BASLIK = 20
+ROUTER_LSA = 4
+LSA_BAGLANTI = 12
+
+
+class Kisitlayici:
+    """
+    OSPF'deki üstel geri çekilmeli kısıtlama zamanlayıcısı (timers throttle baslangic bekleme en_fazla).
+    Sakin bir dönemden sonraki ilk iş baslangic kadar gecikir; ardışık işler arasında en az mevcut bekleme
+    kadar süre bırakılır ve bekleme her işte iki katına çıkıp en_fazla'da durur. en_fazla boyunca iş
+    olmazsa bekleme başa döner.
+    """
+    def __init__(self, baslangic, bekleme, en_fazla):
+        self.baslangic = baslangic
+        self.bekleme = bekleme
+        self.en_fazla = en_fazla
+        self.mevcut_bekleme = bekleme
+        self.son = None
+
+    def zaman(self, simdi):
+        #İşin en erken çalışabileceği an
+        if self.son is None or simdi - self.son >= self.en_fazla:
+            self.mevcut_bekleme = self.bekleme
+            return simdi + self.baslangic
+        return max(simdi + self.baslangic, self.son + self.mevcut_bekleme)
+
+    def calisti(self, simdi):
+        if self.son is not None and simdi - self.son < self.en_fazla:
+            self.mevcut_bekleme = min(2 * self.mevcut_bekleme, self.en_fazla)
+        self.son = simdi
+
+
+def lsa_boyu(baglantilar):
+    return LSA_BASLIK + ROUTER_LSA + LSA_BAGLANTI * len(baglantilar)
+
+
+class LSYonlendirici:
+    """
+    Bağlantı durumu simülasyonundaki tek bir yönlendirici. Kendi LSDB'sini (sahip -> (sıra no, bağlantılar))
+    ve bu LSDB'den türeyen kablo maliyetlerini tutar; en kısa yol ağacı DinamikEnKisaYolAgaci'dır,
+    böylece bir kablonun maliyeti değiştiğinde ya da bir yaprak düştüğünde sadece etkilenen alt ağaç yeniden hesaplanır.
+    """
+    def __init__(self, ad, simulasyon, baglantilar, gecikmeler):
+        self.ad = ad
+        self.sim = simulasyon
+        #Kendi açık kabloları: komsu -> maliyet; gecikmeler taban topolojideki bütün kablolar içindir
+        self.baglantilar = baglantilar
+        self.gecikmeler = gecikmeler
+        self.sira = 1
+        self.lsdb = None
+        self.maliyetler = None
+        self.agac = None
+        #Son SPF'ten beri maliyeti değişen kablolar: (küçük kimlik, büyük kimlik) -> son SPF'teki maliyet
+        self.bekleyen = {}
+        self.spf_kisitlayici = Kisitlayici(*simulasyon.spf_kisitlama)
+        self.lsa_kisitlayici = Kisitlayici(*simulasyon.lsa_kisitlama)
+        self.spf_bekliyor = False
+        self.lsa_bekliyor = False
+        self.cpu_s = 0.0
+        self.spf_sayisi = 0
+        self.gelen = asyncio.Queue()
+
+    async def calis(self):
+        gelen = self.gelen
+        while True:
+            gonderen, sahip, sira, baglantilar = await gelen.get()
+            t0 = time.perf_counter()
+            #Kopan kablodan gecikmeyle gelen paketler atılır
+            if gonderen in self.baglantilar:
+                mevcut = self.lsdb.get(sahip)
+                if mevcut is None or sira > mevcut[0]:
+                    self._lsa_kur(sahip, sira, baglantilar)
+                    self._yay(sahip, sira, baglantilar, haric=gonderen)
+                else:
+                    #Aynı ya da daha eski kopya: kurulmaz ve yayılmaz
+                    self.sim.kopya += 1
+            self.cpu_s += time.perf_counter() - t0
+            self.sim._is_bitti()
+
+    def _etkin_maliyet(self, u, v):
+        #İki yönlü kontrol: kablo ancak iki uç da birbirini ilan ediyorsa kullanılır, iki ilanın büyüğü alınır
+        a, b = self.lsdb.get(u), self.lsdb.get(v)
+        if a is None or b is None:
+            return float('infinity')
+        ma, mb = a[1].get(v), b[1].get(u)
+        if ma is None or mb is None:
+            return float('infinity')
+        return max(ma, mb)
+
+    def _lsa_kur(self, sahip, sira, baglantilar):
+        eski = self.lsdb.get(sahip)
+        self.lsdb[sahip] = (sira, baglantilar)
+        graf, maliyetler = self.sim.graf, self.maliyetler
+        u = graf.indeks[sahip]
+        komsular = baglantilar.keys() if eski is None else baglantilar.keys() | eski[1].keys()
+        for komsu in komsular:
+            v = graf.indeks[komsu]
+            yeni = self._etkin_maliyet(sahip, komsu)
+            i = graf.kenar_konumu(u, v)
+            if maliyetler[i] != yeni:
+                anahtar = (u, v) if u < v else (v, u)
+                self.bekleyen.setdefault(anahtar, maliyetler[i])
+                maliyetler[i] = yeni
+                maliyetler[graf.kenar_konumu(v, u)] = yeni
+        if self.bekleyen:
+            self._spf_planla()
+
+    def _yay(self, sahip, sira, baglantilar, haric=None):
+        paket = (self.ad, sahip, sira, baglantilar)
+        for komsu in self.baglantilar:
+            if komsu != haric:
+                self.sim._ilet(komsu, self.gecikmeler[komsu], paket, lsa_boyu(baglantilar))
+
+    def _spf_planla(self):
+        if self.spf_bekliyor:
+            return
+        self.spf_bekliyor = True
+        self.sim._is_basladi()
+        dongu = asyncio.get_running_loop()
+        dongu.call_at(self.spf_kisitlayici.zaman(dongu.time()), self._spf)
+
+    def _spf(self):
+        t0 = time.perf_counter()
+        sim, graf = self.sim, self.sim.graf
+        simdi = asyncio.get_running_loop().time()
+        self.spf_bekliyor = False
+        self.spf_kisitlayici.calisti(simdi)
+        #Kısıtlama süresince birikenlerden sonunda eski değerine dönenler atılır
+        degisimler = [(u, v, eski) for (u, v), eski in self.bekleyen.items()
+                      if self.maliyetler[graf.kenar_konumu(u, v)] != eski]
+        self.bekleyen = {}
+        if degisimler:
+            if sim.artimli:
+                dokunulan = self.agac.kenarlar_guncellendi(degisimler)
+            else:
+                self.agac = DinamikEnKisaYolAgaci(graf, self.ad, maliyetler=self.maliyetler)
+                dokunulan = graf.dugum_sayisi
+            self.spf_sayisi += 1
+            sim.spf_calismasi += 1
+            sim.spf_dokunulan += dokunulan
+            sim.son_spf = simdi
+        self.cpu_s += time.perf_counter() - t0
+        sim._is_bitti()
+
+    def lsa_uret_planla(self):
+        if self.lsa_bekliyor:
+            return
+        self.lsa_bekliyor = True
+        self.sim._is_basladi()
+        dongu = asyncio.get_running_loop()
+        dongu.call_at(self.lsa_kisitlayici.zaman(dongu.time()), self._lsa_uret)
+
+    def _lsa_uret(self):
+        #Kısıtlama süresince biriken bütün yerel değişiklikler tek bir yeni LSA'da ilan edilir
+        t0 = time.perf_counter()
+        self.lsa_bekliyor = False
+        self.lsa_kisitlayici.calisti(asyncio.get_running_loop().time())
+        self.sira += 1
+        baglantilar = dict(self.baglantilar)
+        self._lsa_kur(self.ad, self.sira, baglantilar)
+        self._yay(self.ad, self.sira, baglantilar)
+        self.cpu_s += time.perf_counter() - t0
+        self.sim._is_bitti()
+
+
+class BaglantiDurumuSimulasyonu:
+    """
+    OSPF benzeri bağlantı durumu protokolü. Her yönlendirici ayrı bir asyncio görevidir; LSA'lar sıra
+    numarasıyla taşınır, daha yeni olmayan kopyalar kurulmadan ve yayılmadan atılır. Başlangıçta bütün
+    LSDB'ler eşitlenmiş ve her yönlendiricinin en kısa yol ağacı kurulmuş kabul edilir (ilk ölçüm).
+    artimli=True ise SPF DinamikEnKisaYolAgaci ile sadece etkilenen alt ağaçta yapılır, False ise her SPF tam Dijkstra'dır.
+    spf_kisitlama ve lsa_kisitlama: (baslangic, bekleme, en_fazla) saniye; bkz. Kisitlayici.
+    gecikme(u, v, ozellikler) kablo gecikmesini saniye olarak döndürür; verilmezse ağırlık * zaman_olcegi.
+    """
+    def __init__(self, graph, artimli=True, spf_kisitlama=(0.05, 0.2, 5.0), lsa_kisitlama=(0.0, 0.05, 5.0),
+                 gecikme=None, zaman_olcegi=0.001):
+        self.artimli = artimli
+        self.spf_kisitlama = spf_kisitlama
+        self.lsa_kisitlama = lsa_kisitlama
+        if gecikme is None:
+            gecikme = lambda u, v, ozellikler: ozellikler['weight'] * zaman_olcegi
+
+        self.graf = KompaktGraf.graftan(graph)
+        taban_maliyetler = self.graf.maliyet_listesi()
+        ortak_lsdb = {}
+        self.yonlendiriciler = {}
+        for dugum in graph.nodes:
+            baglantilar = {komsu: ozellikler['weight'] for komsu, ozellikler in graph[dugum].items() if komsu != dugum}
+            gecikmeler = {komsu: gecikme(dugum, komsu, ozellikler) for komsu, ozellikler in graph[dugum].items()}
+            self.yonlendiriciler[dugum] = LSYonlendirici(dugum, self, baglantilar, gecikmeler)
+            ortak_lsdb[dugum] = (1, dict(baglantilar))
+
+        #İlk SPF: her yönlendirici kendi maliyet listesi üzerinde tam bir en kısa yol ağacı kurar
+        sureler = []
+        for yonlendirici in self.yonlendiriciler.values():
+            t0 = time.perf_counter()
+            yonlendirici.lsdb = dict(ortak_lsdb)
+            yonlendirici.maliyetler = list(taban_maliyetler)
+            yonlendirici.agac = DinamikEnKisaYolAgaci(self.graf, yonlendirici.ad, maliyetler=yonlendirici.maliyetler)
+            sureler.append(time.perf_counter() - t0)
+        self.ilk = {
+            'spf_calismasi': len(sureler),
+            'cpu_toplam_s': sum(sureler),
+            'cpu_router_ort_s': sum(sureler) / max(len(sureler), 1),
+            'cpu_router_en_fazla_s': max(sureler, default=0.0),
+        }
+
+        self.mesaj = 0
+        self.bayt = 0
+        self.kopya = 0
+        self.spf_calismasi = 0
+        self.spf_dokunulan = 0
+        self.son_spf = None
+        self._bekleyen = 0
+        self._gorevler = []
+        self._sakin = None
+        self._evre = None
+
+    def _is_basladi(self):
+        self._bekleyen += 1
+        self._sakin.clear()
+
+    def _is_bitti(self):
+        self._bekleyen -= 1
+        if self._bekleyen == 0:
+            self._sakin.set()
+
+    def _ilet(self, alici, gecikme, paket, lsa_bayt):
+        #Her LSA ayrı bir LS Update paketinde gider; onaylar (LS Ack) güvenilir kablo varsayımıyla sayılmaz
+        self.mesaj += 1
+        self.bayt += OSPF_BASLIK + LSU_SAYAC + lsa_bayt
+        self._is_basladi()
+        asyncio.get_running_loop().call_later(gecikme, self.yonlendiriciler[alici].gelen.put_nowait, paket)
+
+    def _evre_ac(self):
+        if self._evre is None:
+            self._evre = (asyncio.get_running_loop().time(), time.perf_counter(), self.mesaj, self.bayt,
+                          self.kopya, self.spf_calismasi, self.spf_dokunulan,
+                          [y.cpu_s for y in self.yonlendiriciler.values()])
+
+    def baslat(self):
+        #Çalışan bir olay döngüsü içinde çağrılır
+        self._sakin = asyncio.Event()
+        self._sakin.set()
+        for yonlendirici in self.yonlendiriciler.values():
+            self._gorevler.append(asyncio.create_task(yonlendirici.calis()))
+
+    def _kablo(self, u, v):
+        if u == v or v not in self.yonlendiriciler[u].gecikmeler:
+            raise ValueError(f"{u}-{v} kablosu taban topolojide yok")
+        if not self._gorevler:
+            self.baslat()
+        self._evre_ac()
+        return self.yonlendiriciler[u], self.yonlendiriciler[v]
+
+    def baglanti_kopar(self, u, v):
+        #İki uç kopmayı hemen fark eder ve kısıtlama izin verdiğinde yeni LSA üretir
+        for yonlendirici, komsu in zip(self._kablo(u, v), (v, u)):
+            yonlendirici.baglantilar.pop(komsu, None)
+            yonlendirici.lsa_uret_planla()
+
+    def maliyet_degistir(self, u, v, maliyet):
+        for yonlendirici, komsu in zip(self._kablo(u, v), (v, u)):
+            if komsu in yonlendirici.baglantilar:
+                yonlendirici.baglantilar[komsu] = maliyet
+                yonlendirici.lsa_uret_planla()
+
+    def baglanti_onar(self, u, v, maliyet=None):
+        """
+        Kopmuş kabloyu geri getirir. Komşuluk kurulurken iki uç LSDB özetlerini (DD paketleri) değiş tokuş eder
+        ve karşı tarafta eksik ya da eski olan LSA'ları gönderir; bölünme sırasında kaçırılan ilanlar böyle tamamlanır.
+        """
+        a, b = self._kablo(u, v)
+        if maliyet is None:
+            maliyet = self.graf.agirliklar[self.graf.kenar_konumu(self.graf.indeks[u], self.graf.indeks[v])].item()
+        a.baglantilar[v] = maliyet
+        b.baglantilar[u] = maliyet
+        for gonderen, alici in ((a, b), (b, a)):
+            self.mesaj += 1
+            self.bayt += OSPF_BASLIK + 8 + LSA_BASLIK * len(gonderen.lsdb)
+            for sahip, (sira, baglantilar) in gonderen.lsdb.items():
+                if alici.lsdb.get(sahip, (0,))[0] < sira:
+                    self._ilet(alici.ad, gonderen.gecikmeler[alici.ad], (gonderen.ad, sahip, sira, baglantilar),
+                               lsa_boyu(baglantilar))
+        a.lsa_uret_planla()
+        b.lsa_uret_planla()
+
+    async def yakinsa(self, zaman_asimi=None):
+        """
+        Bütün yayılma ve SPF'ler bitene kadar bekler; son olaydan beri ölçümleri döndürür:
+        yakinsama_s (son SPF'e kadar simülasyon süresi), gercek_s, lsa_mesaji, bayt, kopya (atılan yinelenen LSA),
+        spf_calismasi, spf_dokunulan (SPF'lerin yeniden hesapladığı toplam düğüm), cpu_toplam_s,
+        cpu_router_ort_s ve cpu_router_en_fazla_s (LSA işleme + SPF, yönlendirici başına).
+        """
+        if not self._gorevler:
+            self.baslat()
+        self._evre_ac()
+        baslangic, gercek, mesaj, bayt, kopya, spf, dokunulan, cpu = self._evre
+        await asyncio.wait_for(self._sakin.wait(), zaman_asimi)
+        self._evre = None
+        son = self.son_spf if self.son_spf is not None and self.son_spf > baslangic else baslangic
+        farklar = [y.cpu_s - once for y, once in zip(self.yonlendiriciler.values(), cpu)]
+        return {
+            'yakinsama_s': son - baslangic,
+            'gercek_s': time.perf_counter() - gercek,
+            'lsa_mesaji': self.mesaj - mesaj,
+            'bayt': self.bayt - bayt,
+            'kopya': self.kopya - kopya,
+            'spf_calismasi': self.spf_calismasi - spf,
+            'spf_dokunulan': self.spf_dokunulan - dokunulan,
+            'cpu_toplam_s': sum(farklar),
+            'cpu_router_ort_s': sum(farklar) / max(len(farklar), 1),
+            'cpu_router_en_fazla_s': max(farklar, default=0.0),
+        }
+
+    async def durdur(self):
+        for gorev in self._gorevler:
+            gorev.cancel()
+        await asyncio.gather(*self._gorevler, return_exceptions=True)
+        self._gorevler = []
+
+    def yol(self, kaynak, hedef):
+        #kaynak yönlendiricinin kendi LSDB'sine göre rotası: (rota, toplam maliyet)
+        yol, mesafe = self.yonlendiriciler[kaynak].agac.yol(hedef)
+        if mesafe == float('infinity'):
+            return None, mesafe
+        return yol, mesafe
+
+    def mesafe(self, kaynak, hedef):
+        agac = self.yonlendiriciler[kaynak].agac
+        return agac.mesafeler[self.graf.indeks[hedef]]
+
+
+OLAYLAR = ('kopar', 'onar', 'maliyet')
+
+
+def olay_senaryosu(graph, olaylar, zaman_asimi=None, sanal_zaman=True, **ayarlar):
+    """
+    olaylar sırayla uygulanır ve her birinden sonra ağ yakınsatılır. Olay biçimleri:
+    ('kopar', u, v), ('onar', u, v) ve ('maliyet', u, v, yeni_maliyet).
+    ayarlar BaglantiDurumuSimulasyonu'na aktarılır.
+    Dönüş: {'ilk': ilk SPF ölçümleri, 'olaylar': [(olay, ölçümler), ...], 'simulasyon': ...}
+    """
+    async def calistir():
+        sim = BaglantiDurumuSimulasyonu(graph, **ayarlar)
+        sonuclar = []
+        try:
+            for olay in olaylar:
+                tur, *arguman = olay
+                if tur == 'kopar':
+                    sim.baglanti_kopar(*arguman)
+                elif tur == 'onar':
+                    sim.baglanti_onar(*arguman)
+                elif tur == 'maliyet':
+                    sim.maliyet_degistir(*arguman)
+                else:
+                    raise ValueError(f"Bilinmeyen olay: {tur}")
+                sonuclar.append((olay, await sim.yakinsa(zaman_asimi)))
+        finally:
+            await sim.durdur()
+        return {'ilk': sim.ilk, 'olaylar': sonuclar, 'simulasyon': sim}
+    if not sanal_zaman:
+        return asyncio.run(calistir())
+    dongu = SanalZamanDongusu()
+    try:
+        return dongu.run_until_complete(calistir())
+    finally:
+        dongu.close()
@@ -1,21 +1,46 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+from vektorel_bellman_ford import VektorelBellmanFord
+from kuyruklu_bellman_ford import kuyruklu_bellman_ford
+from izleme import izlemeli_bellman_ford
+from mesafe_vektoru import baglanti_kopmasi_senaryosu
 
 class AgSimulasyonuBellman:
     def __init__(self):
         #NetworkX kütüphanesini kullanarak boş bir grafik oluşturuyoruz
         #Bu grafik yönlendirilmemiş (undirected) olacak, yani kablolar çift yönlüdür
         self.graph = nx.Graph() 
+        #NumPy motorunun kenar dizileri ilk ihtiyaç anında kurulur
+        self._vektorel_motor = None
+        self._vektorel_kaynagi = None
 
     def baglanti_ekle(self, u, v, agirlik):
         #İki yönlendirici (router) arasına belirtilen gecikme süresiyle (ağırlık) hat çekiyoruz
         self.graph.add_edge(u, v, weight=agirlik)
+        #Kenar dizileri artık eski, bir sonraki sorguda yeniden kurulacak
+        self._vektorel_motor = None
 
-    def bellman_ford_kendi_kodumuz(self, baslangic_dugumu, hedef_dugumu):
+    def vektorel_motor(self):
+        if self._vektorel_motor is None or self._vektorel_kaynagi is not self.graph:
+            self._vektorel_motor = VektorelBellmanFord.graftan(self.graph)
+            self._vektorel_kaynagi = self.graph
+        return self._vektorel_motor
+
+    def bellman_ford_kendi_kodumuz(self, baslangic_dugumu, hedef_dugumu, motor='python', izleme=None):
         """
         Bellman-Ford Algoritması:
         Tüm kenarları (V-1) kez gezerek en kısa yolu bulmaya çalışır.
+        motor='numpy' verilirse her tur kenar dizileri üzerinde toplu (vektörel) yapılır. Maliyet aynıdır,
+        ama eşit maliyetli birden fazla yol varsa 'python' motorundan farklı bir rota dönebilir.
+        izleme (Izleme) verilirse tur/gevşetme sayaçları ve aşama süreleri ona yazılır.
         """
+        if motor == 'numpy':
+            return self.vektorel_motor().en_kisa_yol(baslangic_dugumu, hedef_dugumu, izleme)
+        if motor != 'python':
+            raise ValueError(f"Bilinmeyen motor: {motor}")
+        if izleme is not None:
+            return self._izlemeli_bellman_ford(baslangic_dugumu, hedef_dugumu, izleme)
+
         #1. BAŞLANGIÇ DURUMU (INITIALIZATION)
         #Tüm düğümlere olan mesafeyi başlangıçta sonsuz kabul ediyoruz
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
@@ -83,6 +108,52 @@ class AgSimulasyonuBellman:
             
         return yol, mesafeler[hedef_dugumu]
 
+    def _izlemeli_bellman_ford(self, baslangic_dugumu, hedef_dugumu, izleme):
+        #Sayaçlı döngü ayrı tutulur, böylece izleme kapalıyken yukarıdaki döngüye hiçbir ek iş gelmez
+        mesafeler, onceki_dugum = izlemeli_bellman_ford(self.graph, baslangic_dugumu, izleme)
+        if mesafeler is None:
+            print("UYARI: Negatif ağırlıklı döngü tespit edildi!")
+            return None, None
+        if mesafeler[hedef_dugumu] == float('infinity'):
+            return None, float('infinity')
+
+        with izleme.asama('rota'):
+            yol = []
+            adim = hedef_dugumu
+            while adim is not None:
+                yol.insert(0, adim)
+                adim = onceki_dugum[adim]
+        return yol, mesafeler[hedef_dugumu]
+
+    def bellman_ford_kuyruklu(self, baslangic_dugumu, hedef_dugumu, izleme=None):
+        """
+        Kuyruk tabanlı Bellman-Ford (SPFA):
+        Sadece bir önceki adımda mesafesi kısalan düğümlerin kenarlarını gevşetir.
+        """
+        mesafeler, onceki_dugum, _ = kuyruklu_bellman_ford(self.graph, baslangic_dugumu, izleme=izleme)
+        if mesafeler is None:
+            print("UYARI: Negatif ağırlıklı döngü tespit edildi!")
+            return None, None
+
+        if mesafeler[hedef_dugumu] == float('infinity'):
+            return None, float('infinity')
+
+        yol = []
+        adim = hedef_dugumu
+        while adim is not None:
+            yol.insert(0, adim)
+            adim = onceki_dugum[adim]
+        return yol, mesafeler[hedef_dugumu]
+
+    def mesafe_vektoru_simulasyonu(self, kopacak_baglanti=None, **ayarlar):
+        """
+        Bellman-Ford'un dağıtık hali: her router kendi asyncio görevinde komşularıyla mesafe vektörü
+        değiş tokuş eder (RIP benzeri). kopacak_baglanti (u, v) verilirse yakınsamadan sonra kablo koparılır.
+        ayarlar: ufuk, tetiklemeli, periyot, metrik, gecikme, sonsuz... (bkz. MesafeVektoruSimulasyonu)
+        Dönüş: {'ilk': ölçümler, 'kopma': ölçümler, 'simulasyon': ...}; ölçümler yakınsama süresi, mesaj ve bayt sayısıdır.
+        """
+        return baglanti_kopmasi_senaryosu(self.graph, kopacak_baglanti, **ayarlar)
+
     def agi_ciz(self, bulunan_yol=None):
         #Grafiği ekrana çizdirmek için yerleşim düzenini ayarlıyoruz
         pos = nx.spring_layout(self.graph, seed=42)
@@ -0,0 +1,74 @@
+import heapq
+
+def mesafe_maliyeti(ozellikler):
+    #Sadece fiziksel mesafe (weight)
+    return ozellikler['weight']
+
+
+def cift_yonlu_dijkstra(graph, baslangic, hedef, maliyet=mesafe_maliyeti):
+    """
+    Başlangıçtan ileri, hedeften geri iki Dijkstra aramasını aynı anda yürütüp ortada buluşturur.
+    maliyet: kenar özelliklerinden kenar maliyetini hesaplayan fonksiyon.
+    Dönüş: (yol, toplam maliyet, işlem sayısı). İşlem sayısı dijkstra_analizli ile aynı şekilde sayılır.
+    """
+    islem_sayisi = 0
+    if baslangic == hedef:
+        return [baslangic], 0, islem_sayisi
+
+    #İki yönün mesafe ve önceki düğüm kayıtları (0: ileri, 1: geri)
+    #Sadece ulaşılan düğümleri tutuyoruz, tüm ağ için sonsuz dolu sözlük kurmuyoruz
+    mesafeler = ({baslangic: 0}, {hedef: 0})
+    onceki = ({baslangic: None}, {hedef: None})
+    kuyruklar = ([(0, baslangic)], [(0, hedef)])
+
+    #Şimdiye kadar bulunan en iyi s-t yolunun maliyeti ve iki aramanın buluştuğu kenar
+    en_iyi = float('infinity')
+    bulusma = None
+
+    while kuyruklar[0] and kuyruklar[1]:
+        #DURMA KRİTERİ
+        #İki kuyruğun tepesindeki mesafelerin toplamı en iyi yoldan kısa değilse daha iyi bir yol çıkamaz
+        if kuyruklar[0][0][0] + kuyruklar[1][0][0] >= en_iyi:
+            break
+
+        #Tepesi daha küçük olan tarafı ilerletiyoruz, böylece iki top dengeli büyür
+        yon = 0 if kuyruklar[0][0][0] <= kuyruklar[1][0][0] else 1
+        mevcut_mesafe, mevcut_dugum = heapq.heappop(kuyruklar[yon])
+        islem_sayisi += 1
+
+        if mevcut_mesafe > mesafeler[yon][mevcut_dugum]:
+            continue
+        bu_yon = mesafeler[yon]
+        karsi_yon = mesafeler[1 - yon]
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            islem_sayisi += 1
+            yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+
+            if yeni_mesafe < bu_yon.get(komsu, float('infinity')):
+                bu_yon[komsu] = yeni_mesafe
+                onceki[yon][komsu] = mevcut_dugum
+                heapq.heappush(kuyruklar[yon], (yeni_mesafe, komsu))
+
+            #Komşuya karşı yönden de ulaşıldıysa iki yarım yol birleşip tam bir aday rota oluşturur
+            if komsu in karsi_yon and yeni_mesafe + karsi_yon[komsu] < en_iyi:
+                en_iyi = yeni_mesafe + karsi_yon[komsu]
+                bulusma = (mevcut_dugum, komsu) if yon == 0 else (komsu, mevcut_dugum)
+
+    #Hedefe ulaşılamadıysa diğer Dijkstra sürümleri gibi [hedef] ve sonsuz maliyet döner
+    if bulusma is None:
+        return [hedef], float('infinity'), islem_sayisi
+
+    #ROTAYI OLUŞTURMA
+    #İleri yarıyı başlangıca kadar geriye, geri yarıyı hedefe kadar ileriye doğru izliyoruz
+    yol = []
+    adim = bulusma[0]
+    while adim is not None:
+        yol.insert(0, adim)
+        adim = onceki[0][adim]
+    adim = bulusma[1]
+    while adim is not None:
+        yol.append(adim)
+        adim = onceki[1][adim]
+
+    return yol, en_iyi, islem_sayisi
@@ -0,0 +1,230 @@
+import heapq
+import math
+from cift_yonlu_dijkstra import mesafe_maliyeti
+
+class EsitMaliyetliYollar:
+    """
+    Eşit maliyetli çok yollu yönlendirme (ECMP) için kaynağın en kısa yol DAG'ı.
+    Her düğüm için tek bir önceki düğüm yerine, en kısa mesafeyi veren bütün önceki düğümler tutulur.
+    Yollar hiçbir zaman topluca üretilmez: yol_sayisi DAG üzerinde sayar, yollar() tek tek üretir.
+    """
+    def __init__(self, kaynak, mesafeler, oncekiler):
+        self.kaynak = kaynak
+        self.mesafeler = mesafeler
+        #dugum -> en kısa yoldaki bütün önceki düğümler
+        self.oncekiler = oncekiler
+        self._sayilar = {kaynak: 1}
+
+    @classmethod
+    def hesapla(cls, graph, kaynak, hedef=None, maliyet=mesafe_maliyeti, tolerans=1e-9):
+        """
+        Eşitlikleri atmayan Dijkstra. Ondalıklı maliyetlerde göreli farkı tolerans'tan küçük olan iki yol eşit sayılır.
+        hedef verilirse hedef kesinleştiğinde durulur; hedefin bütün eşit maliyetli yolları o ana kadar bulunmuştur
+        (kenar maliyetleri pozitif olmalıdır).
+        """
+        mesafeler = {kaynak: 0}
+        oncekiler = {kaynak: []}
+        kesinlesen = set()
+        pq = [(0, kaynak)]
+
+        while pq:
+            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_dugum in kesinlesen: continue
+            kesinlesen.add(mevcut_dugum)
+            if mevcut_dugum == hedef: break
+
+            for komsu, ozellikler in graph[mevcut_dugum].items():
+                if komsu in kesinlesen: continue
+                yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+                eski_mesafe = mesafeler.get(komsu, float('infinity'))
+                if yeni_mesafe == eski_mesafe or math.isclose(yeni_mesafe, eski_mesafe, rel_tol=tolerans):
+                    #Eşit maliyetli ikinci bir yol: önceki düğüm listeye eklenir
+                    oncekiler[komsu].append(mevcut_dugum)
+                elif yeni_mesafe < eski_mesafe:
+                    mesafeler[komsu] = yeni_mesafe
+                    oncekiler[komsu] = [mevcut_dugum]
+                    heapq.heappush(pq, (yeni_mesafe, komsu))
+        return cls(kaynak, mesafeler, oncekiler)
+
+    def mesafe(self, hedef):
+        return self.mesafeler.get(hedef, float('infinity'))
+
+    def yol_sayisi(self, hedef):
+        #Eşit maliyetli yol sayısı: bir düğümün sayısı önceki düğümlerinin sayılarının toplamıdır
+        if hedef not in self.mesafeler:
+            return 0
+        sayilar = self._sayilar
+        #Özyineleme yerine yığınla, önce önceki düğümlerin sayılarını hesaplıyoruz
+        yigin = [hedef]
+        while yigin:
+            dugum = yigin[-1]
+            if dugum in sayilar:
+                yigin.pop()
+                continue
+            eksikler = [p for p in self.oncekiler[dugum] if p not in sayilar]
+            if eksikler:
+                yigin.extend(eksikler)
+            else:
+                sayilar[dugum] = sum(sayilar[p] for p in self.oncekiler[dugum])
+                yigin.pop()
+        return sayilar[hedef]
+
+    def yollar(self, hedef):
+        """
+        Hedefe giden eşit maliyetli yolları tek tek üretir (generator); hepsi bellekte tutulmaz.
+        Yalnızca ilk birkaç yol gerekiyorsa itertools.islice ile kesilebilir.
+        """
+        if hedef not in self.mesafeler:
+            return
+        #Yığında (düğüm, hedeften o düğüme kadar olan ters yol) tutulur
+        yigin = [(hedef, [hedef])]
+        while yigin:
+            dugum, ters_yol = yigin.pop()
+            if dugum == self.kaynak:
+                yield ters_yol[::-1]
+                continue
+            for onceki in reversed(self.oncekiler[dugum]):
+                yigin.append((onceki, ters_yol + [onceki]))
+
+    def sonraki_atlamalar(self, hedef):
+        #Kaynağın hedefe giden eşit maliyetli yollardaki ilk adımları (yönlendirme tablosundaki ECMP kümesi)
+        if hedef not in self.mesafeler or hedef == self.kaynak:
+            return []
+        atlamalar = []
+        gorulen = {hedef}
+        yigin = [hedef]
+        while yigin:
+            dugum = yigin.pop()
+            for onceki in self.oncekiler[dugum]:
+                if onceki == self.kaynak:
+                    if dugum not in atlamalar:
+                        atlamalar.append(dugum)
+                elif onceki not in gorulen:
+                    gorulen.add(onceki)
+                    yigin.append(onceki)
+        return atlamalar
+
+
+def _hedefe_mesafeler(graph, hedef, maliyet):
+    #Hedefe doğru en kısa yol ağacı: her düğümün hedefe kalan mesafesi ve hedefe giden sonraki adımı
+    ters = graph.reverse(copy=False) if graph.is_directed() else graph
+    mesafeler = {hedef: 0}
+    sonraki = {hedef: None}
+    kesinlesen = set()
+    pq = [(0, hedef)]
+    while pq:
+        mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+        if mevcut_dugum in kesinlesen: continue
+        kesinlesen.add(mevcut_dugum)
+        for komsu, ozellikler in ters[mevcut_dugum].items():
+            yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+            if yeni_mesafe < mesafeler.get(komsu, float('infinity')):
+                mesafeler[komsu] = yeni_mesafe
+                sonraki[komsu] = mevcut_dugum
+                heapq.heappush(pq, (yeni_mesafe, komsu))
+    return mesafeler, sonraki
+
+
+def _sapma_yolu(graph, baslangic, hedef, kalan, yasak_dugumler, yasak_kenarlar, maliyet):
+    """
+    Yasaklı düğüm ve kenarlardan kaçınan sapma (spur) yolu. Hedefe kalan gerçek mesafeler A* sezgiseli olarak
+    kullanılır: yasaklar mesafeleri sadece uzatabildiği için tahmin hala geçerlidir ve yasak yoksa arama
+    doğrudan ağaçtaki yolu izler; çoğu sapma aramasında sadece birkaç düğüm genişletilir.
+    """
+    sonsuz = float('infinity')
+    mesafeler = {baslangic: 0}
+    onceki = {baslangic: None}
+    kesinlesen = set()
+    pq = [(kalan.get(baslangic, sonsuz), 0, baslangic)]
+    while pq:
+        tahmin, mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+        if tahmin == sonsuz: break
+        if mevcut_dugum in kesinlesen: continue
+        kesinlesen.add(mevcut_dugum)
+        if mevcut_dugum == hedef: break
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            if komsu in yasak_dugumler or (mevcut_dugum, komsu) in yasak_kenarlar:
+                continue
+            yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+            if yeni_mesafe < mesafeler.get(komsu, sonsuz):
+                mesafeler[komsu] = yeni_mesafe
+                onceki[komsu] = mevcut_dugum
+                heapq.heappush(pq, (yeni_mesafe + kalan.get(komsu, sonsuz), yeni_mesafe, komsu))
+
+    if hedef not in kesinlesen:
+        return None, sonsuz
+    yol = []
+    adim = hedef
+    while adim is not None:
+        yol.append(adim)
+        adim = onceki[adim]
+    yol.reverse()
+    return yol, mesafeler[hedef]
+
+
+def en_kisa_yollar(graph, baslangic, hedef, maliyet=mesafe_maliyeti):
+    """
+    Yen algoritmasıyla döngüsüz yolları artan maliyet sırasıyla üretir (generator): (yol, maliyet).
+    Hedefe doğru en kısa yol ağacı bir kez kurulur; ilk yol bu ağaçtan okunur ve her sapma araması
+    tam Dijkstra yerine ağaç mesafeleriyle yönlendirilmiş A* olarak yapılır.
+    """
+    kalan, sonraki = _hedefe_mesafeler(graph, hedef, maliyet)
+    if baslangic not in kalan:
+        return
+
+    yol = [baslangic]
+    while yol[-1] != hedef:
+        yol.append(sonraki[yol[-1]])
+    bulunanlar = [yol]
+    #Her bulunan yolun kenar maliyetlerinin önek toplamları (kök yolların maliyeti için)
+    onekler = [_onek_toplamlari(graph, yol, maliyet)]
+    adaylar = []
+    gorulen = {tuple(yol)}
+    sayac = 0
+    yield yol, onekler[0][-1]
+
+    while True:
+        son_yol, son_onek = bulunanlar[-1], onekler[-1]
+        for i in range(len(son_yol) - 1):
+            sapma_dugumu = son_yol[i]
+            kok = son_yol[:i + 1]
+            #Aynı kökü paylaşan bulunmuş yolların kökten sonraki kenarları yasaklanır
+            yasak_kenarlar = {(p[i], p[i + 1]) for p in bulunanlar if len(p) > i + 1 and p[:i + 1] == kok}
+            yasak_dugumler = set(kok[:-1])
+            sapma, sapma_maliyeti = _sapma_yolu(graph, sapma_dugumu, hedef, kalan, yasak_dugumler,
+                                                yasak_kenarlar, maliyet)
+            if sapma is None:
+                continue
+            aday = kok[:-1] + sapma
+            anahtar = tuple(aday)
+            if anahtar in gorulen:
+                continue
+            gorulen.add(anahtar)
+            sayac += 1
+            #Eşit maliyetlerde düğümler karşılaştırılmasın diye sayaç ikinci anahtardır
+            heapq.heappush(adaylar, (son_onek[i] + sapma_maliyeti, sayac, aday))
+
+        if not adaylar:
+            return
+        toplam, _, yol = heapq.heappop(adaylar)
+        bulunanlar.append(yol)
+        onekler.append(_onek_toplamlari(graph, yol, maliyet))
+        yield yol, toplam
+
+
+def _onek_toplamlari(graph, yol, maliyet):
+    toplamlar = [0]
+    for u, v in zip(yol, yol[1:]):
+        toplamlar.append(toplamlar[-1] + maliyet(graph[u][v]))
+    return toplamlar
+
+
+def k_en_kisa_yollar(graph, baslangic, hedef, k, maliyet=mesafe_maliyeti):
+    #En fazla k döngüsüz yol: [(yol, maliyet), ...]; ağda daha az yol varsa hepsi döner
+    yollar = []
+    for yol, toplam in en_kisa_yollar(graph, baslangic, hedef, maliyet):
+        yollar.append((yol, toplam))
+        if len(yollar) >= k:
+            break
+    return yollar
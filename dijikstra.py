@@ -1,20 +1,146 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 import heapq #Öncelik kuyruğu Dijkstra algoritmasının kalbidir
+import numpy as np
+from kompakt_graf import KompaktGraf, KompaktDijkstra
+from rota_onbellegi import EnKisaYolAgaci, RotaOnbellegi
+from tum_ciftler import yonlendirme_tablolari_hesapla
+from cift_yonlu_dijkstra import cift_yonlu_dijkstra, mesafe_maliyeti
+from toplu_sorgu import toplu_rota
+from kisaltma_hiyerarsisi import KisaltmaHiyerarsisi
+from izleme import izlemeli_dijkstra
+from cok_yollu import EsitMaliyetliYollar, k_en_kisa_yollar
+from oncelik_kuyrugu import KUYRUKLAR, agirlik_bilgisi, kuyruk_sec, kuyruklu_dijkstra
+from ikili_topoloji import graf_kaydet, nx_yukle, yukle
+from baglanti_durumu import olay_senaryosu
 
 class AgSimulasyonu:
     def __init__(self):
         #NetworkX kütüphanesini kullanarak boş bir ağ yapısı oluşturuyoruz
         self.graph = nx.Graph()
+        #Dizi tabanlı motor ilk ihtiyaç anında kurulur
+        self._kompakt_motor = None
+        self._kompakt_kaynagi = None
+        #Kısaltma hiyerarşisi pahalı bir ön işlemedir, topoloji değişene kadar saklanır
+        self._kisaltma_hiyerarsisi = None
+
+        #Aynı kaynaklardan tekrar tekrar gelen sorgular için en kısa yol ağaçlarını saklıyoruz
+        self.topoloji_surumu = 0
+        self.rota_onbellegi = RotaOnbellegi()
 
     def baglanti_ekle(self, u, v, agirlik):
         #İki yönlendirici (router) arasına belirtilen gecikme süresiyle kablo çekiyoruz
         self.graph.add_edge(u, v, weight=agirlik)
+        #Topoloji değiştiği için dondurulmuş kopya ve saklanan rotalar artık geçersiz
+        self._topoloji_degisti()
+
+    def _topoloji_degisti(self):
+        self._kompakt_motor = None
+        self._kisaltma_hiyerarsisi = None
+        self.topoloji_surumu += 1
+        self.rota_onbellegi.gecersiz_kil()
+
+    def kompakt_motor(self):
+        #Grafın CSR kopyasını ve onu kullanan Dijkstra motorunu bir kez kurup saklıyoruz
+        #graph özelliği dışarıdan yenisiyle değiştirildiyse kopyayı baştan kuruyoruz
+        if self._kompakt_kaynagi is not self.graph:
+            self._topoloji_degisti()
+        if self._kompakt_motor is None:
+            self._kompakt_motor = KompaktDijkstra(KompaktGraf.graftan(self.graph))
+            self._kompakt_kaynagi = self.graph
+        return self._kompakt_motor
+
+    def topoloji_kaydet(self, dosya_yolu):
+        #Ağı ikili topoloji dosyasına yazar, servisler açılışta bu dosyayı diske eşleyerek yükler
+        graf_kaydet(self.graph, dosya_yolu)
+
+    def topoloji_yukle(self, dosya_yolu, dogrula=True):
+        """
+        topoloji_kaydet ile yazılmış ağı yükler. Dizi tabanlı motor doğrudan diske eşlenmiş (np.memmap)
+        dizilerle kurulur; aynı dosyayı açan işçi süreçler bu sayfaları paylaşır.
+        """
+        self.graph = nx_yukle(dosya_yolu, dogrula)
+        self._topoloji_degisti()
+        #Sağlama toplamı yukarıda bir kez kontrol edildi
+        self._kompakt_motor = KompaktDijkstra(yukle(dosya_yolu, dogrula=False))
+        self._kompakt_kaynagi = self.graph
+
+    def rota_tablosu(self, kaynak):
+        #Kaynağın tüm hedeflere en kısa yol ağacını önbellekten verir, yoksa bir kez hesaplayıp saklar
+        motor = self.kompakt_motor()
+        anahtar = (kaynak, 'mesafe', self.topoloji_surumu)
+        agac = self.rota_onbellegi.getir(anahtar)
+        if agac is None:
+            mesafeler, onceki = motor.agac_hesapla(motor.graf.indeks[kaynak], motor.graf.maliyet_listesi())
+            tam_sayi = np.issubdtype(motor.graf.agirliklar.dtype, np.integer)
+            agac = EnKisaYolAgaci(motor.graf, kaynak, mesafeler, onceki, tam_sayi)
+            self.rota_onbellegi.ekle(anahtar, agac)
+        return agac
+
+    def yonlendirme_tablolari(self, isci_sayisi=None, cikti_dizini=None):
+        """
+        Link-state yönlendiricilerin yaptığı gibi her router için tam yönlendirme tablosunu üretir.
+        Her kaynak için bir Dijkstra geçişi yapılır ve kaynaklar işçi süreçlere paylaştırılır.
+        cikti_dizini verilirse tablolar diske akıtılır, bellek kullanımı sınırlı kalır.
+        """
+        graf = self.kompakt_motor().graf
+        return yonlendirme_tablolari_hesapla(graf, graf.agirliklar, isci_sayisi, cikti_dizini)
+
+    def toplu_dijkstra(self, ciftler, isci_sayisi=1):
+        """
+        Trafik matrisi gibi büyük (kaynak, hedef) sorgu gruplarını toplu çözer.
+        Aynı kaynaktan gelen bütün çiftler tek bir aramayla cevaplanır ve sonuçlar giriş sırasıyla
+        (yol, maliyet) olarak akıtılır. isci_sayisi > 1 ise kaynak grupları süreçlere dağıtılır.
+        """
+        graf = self.kompakt_motor().graf
+        return toplu_rota(graf, graf.maliyet_listesi(), ciftler, isci_sayisi)
+
+    def kisaltma_hiyerarsisi(self, dosya_yolu=None):
+        """
+        Noktadan noktaya sorgular için Contraction Hierarchies ön işlemesini yapar ve saklar.
+        dosya_yolu verilirse hazır hiyerarşi oradan yüklenir (KisaltmaHiyerarsisi.kaydet ile yazılmış olmalı).
+        """
+        graf = self.kompakt_motor().graf
+        if dosya_yolu is not None:
+            self._kisaltma_hiyerarsisi = KisaltmaHiyerarsisi.yukle(dosya_yolu)
+        elif self._kisaltma_hiyerarsisi is None:
+            self._kisaltma_hiyerarsisi = KisaltmaHiyerarsisi.olustur(graf)
+        return self._kisaltma_hiyerarsisi
+
+    def hiyerarsik_dijkstra(self, baslangic_dugumu, hedef_dugumu):
+        #Dönüş değeri dijkstra_kendi_kodumuz ile aynıdır, ilk çağrıda hiyerarşi kurulur
+        return self.kisaltma_hiyerarsisi().en_kisa_yol(baslangic_dugumu, hedef_dugumu)
+
+    def kuyruk_turu(self):
+        #Ağırlıklar küçük tam sayılarsa Dial kovaları, değilse heapq (bkz. oncelik_kuyrugu.kuyruk_sec)
+        #Ağırlıklar graph üzerinde yerinde değişebildiği için sonuç saklanmaz, her çağrıda yeniden bakılır
+        tam_sayi, en_buyuk = agirlik_bilgisi(self.graph)
+        return kuyruk_sec(tam_sayi, en_buyuk, self.graph.number_of_nodes())
 
-    def dijkstra_kendi_kodumuz(self, baslangic_dugumu, hedef_dugumu):
+    def dijkstra_kendi_kodumuz(self, baslangic_dugumu, hedef_dugumu, kompakt=False, onbellek=False, izleme=None,
+                               kuyruk='heapq'):
         """
         Dijkstra Algoritmasının Adım Adım Uygulanması
+        kompakt=True verilirse aynı hesap dizi tabanlı (CSR) motor üzerinde yapılır.
+        onbellek=True verilirse sonuç kaynağın saklanan en kısa yol ağacından okunur.
+        izleme (Izleme) verilirse kuyruk/gevşetme sayaçları ve aşama süreleri ona yazılır.
+        kuyruk: 'heapq', 'otomatik' (ağırlık türüne göre), 'indeksli' (decrease-key), 'dial' ya da 'radix'.
         """
+        if onbellek:
+            return self.rota_tablosu(baslangic_dugumu).yol(hedef_dugumu)
+
+        if kompakt:
+            motor = self.kompakt_motor()
+            return motor.en_kisa_yol(baslangic_dugumu, hedef_dugumu, motor.graf.maliyet_listesi(), izleme)
+
+        if izleme is not None:
+            return self._izlemeli_dijkstra(baslangic_dugumu, hedef_dugumu, izleme)
+
+        if kuyruk == 'otomatik':
+            kuyruk = self.kuyruk_turu()
+        if kuyruk != 'heapq':
+            return self._kuyruklu_dijkstra(baslangic_dugumu, hedef_dugumu, kuyruk)
+
         #BAŞLANGIÇ AYARLARI
         #Başlangıçta tüm düğümlere olan mesafeyi sonsuz kabul ediyoruz
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
@@ -62,6 +188,61 @@ class AgSimulasyonu:
             
         return yol, mesafeler[hedef_dugumu]
 
+    def _kuyruklu_dijkstra(self, baslangic_dugumu, hedef_dugumu, kuyruk):
+        #Kova kuyrukları negatif olmayan tam sayı anahtar ister; Dial ayrıca en büyük ağırlığı bilmelidir
+        if kuyruk not in KUYRUKLAR:
+            raise ValueError(f"Bilinmeyen kuyruk: {kuyruk}")
+        en_buyuk = None
+        if kuyruk in ('dial', 'radix'):
+            #Kova sayısı o anki en büyük ağırlıktan kurulur; eski bir değer anahtarların taşmasına yol açar
+            en_buyuk = agirlik_bilgisi(self.graph)[1]
+            if en_buyuk is None:
+                raise ValueError(f"{kuyruk} kuyruğu negatif olmayan tam sayı ağırlık gerektirir")
+        mesafeler, onceki_dugum = kuyruklu_dijkstra(self.graph, baslangic_dugumu, hedef_dugumu,
+                                                     KUYRUKLAR[kuyruk](en_buyuk))
+        yol = []
+        adim = hedef_dugumu
+        while adim is not None:
+            yol.insert(0, adim)
+            adim = onceki_dugum[adim]
+        return yol, mesafeler[hedef_dugumu]
+
+    def _izlemeli_dijkstra(self, baslangic_dugumu, hedef_dugumu, izleme):
+        #Sayaçlı döngü ayrı tutulur, böylece izleme kapalıyken yukarıdaki döngüye hiçbir ek iş gelmez
+        mesafeler, onceki_dugum = izlemeli_dijkstra(self.graph, baslangic_dugumu, hedef_dugumu, mesafe_maliyeti, izleme)
+        with izleme.asama('rota'):
+            yol = []
+            adim = hedef_dugumu
+            while adim is not None:
+                yol.insert(0, adim)
+                adim = onceki_dugum[adim]
+        return yol, mesafeler[hedef_dugumu]
+
+    def cift_yonlu_dijkstra(self, baslangic_dugumu, hedef_dugumu):
+        #Aramayı iki uçtan başlatıp ortada buluşturur, noktadan noktaya sorgularda çok daha az düğüm gezer
+        yol, maliyet, _ = cift_yonlu_dijkstra(self.graph, baslangic_dugumu, hedef_dugumu)
+        return yol, maliyet
+
+    def ecmp_dijkstra(self, baslangic_dugumu, hedef_dugumu=None):
+        """
+        Eşit maliyetli bütün yolları koruyan Dijkstra (ECMP). Dönen DAG ile yol_sayisi(hedef),
+        yollar(hedef) ve sonraki_atlamalar(hedef) sorgulanır; hedef verilirse arama onda durur.
+        """
+        return EsitMaliyetliYollar.hesapla(self.graph, baslangic_dugumu, hedef_dugumu)
+
+    def k_en_kisa_yollar(self, baslangic_dugumu, hedef_dugumu, k=3):
+        #Yedek rotalar: en fazla k döngüsüz yol, artan maliyet sırasıyla [(yol, maliyet), ...]
+        return k_en_kisa_yollar(self.graph, baslangic_dugumu, hedef_dugumu, k)
+
+    def baglanti_durumu_simulasyonu(self, olaylar, **ayarlar):
+        """
+        OSPF benzeri simülasyon: her router LSA yayar, kendi LSDB'sini tutar ve SPF'i artımlı Dijkstra ile yapar.
+        olaylar: [('kopar', u, v), ('onar', u, v), ('maliyet', u, v, yeni_maliyet), ...]
+        ayarlar: artimli, spf_kisitlama, lsa_kisitlama, gecikme... (bkz. BaglantiDurumuSimulasyonu)
+        Dönüş: {'ilk': ..., 'olaylar': [(olay, ölçümler), ...], 'simulasyon': ...}
+        """
+        return olay_senaryosu(self.graph, olaylar, **ayarlar)
+
     def agi_ciz(self, bulunan_yol=None):
         #Grafiğin ekranda düzgün görünmesi için yaylı yerleşim algoritması kullanıyoruz
         pos = nx.spring_layout(self.graph, seed=42) 
@@ -0,0 +1,188 @@
+import heapq
+from kompakt_graf import KompaktDijkstra
+
+class DinamikEnKisaYolAgaci:
+    """
+    Kenar maliyetleri değiştikçe kendini onaran tek kaynaklı en kısa yol ağacı.
+    Ramalingam-Reps yaklaşımındaki gibi bir değişiklikten sonra sadece etkilenen alt ağaç yeniden hesaplanır.
+    """
+    def __init__(self, graf, kaynak, maliyet_modeli=None, maliyetler=None):
+        self.graf = graf
+        self.kaynak = graf.indeks[kaynak]
+        self.maliyet_modeli = maliyet_modeli
+
+        #Maliyet listesi graf ile ortaktır, kenar_guncelle çağrısı onu yerinde düzeltir
+        #maliyetler verilirse ağaç o listeyi kullanır (aynı topolojiye farklı gözlerden bakan yönlendiriciler için)
+        self.maliyetler = graf.maliyet_listesi(maliyet_modeli) if maliyetler is None else maliyetler
+
+        #Başlangıçta ağacı bir kez klasik Dijkstra ile kuruyoruz
+        self._yeniden_kur()
+
+        #Son onarımın kaç düğüme dokunduğunu tutuyoruz
+        self.son_dokunulan = 0
+
+    def _yeniden_kur(self):
+        motor = KompaktDijkstra(self.graf)
+        motor.calistir(self.kaynak, self.maliyetler)
+        self.mesafeler = list(motor.mesafeler)
+        self.onceki = list(motor.onceki)
+        return self.graf.dugum_sayisi
+
+    def kenar_maliyeti(self, u, v):
+        return self.maliyetler[self.graf.kenar_konumu(u, v)]
+
+    def kenar_guncellendi(self, u, v, eski_maliyet):
+        """
+        u-v kablosunun maliyeti eski_maliyet'ten bugünkü değerine değiştikten sonra çağrılır.
+        Ağacı onarır ve mesafesi ya da önceki düğümü yeniden hesaplanan düğüm sayısını döndürür.
+        """
+        yeni_maliyet = self.kenar_maliyeti(u, v)
+        if yeni_maliyet < eski_maliyet:
+            dokunulan = self._azalma(u, v, yeni_maliyet)
+        elif yeni_maliyet > eski_maliyet:
+            dokunulan = self._artis(u, v)
+        else:
+            dokunulan = 0
+        self.son_dokunulan = dokunulan
+        return dokunulan
+
+    def _azalma(self, u, v, maliyet):
+        #Kablo ucuzladıysa sadece bu kablo üzerinden kısalan düğümlerden dalga yayılır
+        mesafeler = self.mesafeler
+        pq = []
+        for a, b in ((u, v), (v, u)):
+            yeni_mesafe = mesafeler[a] + maliyet
+            if yeni_mesafe < mesafeler[b]:
+                mesafeler[b] = yeni_mesafe
+                self.onceki[b] = a
+                heapq.heappush(pq, (yeni_mesafe, b))
+        return self._yay(pq, set())
+
+    def _artis(self, u, v):
+        #Ağaçta olmayan bir kablo pahalılaştıysa hiçbir en kısa yol değişmez
+        if self.onceki[v] == u:
+            kok = v
+        elif self.onceki[u] == v:
+            kok = u
+        else:
+            return 0
+        etkilenen = self._alt_agac([kok])
+        etkilenen_kume = set(etkilenen)
+        pq = self._sinirdan_tahmin(etkilenen, etkilenen_kume)
+        #Alt ağacın içinde Dijkstra ile düzeltmeyi yayıyoruz
+        return self._yay(pq, etkilenen_kume)
+
+    def kenarlar_guncellendi(self, degisimler):
+        """
+        Bir partide birden fazla kablonun maliyeti değiştikten sonra ağacı tek seferde onarır.
+        degisimler: (u, v, eski_maliyet) listesi. Pahalılaşan ağaç kablolarının alt ağaçları birlikte
+        sıfırlanır, ucuzlayan kablolar kuyruğa eklenir ve tek bir Dijkstra dalgası yayılır.
+        """
+        onceki = self.onceki
+        kokler = []
+        azalanlar = []
+        for u, v, eski_maliyet in degisimler:
+            yeni_maliyet = self.kenar_maliyeti(u, v)
+            if yeni_maliyet < eski_maliyet:
+                azalanlar.append((u, v, yeni_maliyet))
+            elif yeni_maliyet > eski_maliyet:
+                if onceki[v] == u:
+                    kokler.append(v)
+                elif onceki[u] == v:
+                    kokler.append(u)
+
+        #Onarım düğüm başına sıfırdan Dijkstra'dan birkaç kat pahalıdır; değişiklikler ağacın
+        #dörtte birinden fazlasını etkiliyorsa ağacı baştan kurmak daha ucuzdur
+        etkilenen = self._alt_agac(kokler, sinir=self.graf.dugum_sayisi // 4)
+        if etkilenen is None:
+            self.son_dokunulan = self._yeniden_kur()
+            return self.son_dokunulan
+
+        etkilenen_kume = set(etkilenen)
+        pq = self._sinirdan_tahmin(etkilenen, etkilenen_kume)
+        mesafeler = self.mesafeler
+        for u, v, maliyet in azalanlar:
+            for a, b in ((u, v), (v, u)):
+                yeni_mesafe = mesafeler[a] + maliyet
+                if yeni_mesafe < mesafeler[b]:
+                    mesafeler[b] = yeni_mesafe
+                    onceki[b] = a
+                    heapq.heappush(pq, (yeni_mesafe, b))
+        self.son_dokunulan = self._yay(pq, etkilenen_kume)
+        return self.son_dokunulan
+
+    def _alt_agac(self, kokler, sinir=None):
+        #1. ETKİLENEN ALT AĞAÇ
+        #Bir düğümün çocukları komşuları arasındadır, bu yüzden alt ağacı sadece onun kenarlarını gezerek buluyoruz
+        #sinir verilirse alt ağaç bu boyu aştığı anda aramayı bırakıp None döndürüyoruz
+        ofsetler, komsular = self.graf.listeler()
+        onceki = self.onceki
+        etkilenen_kume = set(kokler)
+        etkilenen = list(etkilenen_kume)
+        for x in etkilenen:
+            for i in range(ofsetler[x], ofsetler[x + 1]):
+                y = komsular[i]
+                if onceki[y] == x and y not in etkilenen_kume:
+                    etkilenen_kume.add(y)
+                    etkilenen.append(y)
+            if sinir is not None and len(etkilenen) > sinir:
+                return None
+        return etkilenen
+
+    def _sinirdan_tahmin(self, etkilenen, etkilenen_kume):
+        ofsetler, komsular = self.graf.listeler()
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        maliyetler = self.maliyetler
+        sonsuz = float('infinity')
+
+        #2. SINIRDAN YENİ TAHMİNLER
+        #Alt ağaç dışındaki mesafeler hala doğrudur, etkilenen her düğüm için en iyi dış komşuyu seçiyoruz
+        for x in etkilenen:
+            mesafeler[x] = sonsuz
+            onceki[x] = -1
+        pq = []
+        for x in etkilenen:
+            for i in range(ofsetler[x], ofsetler[x + 1]):
+                y = komsular[i]
+                if y in etkilenen_kume:
+                    continue
+                yeni_mesafe = mesafeler[y] + maliyetler[i]
+                if yeni_mesafe < mesafeler[x]:
+                    mesafeler[x] = yeni_mesafe
+                    onceki[x] = y
+            if mesafeler[x] != sonsuz:
+                heapq.heappush(pq, (mesafeler[x], x))
+        return pq
+
+    def _yay(self, pq, dokunulan):
+        ofsetler, komsular = self.graf.listeler()
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        maliyetler = self.maliyetler
+
+        while pq:
+            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_mesafe > mesafeler[mevcut_dugum]: continue
+            dokunulan.add(mevcut_dugum)
+
+            for i in range(ofsetler[mevcut_dugum], ofsetler[mevcut_dugum + 1]):
+                komsu = komsular[i]
+                yeni_mesafe = mevcut_mesafe + maliyetler[i]
+                if yeni_mesafe < mesafeler[komsu]:
+                    mesafeler[komsu] = yeni_mesafe
+                    onceki[komsu] = mevcut_dugum
+                    heapq.heappush(pq, (yeni_mesafe, komsu))
+        return len(dokunulan)
+
+    def yol(self, hedef):
+        #Dönüş değeri modifiye_dijkstra ile aynıdır: (rota, toplam maliyet)
+        etiketler = self.graf.etiketler
+        hedef_id = self.graf.indeks[hedef]
+        yol = []
+        adim = hedef_id
+        while adim != -1:
+            yol.append(etiketler[adim])
+            adim = self.onceki[adim]
+        yol.reverse()
+        return yol, self.mesafeler[hedef_id]
@@ -0,0 +1,200 @@
+import json
+import mmap
+import struct
+import zlib
+import networkx as nx
+import numpy as np
+from kompakt_graf import KompaktGraf, etiket_coz, etiket_kodla
+
+#Dosya düzeni (hepsi little-endian, her bölüm 64 bayta hizalı):
+#  başlık | etiketler (JSON) | ofsetler int64[n+1] | komsular int32[m] | agirliklar int64/float64[m]
+#        | trafikler float64[m] | trafik_var uint8[m] | düğüm özellikleri (JSON, boş olabilir)
+#m, CSR kayıt sayısıdır (yönsüz ağda her kablo iki kez yazılır)
+#Sürüm 2 başlığa yön bayrağını ve özellik bölümünün boyunu ekler; sürüm 1 dosyaları yönsüz ve özelliksiz okunur
+SIHIRLI = b'YTOPOLOJ'
+SURUM = 2
+_BASLIK = struct.Struct('<8sHHIQQQIQ')
+_BASLIK_BOYU = 64
+_HIZALAMA = 64
+
+_AGIRLIK_TURLERI = {0: np.dtype('<i8'), 1: np.dtype('<f8')}
+_YONLU = 1
+
+
+class TopolojiDosyasiHatasi(ValueError):
+    """Dosya bu biçimde değil, sürümü desteklenmiyor ya da sağlama toplamı tutmuyor."""
+
+
+def _hizala(konum):
+    return (konum + _HIZALAMA - 1) // _HIZALAMA * _HIZALAMA
+
+
+def _deger_kodla(deger):
+    #Düğüm konumları NumPy dizisi olarak da gelebilir (ör. nx.spring_layout), türü korunarak yazılır
+    if isinstance(deger, np.ndarray):
+        return {'dizi': deger.tolist()}
+    return etiket_kodla(deger)
+
+
+def _deger_coz(kod):
+    if isinstance(kod, dict) and 'dizi' in kod:
+        return np.array(kod['dizi'])
+    return etiket_coz(kod)
+
+
+def _bolumler(dugum_sayisi, kayit_sayisi, etiket_bayt, agirlik_turu, ozellik_bayt=0):
+    #Bölümlerin dosyadaki başlangıç konumları sadece sayılardan hesaplanır, ayrıca saklanmaz
+    boylar = [
+        ('etiketler', etiket_bayt),
+        ('ofsetler', 8 * (dugum_sayisi + 1)),
+        ('komsular', 4 * kayit_sayisi),
+        ('agirliklar', agirlik_turu.itemsize * kayit_sayisi),
+        ('trafikler', 8 * kayit_sayisi),
+        ('trafik_var', kayit_sayisi),
+        #Sonda durduğu için boş olduğunda sürüm 1 düzeniyle birebir aynıdır
+        ('ozellikler', ozellik_bayt),
+    ]
+    konumlar = {}
+    konum = _BASLIK_BOYU
+    for ad, boy in boylar:
+        konumlar[ad] = (konum, boy)
+        konum = _hizala(konum + boy)
+    return konumlar, konum
+
+
+def kaydet(graf, dosya_yolu, trafik_var=None, yonlu=False, dugum_ozellikleri=None):
+    """
+    KompaktGraf'ı ikili topoloji dosyasına yazar.
+    trafik_var: hangi CSR kayıtlarında trafik bilgisinin gerçekten bulunduğu (verilmezse hepsinde var sayılır).
+    yonlu: CSR kayıtları tek yönlü bağlantılarsa True.
+    dugum_ozellikleri: etiketlerle aynı sırada, düğüm başına özellik sözlükleri (ör. {'pos': (x, y)}).
+    """
+    n, m = graf.dugum_sayisi, len(graf.komsular)
+    tam_sayi = np.issubdtype(graf.agirliklar.dtype, np.integer)
+    agirlik_turu = _AGIRLIK_TURLERI[0 if tam_sayi else 1]
+    diziler = {
+        'etiketler': json.dumps([etiket_kodla(e) for e in graf.etiketler], ensure_ascii=False).encode('utf-8'),
+        'ofsetler': np.ascontiguousarray(graf.ofsetler, dtype='<i8'),
+        'komsular': np.ascontiguousarray(graf.komsular, dtype='<i4'),
+        'agirliklar': np.ascontiguousarray(graf.agirliklar, dtype=agirlik_turu),
+        'trafikler': np.ascontiguousarray(graf.trafikler, dtype='<f8'),
+        'trafik_var': np.ones(m, dtype=np.uint8) if trafik_var is None else np.asarray(trafik_var, dtype=np.uint8),
+        'ozellikler': b'',
+    }
+    if dugum_ozellikleri is not None and any(dugum_ozellikleri):
+        kodlar = [{ad: _deger_kodla(deger) for ad, deger in ozellikler.items()} for ozellikler in dugum_ozellikleri]
+        diziler['ozellikler'] = json.dumps(kodlar, ensure_ascii=False).encode('utf-8')
+    konumlar, toplam = _bolumler(n, m, len(diziler['etiketler']), agirlik_turu, len(diziler['ozellikler']))
+
+    with open(dosya_yolu, 'wb') as dosya:
+        dosya.write(b'\0' * _BASLIK_BOYU)
+        saglama = 0
+        for ad, (konum, _) in konumlar.items():
+            #Hizalama boşlukları da sağlama toplamına dahildir
+            bosluk = b'\0' * (konum - dosya.tell())
+            veri = diziler[ad] if isinstance(diziler[ad], bytes) else diziler[ad].tobytes()
+            saglama = zlib.crc32(veri, zlib.crc32(bosluk, saglama))
+            dosya.write(bosluk)
+            dosya.write(veri)
+        bosluk = b'\0' * (toplam - dosya.tell())
+        saglama = zlib.crc32(bosluk, saglama)
+        dosya.write(bosluk)
+
+        dosya.seek(0)
+        dosya.write(_BASLIK.pack(SIHIRLI, SURUM, 0 if tam_sayi else 1, _YONLU if yonlu else 0, n, m,
+                                 len(diziler['etiketler']), saglama, len(diziler['ozellikler'])))
+
+
+def graf_kaydet(graph, dosya_yolu):
+    """
+    NetworkX ağını (Graph ya da DiGraph) yazar; trafik bilgisi olmayan kablolar yüklemede yine trafiksiz döner.
+    Saklananlar: yön, düğüm özellikleri (JSON'a yazılabilen değerler, demetler ve NumPy dizileri),
+    kenarların 'weight' ve 'traffic' değerleri. Diğer kenar özellikleri ve ağın kendi özellikleri saklanmaz.
+    """
+    if graph.is_multigraph():
+        raise TypeError("Çoklu kenarlı ağlar topoloji dosyasına yazılamaz")
+    graf = KompaktGraf.graftan(graph)
+    trafik_var = [('traffic' in ozellikler) for u in graf.etiketler for ozellikler in graph[u].values()]
+    dugum_ozellikleri = [graph.nodes[u] for u in graf.etiketler]
+    kaydet(graf, dosya_yolu, trafik_var, graph.is_directed(), dugum_ozellikleri)
+
+
+def _oku(dosya_yolu, dogrula, ozellikleri_oku=False):
+    with open(dosya_yolu, 'rb') as dosya:
+        baslik = dosya.read(_BASLIK_BOYU)
+        if len(baslik) < _BASLIK_BOYU:
+            raise TopolojiDosyasiHatasi(f"{dosya_yolu}: başlık eksik")
+        #Sürüm 1 başlığında yeni alanların yeri sıfırla dolu olduğu için aynı yapıyla okunabilir
+        sihirli, surum, agirlik_kodu, bayraklar, n, m, etiket_bayt, saglama, ozellik_bayt = _BASLIK.unpack_from(baslik)
+        if sihirli != SIHIRLI:
+            raise TopolojiDosyasiHatasi(f"{dosya_yolu}: topoloji dosyası değil")
+        if not 1 <= surum <= SURUM:
+            raise TopolojiDosyasiHatasi(f"{dosya_yolu}: desteklenmeyen sürüm {surum}")
+        konumlar, toplam = _bolumler(n, m, etiket_bayt, _AGIRLIK_TURLERI[agirlik_kodu], ozellik_bayt)
+
+        if dogrula:
+            #Sağlama toplamı bütün sayfaları okur; aynı dosyayı açan sonraki süreçler bunu atlayabilir
+            with mmap.mmap(dosya.fileno(), 0, access=mmap.ACCESS_READ) as harita:
+                if len(harita) != toplam:
+                    raise TopolojiDosyasiHatasi(f"{dosya_yolu}: dosya boyu beklenenden farklı")
+                if zlib.crc32(harita[_BASLIK_BOYU:]) != saglama:
+                    raise TopolojiDosyasiHatasi(f"{dosya_yolu}: sağlama toplamı tutmuyor")
+
+        konum, boy = konumlar['etiketler']
+        dosya.seek(konum)
+        etiketler = [etiket_coz(kod) for kod in json.loads(dosya.read(boy).decode('utf-8'))]
+
+        ozellikler = None
+        if ozellikleri_oku and ozellik_bayt:
+            konum, boy = konumlar['ozellikler']
+            dosya.seek(konum)
+            ozellikler = [{ad: _deger_coz(kod) for ad, kod in kodlar.items()}
+                          for kodlar in json.loads(dosya.read(boy).decode('utf-8'))]
+
+    def harita(ad, tur, uzunluk, kip):
+        if uzunluk == 0:
+            return np.zeros(0, dtype=tur)
+        return np.memmap(dosya_yolu, dtype=tur, mode=kip, offset=konumlar[ad][0], shape=(uzunluk,))
+
+    #Topoloji salt okunur açılır; mesafe ve trafik kopyala-yaz (copy-on-write) açılır, böylece
+    #süreçler aynı sayfaları paylaşır ve sadece değiştirdikleri sayfalar kendilerine kopyalanır
+    diziler = {
+        'ofsetler': harita('ofsetler', '<i8', n + 1, 'r'),
+        'komsular': harita('komsular', '<i4', m, 'r'),
+        'agirliklar': harita('agirliklar', _AGIRLIK_TURLERI[agirlik_kodu], m, 'c'),
+        'trafikler': harita('trafikler', '<f8', m, 'c'),
+        'trafik_var': harita('trafik_var', np.uint8, m, 'r'),
+    }
+    return etiketler, diziler, bool(bayraklar & _YONLU), ozellikler
+
+
+def yukle(dosya_yolu, dogrula=True):
+    """
+    İkili topoloji dosyasını np.memmap ile açıp KompaktGraf olarak döndürür.
+    Diziler diske eşlenir, kopyalanmaz; büyük ağlar bile anında sorgulanmaya hazırdır.
+    """
+    etiketler, diziler, _, _ = _oku(dosya_yolu, dogrula)
+    return KompaktGraf(etiketler, diziler['ofsetler'], diziler['komsular'], diziler['agirliklar'], diziler['trafikler'])
+
+
+def nx_yukle(dosya_yolu, dogrula=True):
+    #Dosyadaki ağı graf_kaydet'e verilen NetworkX ağıyla aynı düğüm ve kenar özellikleriyle yeniden kurar
+    etiketler, diziler, yonlu, ozellikler = _oku(dosya_yolu, dogrula, ozellikleri_oku=True)
+    ofsetler = diziler['ofsetler'].tolist()
+    komsular = diziler['komsular'].tolist()
+    agirliklar = diziler['agirliklar'].tolist()
+    trafikler = diziler['trafikler'].tolist()
+    trafik_var = diziler['trafik_var'].tolist()
+
+    G = nx.DiGraph() if yonlu else nx.Graph()
+    G.add_nodes_from(etiketler if ozellikler is None else zip(etiketler, ozellikler))
+    for u in range(len(etiketler)):
+        for i in range(ofsetler[u], ofsetler[u + 1]):
+            v = komsular[i]
+            #Yönsüz ağda her kablo CSR'de iki kez bulunur, sadece u <= v olan kaydı ekliyoruz
+            if yonlu or u <= v:
+                ozellikler = {'weight': agirliklar[i]}
+                if trafik_var[i]:
+                    ozellikler['traffic'] = trafikler[i]
+                G.add_edge(etiketler[u], etiketler[v], **ozellikler)
+    return G
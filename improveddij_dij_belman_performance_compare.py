@@ -1,20 +1,57 @@
 import networkx as nx
-import matplotlib.pyplot as plt
 import heapq
-import time
-import random
+import tracemalloc
+import numpy as np
+import kiyaslama
+import ag_uretici
+from maliyet_modeli import MesafeMaliyeti, TrafikCezaliMaliyet, maliyet_komsulugu
+from yer_isaretleri import YerIsaretleri
+from izleme import Izleme, izlemeli_dijkstra
+from oncelik_kuyrugu import KUYRUKLAR, agirlik_bilgisi, kuyruklu_dijkstra
 
 class AgSimulasyonu:
     def __init__(self):
         #NetworkX kütüphanesi ile boş bir ağ yapısı oluşturuyoruz
         self.graph = nx.Graph()
+        #ALT aramasının yer işareti tabloları ve son sorguda kesinleşen düğüm sayısı
+        self.yer_isaretleri = None
+        self.son_kesinlesen = 0
+        #hazir_maliyet=True ile istenen sabit maliyet kopyaları: model anahtarı -> {u: {v: maliyet}}
+        self._maliyet_komsuluklari = {}
+        self._komsuluk_kaynagi = None
 
     def baglanti_ekle(self, u, v, agirlik, trafik=0):
         #Düğümler arasına hem mesafeyi (ağırlık) hem de trafik verisini ekliyoruz
         self.graph.add_edge(u, v, weight=agirlik, traffic=trafik)
+        self._maliyet_komsuluklari.clear()
+        #Yeni bir kısayol eski tablolardaki alt sınırları aşabilir, tablolar ilk ALT sorgusunda yeniden kurulur
+        self.yer_isaretleri = None
 
-    def dijkstra_kendi_kodumuz(self, baslangic, hedef):
+    def maliyet_komsulugu(self, maliyet_modeli):
+        #Kenar maliyetleri model başına bir kez hesaplanır; graph nesnesi değişirse baştan kurulur
+        #Kenar özellikleri yerinde değiştirilirse bu kopya bunu göremez, maliyet_komsuluklarini_sifirla gerekir
+        if self._komsuluk_kaynagi is not self.graph:
+            self._maliyet_komsuluklari.clear()
+            self._komsuluk_kaynagi = self.graph
+        if maliyet_modeli.anahtar not in self._maliyet_komsuluklari:
+            self._maliyet_komsuluklari[maliyet_modeli.anahtar] = maliyet_komsulugu(self.graph, maliyet_modeli)
+        return self._maliyet_komsuluklari[maliyet_modeli.anahtar]
+
+    def maliyet_komsuluklarini_sifirla(self):
+        #graph.edges[u, v] elle değiştirildiğinde sabit maliyet kopyalarını atar
+        self._maliyet_komsuluklari.clear()
+
+    def dijkstra_kendi_kodumuz(self, baslangic, hedef, izleme=None, kuyruk='heapq', en_buyuk_agirlik=None):
         #Klasik Dijkstra: Sadece fiziksel mesafeyi (weight) baz alır, trafiği görmez
+        #izleme verilirse aynı arama sayaçlı döngüyle yapılır
+        #kuyruk='dial' ya da 'radix' verilirse tam sayı ağırlıklar için kova kuyrukları,
+        #'indeksli' verilirse tembel silme yerine decrease-key yapan indeksli yığın kullanılır
+        if izleme is not None:
+            return izlemeli_dijkstra(self.graph, baslangic, hedef, MesafeMaliyeti().kenar_maliyeti, izleme)[0][hedef]
+        if kuyruk != 'heapq':
+            if kuyruk == 'dial' and en_buyuk_agirlik is None:
+                en_buyuk_agirlik = agirlik_bilgisi(self.graph)[1]
+            return kuyruklu_dijkstra(self.graph, baslangic, hedef, KUYRUKLAR[kuyruk](en_buyuk_agirlik))[0][hedef]
         #Başlangıçta tüm mesafeleri sonsuz yapıyoruz
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
         mesafeler[baslangic] = 0
@@ -43,9 +80,16 @@ class AgSimulasyonu:
                     heapq.heappush(pq, (yeni_mesafe, komsu))
         return mesafeler[hedef]
 
-    def modifiye_dijkstra(self, baslangic, hedef):
+    def modifiye_dijkstra(self, baslangic, hedef, maliyet_modeli=None, izleme=None, kuyruk='heapq', hazir_maliyet=False):
         #Geliştirdiğimiz algoritmamız mesafe ile birlikte trafik yoğunluğunu da hesaba katar
-        CEZA_KATSAYISI = 10.0
+        maliyet_modeli = maliyet_modeli or TrafikCezaliMaliyet()
+        if izleme is not None:
+            return izlemeli_dijkstra(self.graph, baslangic, hedef, maliyet_modeli.kenar_maliyeti, izleme)[0][hedef]
+        if kuyruk != 'heapq':
+            return kuyruklu_dijkstra(self.graph, baslangic, hedef, KUYRUKLAR[kuyruk](),
+                                     maliyet_modeli.kenar_maliyeti)[0][hedef]
+        if hazir_maliyet:
+            return self._hazir_maliyetli_dijkstra(baslangic, hedef, maliyet_modeli)
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
         mesafeler[baslangic] = 0
         pq = [(0, baslangic)]
@@ -56,13 +100,10 @@ class AgSimulasyonu:
             if mevcut_maliyet > mesafeler[mevcut_dugum]: continue
 
             for komsu, ozellikler in self.graph[mevcut_dugum].items():
-                mesafe = ozellikler['weight']
-                #Trafik verisi varsa alıyoruz, yoksa 0 kabul ediyoruz
-                trafik = ozellikler.get('traffic', 0) 
-                
                 #Trafik varsa yolu sanal olarak uzatıp (ceza verip) oradan kaçmasını sağlıyoruz
+                #Trafik verisi olmayan yollarda model trafiği 0 kabul eder
                 #İşlemci burada fazladan matematiksel işlem (çarpma) yapıyor
-                efektif_maliyet = mesafe * (1 + (trafik * CEZA_KATSAYISI))
+                efektif_maliyet = maliyet_modeli.kenar_maliyeti(ozellikler)
                 
                 yeni_maliyet = mevcut_maliyet + efektif_maliyet
                 if yeni_maliyet < mesafeler[komsu]:
@@ -70,77 +111,177 @@ class AgSimulasyonu:
                     heapq.heappush(pq, (yeni_maliyet, komsu))
         return mesafeler[hedef]
 
+    def _hazir_maliyetli_dijkstra(self, baslangic, hedef, maliyet_modeli):
+        #Ceza çarpımı döngüde değil, bütün kenarlar için bir kez yapılmıştır
+        #Kenar verisini yerinde değiştiren kod maliyet_komsuluklarini_sifirla çağırmalıdır
+        komsuluk = self.maliyet_komsulugu(maliyet_modeli)
+        mesafeler = {node: float('infinity') for node in self.graph.nodes}
+        mesafeler[baslangic] = 0
+        pq = [(0, baslangic)]
+
+        while pq:
+            mevcut_maliyet, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_dugum == hedef: break
+            if mevcut_maliyet > mesafeler[mevcut_dugum]: continue
+
+            for komsu, efektif_maliyet in komsuluk[mevcut_dugum].items():
+                yeni_maliyet = mevcut_maliyet + efektif_maliyet
+                if yeni_maliyet < mesafeler[komsu]:
+                    mesafeler[komsu] = yeni_maliyet
+                    heapq.heappush(pq, (yeni_maliyet, komsu))
+        return mesafeler[hedef]
+
+    def yer_isaretlerini_hazirla(self, k=8, secim='en_uzak'):
+        #Koordinatı olmayan rastgele ağlarda A* sezgiseli yer işareti tablolarından üretilir
+        #Ağırlıklar değiştiğinde tablolar yeniden hazırlanmalıdır
+        self.yer_isaretleri = YerIsaretleri.graftan(self.graph, k, secim)
+        return self.yer_isaretleri
+
+    def alt_dijkstra(self, baslangic, hedef):
+        #Dönüş değeri dijkstra_kendi_kodumuz ile aynıdır, kesinleşen düğüm sayısı son_kesinlesen'e yazılır
+        if self.yer_isaretleri is None:
+            self.yer_isaretlerini_hazirla()
+        _, maliyet, self.son_kesinlesen = self.yer_isaretleri.en_kisa_yol(self.graph, baslangic, hedef)
+        return maliyet
+
 #TEST VE PERFORMANS FONKSİYONLARI
-def rastgele_ag_olustur(dugum_sayisi, baglanti_ihtimali=0.3):
+def rastgele_ag_olustur(dugum_sayisi, baglanti_ihtimali=0.3, seed=42, ortalama_derece=None, topoloji='erdos_renyi'):
     #Performans testi için rastgele büyüklükte bir ağ ve trafik verisi üretiyoruz
-    G = nx.erdos_renyi_graph(dugum_sayisi, baglanti_ihtimali, seed=42)
-    
-    for (u, v) in G.edges():
-        G.edges[u, v]['weight'] = random.randint(1, 100)
-        #Gerçekçi olması için her yola 0 ile 1 arasında rastgele trafik atıyoruz
-        G.edges[u, v]['traffic'] = random.uniform(0, 1)
+    #Ağırlık (1-100) ve trafikler (0-1) de tohumlanır, aynı parametreler her seferinde aynı ağı verir
+    #ortalama_derece verilmezse bağlantı ihtimalinden hesaplanır: d = p * (n - 1)
+    #Kenarlar NumPy ile tek seferde üretilir, milyon kenarlı ağlar saniyeler içinde hazırlanır
+    if ortalama_derece is None:
+        ortalama_derece = baglanti_ihtimali * (dugum_sayisi - 1)
+    G = ag_uretici.uret(topoloji, dugum_sayisi, ortalama_derece, seed=seed)
     
     sim = AgSimulasyonu()
     sim.graph = G
     return sim
 
-def performansi_karsilastir():
+#Karşılaştırılan 3 algoritma: fonksiyon(simulasyon, kaynak, hedef)
+ALGORITMALAR = {
+    'Bellman-Ford': lambda sim, s, t: nx.bellman_ford_path_length(sim.graph, s, t),
+    'Klasik Dijkstra': lambda sim, s, t: sim.dijkstra_kendi_kodumuz(s, t),
+    'Geliştirilmiş Dijkstra': lambda sim, s, t: sim.modifiye_dijkstra(s, t),
+}
+
+def simulasyon_kur(graph):
+    sim = AgSimulasyonu()
+    sim.graph = graph
+    return sim
+
+def kuyruk_gecisini_olc(dugum_sayilari=(1000, 10000), en_buyuk_agirliklar=(10, 100, 1000, 10**4, 10**5),
+                        ortalama_derece=8, ornek_sayisi=5, isinma=1, deneme=5, seed=42):
+    """
+    heapq, Dial ve radix kuyruklarını aynı ağda farklı en büyük tam sayı ağırlıklarla (C) ölçer.
+    Her düğüm sayısı için Dial'in heapq'dan yavaşladığı ilk C değerini (geçiş noktası) yazdırır.
+    Dönüş: kiyaslama satırlarıyla aynı biçimde sözlük listesi (aile='C=...').
+    """
+    satirlar = []
+    for dugum_sayisi in dugum_sayilari:
+        gecis = None
+        for en_buyuk in en_buyuk_agirliklar:
+            G = ag_uretici.uret('erdos_renyi', dugum_sayisi, ortalama_derece, seed=seed,
+                                en_buyuk_agirlik=en_buyuk, trafik=False)
+            rng = np.random.default_rng(seed)
+            sim = simulasyon_kur(G)
+            ciftler = kiyaslama.ornek_ciftler(G, ornek_sayisi, rng)
+            medyanlar = {}
+            for kuyruk in KUYRUKLAR:
+                sureler = []
+                for kaynak, hedef in ciftler:
+                    sureler.extend(kiyaslama.olc(
+                        lambda: sim.dijkstra_kendi_kodumuz(kaynak, hedef, kuyruk=kuyruk, en_buyuk_agirlik=en_buyuk),
+                        isinma, deneme))
+                satir = {
+                    'aile': f'C={en_buyuk}',
+                    'kenar_hedefi': G.number_of_edges(),
+                    'dugum_sayisi': dugum_sayisi,
+                    'kenar_sayisi': G.number_of_edges(),
+                    'algoritma': kuyruk,
+                    'seed': seed,
+                    'ornek_sayisi': len(ciftler),
+                    'isinma': isinma,
+                    'deneme': deneme,
+                    'durum': 'tamam',
+                }
+                satir.update(kiyaslama.ozetle(sureler))
+                satirlar.append(satir)
+                medyanlar[kuyruk] = satir['medyan_ns']
+            print(f"n={dugum_sayisi} C={en_buyuk}: " + ", ".join(f"{k} {v / 1e6:.3f} ms" for k, v in medyanlar.items()))
+            if gecis is None and medyanlar['dial'] > medyanlar['heapq']:
+                gecis = en_buyuk
+        print(f"n={dugum_sayisi}: Dial'in heapq'yu geçemediği ilk C = {gecis if gecis is not None else 'yok'}")
+    return satirlar
+
+def yigin_bellegini_olc(dugum_sayilari=(200, 500, 1000), ornek_sayisi=5, isinma=1, deneme=5, seed=42):
+    """
+    Tembel silmeli heapq ile indeksli (decrease-key) yığını yoğun (p=0.3 Erdos-Renyi) ve seyrek
+    (ortalama derece 4) ağlarda karşılaştırır. Her kuyruk için medyan süre ve aramanın tepe bellek
+    kullanımı (tracemalloc), heapq için ayrıca kuyruğun en büyük boyu ve bayat çekme sayısı raporlanır.
+    İki kuyruk da aynı kuyruklu_dijkstra döngüsüyle ölçülür, böylece fark sadece kuyruktan gelir.
+    """
+    satirlar = []
+    for dugum_sayisi in dugum_sayilari:
+        rng = np.random.default_rng(seed)
+        aileler = {
+            'yogun': rastgele_ag_olustur(dugum_sayisi, 0.3, seed).graph,
+            'seyrek': kiyaslama.seyrek_er(2 * dugum_sayisi, rng),
+        }
+        for aile, G in aileler.items():
+            ciftler = kiyaslama.ornek_ciftler(G, ornek_sayisi, rng)
+            izleme = Izleme()
+            for kaynak, hedef in ciftler:
+                izlemeli_dijkstra(G, kaynak, hedef, MesafeMaliyeti().kenar_maliyeti, izleme)
+            for kuyruk in ('heapq', 'indeksli'):
+                sureler = []
+                tepe_bellek = 0
+                for kaynak, hedef in ciftler:
+                    sureler.extend(kiyaslama.olc(lambda: kuyruklu_dijkstra(G, kaynak, hedef, KUYRUKLAR[kuyruk]()),
+                                                 isinma, deneme))
+                    tracemalloc.start()
+                    kuyruklu_dijkstra(G, kaynak, hedef, KUYRUKLAR[kuyruk]())
+                    tepe_bellek = max(tepe_bellek, tracemalloc.get_traced_memory()[1])
+                    tracemalloc.stop()
+                satir = {
+                    'aile': aile,
+                    'dugum_sayisi': G.number_of_nodes(),
+                    'kenar_sayisi': G.number_of_edges(),
+                    'algoritma': kuyruk,
+                    'seed': seed,
+                    'ornek_sayisi': len(ciftler),
+                    'tepe_bellek_bayt': tepe_bellek,
+                    #İndeksli yığında her düğüm en fazla bir kez bulunur, bayat kayıt hiç oluşmaz
+                    'en_buyuk_kuyruk': izleme.en_buyuk_kuyruk if kuyruk == 'heapq' else None,
+                    'bayat_cekme': izleme.bayat_cekme if kuyruk == 'heapq' else 0,
+                }
+                satir.update(kiyaslama.ozetle(sureler))
+                satirlar.append(satir)
+                print(f"{aile} n={G.number_of_nodes()} m={G.number_of_edges()} {kuyruk}: "
+                      f"medyan {satir['medyan_ns'] / 1e6:.3f} ms, tepe bellek {tepe_bellek / 1024:.1f} KiB"
+                      + (f", en büyük kuyruk {izleme.en_buyuk_kuyruk}, bayat çekme {izleme.bayat_cekme}"
+                         if kuyruk == 'heapq' else ""))
+    return satirlar
+
+def performansi_karsilastir(kenar_hedefleri=kiyaslama.VARSAYILAN_KENAR_HEDEFLERI, aileler=None,
+                            json_dosyasi=None, csv_dosyasi=None, ciz=True, **ayarlar):
+    """
+    3 algoritmayı yoğun/seyrek Erdos-Renyi, geometrik, ızgara ve ölçeksiz ağlarda 10^6 kenara kadar ölçer.
+    Her boyutta sabit tohumlu ağ, birden çok (kaynak, hedef) örneği, ısınma turları ve tekrarlı
+    denemeler kullanılır; medyan/p95/IQR raporlanır. Sonuçlar JSON/CSV'ye yazılıp sürümler arasında
+    karşılaştırılabilir, grafik isteğe bağlıdır. ayarlar kiyaslama.kiyasla'ya aktarılır.
+    """
     print("3'lü Performans Testi Başlıyor")
-    
-    #Algoritmaları zorlamak için 20'den 500'e kadar artan düğüm sayıları kullanıyoruz
-    dugum_sayilari = [20, 50, 100, 200, 300, 500] 
-    
-    dijkstra_sureleri = []
-    bellman_ford_sureleri = []
-    modifiye_sureleri = [] 
+    sonuclar = kiyaslama.kiyasla(ALGORITMALAR, simulasyon_kur, aileler, kenar_hedefleri, **ayarlar)
 
-    for n in dugum_sayilari:
-        print(f"{n} Router'lı ağ üzerinde test yapılıyor...")
-        
-        #Her turda yeni ve daha büyük bir ağ oluşturuyoruz
-        sim = rastgele_ag_olustur(n)
-        start_node = 0
-        target_node = n - 1
-        
-        #1. Klasik Dijkstra'nın süresini ölçüyoruz
-        t0 = time.time()
-        try: sim.dijkstra_kendi_kodumuz(start_node, target_node)
-        except: pass
-        t1 = time.time()
-        dijkstra_sureleri.append(t1 - t0)
-
-        #2. Geliştirdiğimiz modifiyeli Dijkstra'nın süresini ölçüyoruz
-        t0 = time.time()
-        try: sim.modifiye_dijkstra(start_node, target_node)
-        except: pass
-        t1 = time.time()
-        modifiye_sureleri.append(t1 - t0)
-
-        #3. Kıyaslama için Bellman-Ford'u da ölçüyoruz
-        t0 = time.time()
-        try: nx.bellman_ford_path_length(sim.graph, start_node, target_node)
-        except: pass
-        t1 = time.time()
-        bellman_ford_sureleri.append(t1 - t0)
-
-    #Test sonuçlarını grafik üzerinde gösteriyoruz
-    plt.figure(figsize=(12, 7))
-    
-    #Bellman-Ford kırmızı ve kesikli çizgiyle gösterdik
-    plt.plot(dugum_sayilari, bellman_ford_sureleri, marker='x', label='Bellman-Ford', color='red', linestyle='--', linewidth=2)
-    #Klasik Dijkstra mavi düz çizgiyle gösterdik
-    plt.plot(dugum_sayilari, dijkstra_sureleri, marker='o', label='Klasik Dijkstra', color='blue', linewidth=2)
-    #Bizim algoritmamız yeşil çizgiyle gösterdik
-    plt.plot(dugum_sayilari, modifiye_sureleri, marker='s', label='Geliştirilmiş Dijkstra', color='green', linestyle='-', linewidth=2, alpha=0.7)
-    
-    plt.title("3 Algoritmanın Performans Karşılaştırması", fontsize=14)
-    plt.xlabel("Ağdaki Router Sayısı (Düğüm)", fontsize=12)
-    plt.ylabel("Hesaplama Süresi (Saniye)", fontsize=12)
-    plt.legend(fontsize=11)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    
-    plt.show()
+    if json_dosyasi:
+        kiyaslama.json_yaz(sonuclar, json_dosyasi)
+    if csv_dosyasi:
+        kiyaslama.csv_yaz(sonuclar, csv_dosyasi)
+    if ciz:
+        kiyaslama.ciz(sonuclar)
     print("Test tamamlandı!")
+    return sonuclar
 
 if __name__ == "__main__":
-    performansi_karsilastir()
\ No newline at end of file
+    performansi_karsilastir(json_dosyasi='performans_sonuclari.json', csv_dosyasi='performans_sonuclari.csv')
\ No newline at end of file
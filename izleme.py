@@ -0,0 +1,147 @@
+import heapq
+import time
+from contextlib import contextmanager
+
+class Izleme:
+    """
+    Bir veya birden fazla algoritma çağrısında yapılan işin sayaçları ve aşama süreleri.
+    Algoritmalara izleme=Izleme() verildiğinde sayaçlı döngü çalışır; verilmezse sayaçsız
+    (orijinal) döngü çalışır ve sıcak döngüye hiçbir ek maliyet gelmez.
+    Aynı nesne birden fazla çağrıya verilirse sayaçlar toplanır, en büyük kuyruk boyu en büyüğü tutar.
+    """
+    SAYACLAR = ('itme', 'cekme', 'bayat_cekme', 'gevsetme', 'basarili_gevsetme', 'tur', 'en_buyuk_kuyruk')
+
+    def __init__(self):
+        self.sifirla()
+
+    def sifirla(self):
+        #itme/cekme: öncelik kuyruğuna ekleme ve kuyruktan çekme
+        #bayat_cekme: daha kısa yolu zaten bulunmuş (eskimiş) kayıtların çekilmesi
+        #gevsetme: kontrol edilen kenar sayısı, basarili_gevsetme: mesafeyi kısaltanlar
+        #tur: Bellman-Ford tur sayısı, en_buyuk_kuyruk: kuyruğun ulaştığı en büyük boy
+        for ad in self.SAYACLAR:
+            setattr(self, ad, 0)
+        #Aşama adı -> toplam süre (nanosaniye)
+        self.asamalar = {}
+
+    def topla(self, itme=0, cekme=0, bayat_cekme=0, gevsetme=0, basarili_gevsetme=0, tur=0, en_buyuk_kuyruk=0):
+        #Sayaçlı döngüler sayıları yerel değişkenlerde tutup çağrı sonunda tek seferde buraya yazar
+        self.itme += itme
+        self.cekme += cekme
+        self.bayat_cekme += bayat_cekme
+        self.gevsetme += gevsetme
+        self.basarili_gevsetme += basarili_gevsetme
+        self.tur += tur
+        self.en_buyuk_kuyruk = max(self.en_buyuk_kuyruk, en_buyuk_kuyruk)
+
+    def sure_ekle(self, asama, sure_ns):
+        self.asamalar[asama] = self.asamalar.get(asama, 0) + sure_ns
+
+    @contextmanager
+    def asama(self, ad):
+        #with izleme.asama('rota'): ... bloğunun süresini ölçer
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.sure_ekle(ad, time.perf_counter_ns() - t0)
+
+    def sozluk(self):
+        sonuc = {ad: getattr(self, ad) for ad in self.SAYACLAR}
+        sonuc['asamalar_ns'] = dict(self.asamalar)
+        return sonuc
+
+    def __repr__(self):
+        sayaclar = ', '.join(f"{ad}={getattr(self, ad)}" for ad in self.SAYACLAR)
+        asamalar = ', '.join(f"{ad}={sure / 1e6:.3f}ms" for ad, sure in self.asamalar.items())
+        return f"Izleme({sayaclar}; {asamalar})"
+
+
+def izlemeli_dijkstra(graph, baslangic, hedef, maliyet, izleme):
+    """
+    Sözlük tabanlı Dijkstra döngülerinin (dijkstra_kendi_kodumuz, klasik/modifiye_dijkstra) sayaçlı sürümü.
+    maliyet(ozellikler) kenar maliyetini verir. Dönüş: (mesafeler, onceki) sözlükleri.
+    Hedef kuyruktan çıktığında arama biter, tıpkı sayaçsız döngülerde olduğu gibi.
+    """
+    t0 = time.perf_counter_ns()
+    mesafeler = {node: float('infinity') for node in graph.nodes}
+    mesafeler[baslangic] = 0
+    onceki = {node: None for node in graph.nodes}
+    pq = [(0, baslangic)]
+    itme, cekme, bayat_cekme, gevsetme, basarili, en_buyuk = 1, 0, 0, 0, 0, 1
+    t1 = time.perf_counter_ns()
+
+    while pq:
+        mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+        cekme += 1
+        if mevcut_dugum == hedef: break
+        if mevcut_mesafe > mesafeler[mevcut_dugum]:
+            bayat_cekme += 1
+            continue
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            gevsetme += 1
+            yeni_mesafe = mevcut_mesafe + maliyet(ozellikler)
+            if yeni_mesafe < mesafeler[komsu]:
+                basarili += 1
+                mesafeler[komsu] = yeni_mesafe
+                onceki[komsu] = mevcut_dugum
+                heapq.heappush(pq, (yeni_mesafe, komsu))
+                itme += 1
+                if len(pq) > en_buyuk:
+                    en_buyuk = len(pq)
+
+    izleme.sure_ekle('hazirlik', t1 - t0)
+    izleme.sure_ekle('arama', time.perf_counter_ns() - t1)
+    izleme.topla(itme, cekme, bayat_cekme, gevsetme, basarili, 0, en_buyuk)
+    return mesafeler, onceki
+
+
+def izlemeli_bellman_ford(graph, baslangic, izleme, agirlik_anahtari='weight'):
+    """
+    Kenar listesi üzerinde tur tur çalışan Bellman-Ford'un sayaçlı sürümü.
+    Yönsüz ağda her kenar iki yönde gevşetilir, dolayısıyla bir kenar iki gevşetme sayılır.
+    Dönüş: (mesafeler, onceki); negatif döngü varsa (None, None).
+    """
+    t0 = time.perf_counter_ns()
+    sonsuz = float('infinity')
+    mesafeler = {node: sonsuz for node in graph.nodes}
+    mesafeler[baslangic] = 0
+    onceki = {node: None for node in graph.nodes}
+    kenarlar = [(u, v, data[agirlik_anahtari]) for u, v, data in graph.edges(data=True)]
+    yonsuz = not graph.is_directed()
+    tur, gevsetme, basarili = 0, 0, 0
+    t1 = time.perf_counter_ns()
+
+    for _ in range(graph.number_of_nodes() - 1):
+        tur += 1
+        degisim_var = False
+        for u, v, agirlik in kenarlar:
+            gevsetme += 1
+            if mesafeler[u] != sonsuz and mesafeler[u] + agirlik < mesafeler[v]:
+                mesafeler[v] = mesafeler[u] + agirlik
+                onceki[v] = u
+                basarili += 1
+                degisim_var = True
+            if yonsuz:
+                gevsetme += 1
+                if mesafeler[v] != sonsuz and mesafeler[v] + agirlik < mesafeler[u]:
+                    mesafeler[u] = mesafeler[v] + agirlik
+                    onceki[u] = v
+                    basarili += 1
+                    degisim_var = True
+        if not degisim_var:
+            break
+    t2 = time.perf_counter_ns()
+
+    #NEGATİF DÖNGÜ KONTROLÜ
+    dongu_var = any(mesafeler[u] + agirlik < mesafeler[v] or (yonsuz and mesafeler[v] + agirlik < mesafeler[u])
+                    for u, v, agirlik in kenarlar)
+
+    izleme.sure_ekle('hazirlik', t1 - t0)
+    izleme.sure_ekle('gevsetme', t2 - t1)
+    izleme.sure_ekle('dongu_kontrolu', time.perf_counter_ns() - t2)
+    izleme.topla(gevsetme=gevsetme, basarili_gevsetme=basarili, tur=tur)
+    if dongu_var:
+        return None, None
+    return mesafeler, onceki
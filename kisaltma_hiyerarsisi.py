@@ -0,0 +1,224 @@
+import heapq
+import json
+import numpy as np
+from kompakt_graf import etiket_coz, etiket_kodla
+
+def _tanik_var_mi(komsuluk, kaynak, hedef, atlanan, sinir, dugum_limiti=60):
+    #kaynak'tan hedef'e, atlanan düğümden geçmeyen ve maliyeti sinir'i aşmayan bir yol (tanık) arıyoruz
+    #Arama sınırlıdır: tanık bulunamazsa gereksiz de olsa kısayol eklenir, sonuç yine doğru kalır
+    mesafeler = {kaynak: 0}
+    pq = [(0, kaynak)]
+    kesinlesen = 0
+    while pq and kesinlesen < dugum_limiti:
+        mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+        if mevcut_mesafe > sinir:
+            return False
+        if mevcut_dugum == hedef:
+            return True
+        if mevcut_mesafe > mesafeler[mevcut_dugum]: continue
+        kesinlesen += 1
+        for komsu, agirlik in komsuluk[mevcut_dugum].items():
+            if komsu == atlanan:
+                continue
+            yeni_mesafe = mevcut_mesafe + agirlik
+            if yeni_mesafe <= sinir and yeni_mesafe < mesafeler.get(komsu, float('infinity')):
+                mesafeler[komsu] = yeni_mesafe
+                heapq.heappush(pq, (yeni_mesafe, komsu))
+    return mesafeler.get(hedef, float('infinity')) <= sinir
+
+
+def _gereken_kisayollar(komsuluk, dugum):
+    #Düğüm ağdan çıkarılırsa komşu çiftleri arasındaki en kısa yolları korumak için gereken kısayollar
+    komsular = list(komsuluk[dugum].items())
+    kisayollar = []
+    for i, (u, w_u) in enumerate(komsular):
+        for v, w_v in komsular[i + 1:]:
+            maliyet = w_u + w_v
+            if not _tanik_var_mi(komsuluk, u, v, dugum, maliyet):
+                kisayollar.append((u, v, maliyet))
+    return kisayollar
+
+
+class KisaltmaHiyerarsisi:
+    """
+    Contraction Hierarchies: topoloji nadiren değiştiğinde noktadan noktaya sorguları hızlandırır.
+    Ön işlemede düğümler önem sırasıyla ağdan çıkarılır (contraction) ve kaybolan en kısa yollar
+    kısayol kenarlarıyla korunur. Sorguda iki uçtan sadece 'yukarı' (sırası daha yüksek düğümlere) aranır.
+    """
+    def __init__(self, etiketler, sira, ofsetler, hedefler, agirliklar, ortalar):
+        self.etiketler = list(etiketler)
+        self.indeks = {etiket: i for i, etiket in enumerate(self.etiketler)}
+        #sira[u]: düğümün çıkarılma sırası (önem derecesi)
+        self.sira = np.asarray(sira, dtype=np.int64)
+        #Yukarı graf (CSR): u'dan sadece sırası daha büyük düğümlere giden kenarlar
+        self.ofsetler = np.asarray(ofsetler, dtype=np.int64)
+        self.hedefler = np.asarray(hedefler, dtype=np.int64)
+        self.agirliklar = np.asarray(agirliklar)
+        #Kısayolun atladığı ara düğüm, gerçek kenarlarda -1 (rotayı açmak için)
+        self.ortalar = np.asarray(ortalar, dtype=np.int64)
+        self._listeler = None
+
+    @classmethod
+    def olustur(cls, graf, maliyet_modeli=None):
+        """
+        KompaktGraf üzerinden hiyerarşiyi kurar (ön işleme).
+        Düğüm sırası tembel güncellenen öncelik kuyruğuyla seçilir: öncelik = eklenecek kısayol sayısı
+        - kaldırılan kenar sayısı + daha önce çıkarılmış komşu sayısı.
+        """
+        n = graf.dugum_sayisi
+        ofsetler, komsular = graf.listeler()
+        maliyetler = graf.maliyet_listesi(maliyet_modeli)
+
+        #Ön işleme sırasında değişen (kısayol eklenen) komşuluk; her çift için en ucuz kenar tutulur
+        komsuluk = [{} for _ in range(n)]
+        orta = {}
+        for u in range(n):
+            for i in range(ofsetler[u], ofsetler[u + 1]):
+                v = komsular[i]
+                if v != u and maliyetler[i] < komsuluk[u].get(v, float('infinity')):
+                    komsuluk[u][v] = maliyetler[i]
+
+        cikarilan_komsu = [0] * n
+
+        def oncelik(dugum):
+            kisayollar = _gereken_kisayollar(komsuluk, dugum)
+            return len(kisayollar) - len(komsuluk[dugum]) + cikarilan_komsu[dugum], kisayollar
+
+        pq = [(oncelik(u)[0], u) for u in range(n)]
+        heapq.heapify(pq)
+        sira = [0] * n
+        yukari = [{} for _ in range(n)]
+        sayac = 0
+
+        while pq:
+            _, dugum = heapq.heappop(pq)
+            #Tembel güncelleme: öncelik eskidiyse yeniden hesaplayıp sıradakiyle karşılaştırıyoruz
+            yeni_oncelik, kisayollar = oncelik(dugum)
+            if pq and yeni_oncelik > pq[0][0]:
+                heapq.heappush(pq, (yeni_oncelik, dugum))
+                continue
+
+            #Düğümü çıkarıyoruz: kenarları yukarı grafa geçer, gereken kısayollar eklenir
+            sira[dugum] = sayac
+            sayac += 1
+            for u, u_v, maliyet in kisayollar:
+                if maliyet < komsuluk[u].get(u_v, float('infinity')):
+                    komsuluk[u][u_v] = maliyet
+                    komsuluk[u_v][u] = maliyet
+                    orta[(min(u, u_v), max(u, u_v))] = dugum
+            for komsu, agirlik in komsuluk[dugum].items():
+                yukari[dugum][komsu] = (agirlik, orta.get((min(dugum, komsu), max(dugum, komsu)), -1))
+                del komsuluk[komsu][dugum]
+                cikarilan_komsu[komsu] += 1
+            komsuluk[dugum] = {}
+
+        #Yukarı grafı CSR dizilerine döküyoruz
+        y_ofsetler = [0]
+        y_hedefler, y_agirliklar, y_ortalar = [], [], []
+        for u in range(n):
+            for v, (agirlik, ara) in yukari[u].items():
+                y_hedefler.append(v)
+                y_agirliklar.append(agirlik)
+                y_ortalar.append(ara)
+            y_ofsetler.append(len(y_hedefler))
+
+        return cls(graf.etiketler, sira, y_ofsetler, y_hedefler,
+                   np.array(y_agirliklar) if y_agirliklar else np.zeros(0), y_ortalar)
+
+    def _sorgu_listeleri(self):
+        if self._listeler is None:
+            self._listeler = (self.ofsetler.tolist(), self.hedefler.tolist(),
+                              self.agirliklar.tolist(), self.ortalar.tolist())
+        return self._listeler
+
+    def _kenar(self, u, v):
+        #u-v kenarı sırası küçük olan ucun yukarı satırında durur
+        if self.sira[u] > self.sira[v]:
+            u, v = v, u
+        ofsetler, hedefler, agirliklar, ortalar = self._sorgu_listeleri()
+        for i in range(ofsetler[u], ofsetler[u + 1]):
+            if hedefler[i] == v:
+                return ortalar[i]
+        raise KeyError((u, v))
+
+    def _ac(self, u, v, yol):
+        #Kısayolu özyinelemeli olarak gerçek kenarlara açıyoruz (yığıtla, derin hiyerarşilerde taşmasın diye)
+        yigit = [(u, v)]
+        while yigit:
+            a, b = yigit.pop()
+            ara = self._kenar(a, b)
+            if ara == -1:
+                yol.append(b)
+            else:
+                yigit.append((ara, b))
+                yigit.append((a, ara))
+
+    def en_kisa_yol(self, baslangic, hedef):
+        """
+        Dönüş değeri dijkstra_kendi_kodumuz ile aynıdır: (rota, toplam maliyet).
+        """
+        ofsetler, hedefler, agirliklar, _ = self._sorgu_listeleri()
+        s, t = self.indeks[baslangic], self.indeks[hedef]
+
+        mesafeler = ({s: 0}, {t: 0})
+        onceki = ({s: -1}, {t: -1})
+        kuyruklar = ([(0, s)], [(0, t)])
+        en_iyi = float('infinity')
+        bulusma = -1
+
+        while kuyruklar[0] or kuyruklar[1]:
+            for yon in (0, 1):
+                kuyruk = kuyruklar[yon]
+                if not kuyruk:
+                    continue
+                mevcut_mesafe, mevcut_dugum = heapq.heappop(kuyruk)
+                if mevcut_mesafe > mesafeler[yon][mevcut_dugum]: continue
+                #Bu yönde en iyi yoldan kısa bir şey kalmadıysa yönü kapatıyoruz
+                if mevcut_mesafe >= en_iyi:
+                    kuyruk.clear()
+                    continue
+
+                karsi = mesafeler[1 - yon]
+                if mevcut_dugum in karsi and mevcut_mesafe + karsi[mevcut_dugum] < en_iyi:
+                    en_iyi = mevcut_mesafe + karsi[mevcut_dugum]
+                    bulusma = mevcut_dugum
+
+                #Sadece sırası daha yüksek düğümlere doğru ilerliyoruz
+                for i in range(ofsetler[mevcut_dugum], ofsetler[mevcut_dugum + 1]):
+                    komsu = hedefler[i]
+                    yeni_mesafe = mevcut_mesafe + agirliklar[i]
+                    if yeni_mesafe < mesafeler[yon].get(komsu, float('infinity')):
+                        mesafeler[yon][komsu] = yeni_mesafe
+                        onceki[yon][komsu] = mevcut_dugum
+                        heapq.heappush(kuyruk, (yeni_mesafe, komsu))
+
+        if bulusma == -1:
+            return [hedef], float('infinity')
+
+        #ROTAYI OLUŞTURMA: buluşma düğümünden iki yöne önceki zincirlerini izleyip kısayolları açıyoruz
+        ileri = [bulusma]
+        while onceki[0][ileri[-1]] != -1:
+            ileri.append(onceki[0][ileri[-1]])
+        ileri.reverse()
+        geri = [bulusma]
+        while onceki[1][geri[-1]] != -1:
+            geri.append(onceki[1][geri[-1]])
+
+        yol = [s]
+        for zincir in (ileri, geri):
+            for u, v in zip(zincir, zincir[1:]):
+                self._ac(u, v, yol)
+        return [self.etiketler[i] for i in yol], en_iyi
+
+    def kaydet(self, dosya_yolu):
+        #Hiyerarşi bir kez çevrimdışı kurulup servis açılırken yüklenebilsin diye .npz olarak yazılır
+        #Router etiketleri JSON olarak saklanır; demet ve NumPy sayısı etiketler de birebir geri gelir
+        etiketler = json.dumps([etiket_kodla(e) for e in self.etiketler], ensure_ascii=False)
+        np.savez(dosya_yolu, etiketler=np.array(etiketler), sira=self.sira,
+                 ofsetler=self.ofsetler, hedefler=self.hedefler, agirliklar=self.agirliklar, ortalar=self.ortalar)
+
+    @classmethod
+    def yukle(cls, dosya_yolu):
+        with np.load(dosya_yolu) as veri:
+            return cls([etiket_coz(kod) for kod in json.loads(veri['etiketler'].item())], veri['sira'], veri['ofsetler'],
+                       veri['hedefler'], veri['agirliklar'], veri['ortalar'])
@@ -0,0 +1,226 @@
+import csv
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import networkx as nx
+import numpy as np
+import ag_uretici
+
+#Her ailede hedeflenen kenar sayıları; en büyüğü 10^6 kenardır
+VARSAYILAN_KENAR_HEDEFLERI = (1_000, 10_000, 100_000, 1_000_000)
+
+def _kenarlardan_graf(n, u, v, rng):
+    #Kenar dizilerinden ağırlıklı (1-100 ms) ve trafikli (0-1) bir NetworkX ağı kuruyoruz
+    return ag_uretici.nx_grafi(n, u, v, ag_uretici.rastgele_agirliklar(len(u), rng),
+                               ag_uretici.rastgele_trafikler(len(u), rng))
+
+
+def yogun_er(kenar_hedefi, rng, baglanti_ihtimali=0.3):
+    #Yoğun Erdos-Renyi: her düğüm çifti sabit olasılıkla bağlıdır (rastgele_ag_olustur ile aynı yoğunluk)
+    n = max(2, round(math.sqrt(2 * kenar_hedefi / baglanti_ihtimali)))
+    u, v = ag_uretici.er_kenarlari(n, baglanti_ihtimali * (n - 1), rng)
+    return _kenarlardan_graf(n, u, v, rng)
+
+
+def seyrek_er(kenar_hedefi, rng, ortalama_derece=4):
+    #Seyrek Erdos-Renyi: düğüm sayısı, ortalama derece sabit kalacak şekilde büyür
+    n = max(2, round(2 * kenar_hedefi / ortalama_derece))
+    u, v = ag_uretici.er_kenarlari(n, ortalama_derece, rng)
+    return _kenarlardan_graf(n, u, v, rng)
+
+
+def geometrik(kenar_hedefi, rng, ortalama_derece=8):
+    #Birim karede rastgele konumlanmış routerlar, birbirine yaricap'tan yakın olanlar bağlıdır
+    n = max(2, round(2 * kenar_hedefi / ortalama_derece))
+    yaricap = math.sqrt(ortalama_derece / (math.pi * n))
+    u, v, _ = ag_uretici.geometrik_kenarlari(n, yaricap, rng)
+    return _kenarlardan_graf(n, u, v, rng)
+
+
+def izgara(kenar_hedefi, rng):
+    #Kare ızgara: k x k düğüm, yaklaşık 2k^2 kenar
+    k = max(2, round(math.sqrt(kenar_hedefi / 2)))
+    u, v, _ = ag_uretici.izgara_kenarlari(k, k)
+    return _kenarlardan_graf(k * k, u, v, rng)
+
+
+def olceksiz(kenar_hedefi, rng, ortalama_derece=4):
+    #Ölçeksiz (Chung-Lu) ağ: birkaç yüksek dereceli hub, çok sayıda düşük dereceli router
+    n = max(2, round(2 * kenar_hedefi / ortalama_derece))
+    u, v = ag_uretici.olceksiz_kenarlari(n, ortalama_derece, rng)
+    return _kenarlardan_graf(n, u, v, rng)
+
+
+GRAF_AILELERI = {
+    'yogun_er': yogun_er,
+    'seyrek_er': seyrek_er,
+    'geometrik': geometrik,
+    'izgara': izgara,
+    'olceksiz': olceksiz,
+}
+
+
+def ornek_ciftler(graph, ornek_sayisi, rng):
+    #Yol bulunamaması ölçümü bozmasın diye çiftler en büyük bağlı bileşenden seçilir
+    bilesen = np.fromiter(max(nx.connected_components(graph), key=len), dtype=np.int64)
+    secim = rng.choice(bilesen, size=(ornek_sayisi, 2))
+    return [(int(s), int(t)) for s, t in secim]
+
+
+def olc(fonksiyon, isinma=2, deneme=7):
+    """
+    fonksiyon'u isinma kez boşa, ardından deneme kez ölçerek çalıştırır, nanosaniye listesi döner.
+    Ölçüm sırasında çöp toplayıcı kapatılır, böylece ölçüme rastgele duraklamalar karışmaz.
+    """
+    for _ in range(isinma):
+        fonksiyon()
+    sureler = []
+    gc.collect()
+    gc_acikti = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(deneme):
+            t0 = time.perf_counter_ns()
+            fonksiyon()
+            sureler.append(time.perf_counter_ns() - t0)
+    finally:
+        if gc_acikti:
+            gc.enable()
+    return sureler
+
+
+def ozetle(sureler_ns):
+    #Ortalama yerine tek seferlik sapmalara dayanıklı medyan, p95 ve çeyrekler arası açıklık (IQR)
+    dizi = np.asarray(sureler_ns, dtype=np.float64)
+    q1, medyan, q3, p95 = np.percentile(dizi, [25, 50, 75, 95])
+    return {
+        'olcum_sayisi': len(dizi),
+        'medyan_ns': float(medyan),
+        'p95_ns': float(p95),
+        'q1_ns': float(q1),
+        'q3_ns': float(q3),
+        'iqr_ns': float(q3 - q1),
+        'min_ns': float(dizi.min()),
+        'ortalama_ns': float(dizi.mean()),
+    }
+
+
+def kiyasla(algoritmalar, hazirla=None, aileler=None, kenar_hedefleri=VARSAYILAN_KENAR_HEDEFLERI,
+            ornek_sayisi=5, isinma=2, deneme=7, seed=42, sure_siniri_s=5.0):
+    """
+    Her graf ailesi ve boyutu için algoritmaları aynı (kaynak, hedef) örnekleri üzerinde ölçer.
+    algoritmalar: {ad: fonksiyon(nesne, kaynak, hedef)}, hazirla(graph) ölçülecek nesneyi kurar
+    (verilmezse NetworkX grafı doğrudan kullanılır).
+    Tek bir sorgusu sure_siniri_s'yi aşan algoritma o ailenin daha büyük boyutlarında atlanır.
+    Dönüş: her (aile, boyut, algoritma) için bir satır sözlük.
+    """
+    hazirla = hazirla or (lambda graph: graph)
+    aileler = aileler or list(GRAF_AILELERI)
+    satirlar = []
+
+    for aile_sirasi, aile in enumerate(aileler):
+        uretec = GRAF_AILELERI[aile]
+        atlanan = set()
+        for boyut_sirasi, kenar_hedefi in enumerate(kenar_hedefleri):
+            #Her (aile, boyut) için tohum sabittir, sürümler arası karşılaştırmada aynı ağlar üretilir
+            graf_tohumu = seed + 1000 * aile_sirasi + boyut_sirasi
+            rng = np.random.default_rng(graf_tohumu)
+            graph = uretec(kenar_hedefi, rng)
+            ciftler = ornek_ciftler(graph, ornek_sayisi, rng)
+            nesne = hazirla(graph)
+            print(f"{aile}: {graph.number_of_nodes()} router, {graph.number_of_edges()} bağlantı")
+
+            for ad, fonksiyon in algoritmalar.items():
+                satir = {
+                    'aile': aile,
+                    'kenar_hedefi': kenar_hedefi,
+                    'dugum_sayisi': graph.number_of_nodes(),
+                    'kenar_sayisi': graph.number_of_edges(),
+                    'algoritma': ad,
+                    'seed': graf_tohumu,
+                    'ornek_sayisi': len(ciftler),
+                    'isinma': isinma,
+                    'deneme': deneme,
+                    'durum': 'tamam',
+                }
+                if ad in atlanan:
+                    satir['durum'] = 'atlandi'
+                    satirlar.append(satir)
+                    continue
+
+                #Süre sınırını ilk çiftin tek bir çalışmasıyla kontrol ediyoruz
+                t0 = time.perf_counter_ns()
+                fonksiyon(nesne, *ciftler[0])
+                if (time.perf_counter_ns() - t0) / 1e9 > sure_siniri_s:
+                    atlanan.add(ad)
+                    satir['durum'] = 'atlandi'
+                    satirlar.append(satir)
+                    continue
+
+                sureler = []
+                for kaynak, hedef in ciftler:
+                    sureler.extend(olc(lambda: fonksiyon(nesne, kaynak, hedef), isinma, deneme))
+                satir.update(ozetle(sureler))
+                satirlar.append(satir)
+                print(f"  {ad}: medyan {satir['medyan_ns'] / 1e6:.3f} ms, p95 {satir['p95_ns'] / 1e6:.3f} ms")
+    return satirlar
+
+
+def ortam_bilgisi():
+    #Sonuçları farklı makine/sürüm ölçümleriyle karşılaştırırken gereken bilgiler
+    return {
+        'zaman': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'networkx': nx.__version__,
+        'platform': platform.platform(),
+        'islemci': platform.processor() or platform.machine(),
+    }
+
+
+def json_yaz(satirlar, dosya_yolu):
+    with open(dosya_yolu, 'w', encoding='utf-8') as dosya:
+        json.dump({'ortam': ortam_bilgisi(), 'sonuclar': satirlar}, dosya, ensure_ascii=False, indent=2)
+
+
+def csv_yaz(satirlar, dosya_yolu):
+    #Atlanan satırlarda ölçüm sütunları boş kalır
+    sutunlar = []
+    for satir in satirlar:
+        sutunlar.extend(s for s in satir if s not in sutunlar)
+    with open(dosya_yolu, 'w', newline='', encoding='utf-8') as dosya:
+        yazici = csv.DictWriter(dosya, fieldnames=sutunlar)
+        yazici.writeheader()
+        yazici.writerows(satirlar)
+
+
+def ciz(satirlar):
+    #Grafik isteğe bağlıdır; matplotlib sadece çizim istendiğinde yüklenir
+    import matplotlib.pyplot as plt
+
+    aileler = list(dict.fromkeys(s['aile'] for s in satirlar))
+    fig, eksenler = plt.subplots(1, len(aileler), figsize=(5 * len(aileler), 5), squeeze=False)
+    for ax, aile in zip(eksenler[0], aileler):
+        for ad in dict.fromkeys(s['algoritma'] for s in satirlar):
+            olculen = [s for s in satirlar if s['aile'] == aile and s['algoritma'] == ad and s['durum'] == 'tamam']
+            if not olculen:
+                continue
+            x = [s['kenar_sayisi'] for s in olculen]
+            medyan = np.array([s['medyan_ns'] for s in olculen]) / 1e6
+            q1 = np.array([s['q1_ns'] for s in olculen]) / 1e6
+            q3 = np.array([s['q3_ns'] for s in olculen]) / 1e6
+            ax.plot(x, medyan, marker='o', label=ad)
+            #Çeyrekler arası bant ölçümün ne kadar kararlı olduğunu gösterir
+            ax.fill_between(x, q1, q3, alpha=0.2)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_title(aile)
+        ax.set_xlabel("Bağlantı Sayısı (Kenar)")
+        ax.set_ylabel("Sorgu Süresi, medyan (ms)")
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend()
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,356 @@
+import heapq
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from maliyet_modeli import MesafeMaliyeti
+
+
+def etiket_kodla(etiket):
+    #JSON'da demet (tuple) yoktur; ızgara ağlarındaki (x, y) gibi etiketler ayrıca işaretlenir
+    if isinstance(etiket, tuple):
+        return {'demet': [etiket_kodla(e) for e in etiket]}
+    #np.int64 gibi NumPy sayıları json ile yazılamaz, düz Python sayısına çevrilir
+    if isinstance(etiket, np.generic):
+        return etiket.item()
+    return etiket
+
+
+def etiket_coz(kod):
+    if isinstance(kod, dict):
+        return tuple(etiket_coz(e) for e in kod['demet'])
+    return kod
+
+
+class KompaktGraf:
+    """
+    Ağın dondurulmuş, dizi tabanlı (CSR) kopyası.
+    Düğümler 0..n-1 arası tam sayılarla temsil edilir, u düğümünün komşuları
+    komsular[ofsetler[u]:ofsetler[u+1]] aralığında tutulur.
+    """
+    def __init__(self, etiketler, ofsetler, komsular, agirliklar, trafikler):
+        #Router isimleri ile tam sayı kimlikler arasındaki çift yönlü eşleme
+        self.etiketler = list(etiketler)
+        self.indeks = {etiket: i for i, etiket in enumerate(self.etiketler)}
+
+        #Topoloji dondurulmuştur, bu diziler sonradan değiştirilemez
+        self.ofsetler = np.asarray(ofsetler, dtype=np.int64)
+        self.komsular = np.asarray(komsular, dtype=np.int32)
+        for dizi in (self.ofsetler, self.komsular):
+            dizi.flags.writeable = False
+
+        #Mesafe ve trafik değerleri ise kenar_guncelle ile yerinde değişebilir
+        self.agirliklar = np.asarray(agirliklar)
+        self.trafikler = np.asarray(trafikler, dtype=np.float64)
+
+        #Sıcak döngüde NumPy eleman erişimi yavaş olduğu için düz Python listelerini bir kez üretip saklıyoruz
+        self._listeler = None
+        self._maliyet_listeleri = {}
+
+    @classmethod
+    def graftan(cls, graph):
+        #NetworkX grafını tek geçişte CSR dizilerine döküyoruz
+        etiketler = list(graph.nodes)
+        indeks = {etiket: i for i, etiket in enumerate(etiketler)}
+
+        ofsetler = [0]
+        komsular = []
+        agirliklar = []
+        trafikler = []
+        for u in etiketler:
+            for v, ozellikler in graph[u].items():
+                komsular.append(indeks[v])
+                agirliklar.append(ozellikler['weight'])
+                #Trafik verisi olmayan ağlarda yollar boş kabul edilir
+                trafikler.append(ozellikler.get('traffic', 0.0))
+            ofsetler.append(len(komsular))
+
+        #Ağırlıklar tam sayıysa tam sayı olarak kalır, böylece maliyetler orijinal kodla aynı tipte döner
+        return cls(etiketler, ofsetler, komsular,
+                   np.array(agirliklar) if agirliklar else np.zeros(0),
+                   trafikler)
+
+    @classmethod
+    def kenarlardan(cls, dugum_sayisi, u, v, agirliklar, trafikler=None, etiketler=None):
+        """
+        Yönsüz kenar dizilerinden (u[i] - v[i] kablosu) CSR kopyasını doğrudan NumPy ile kurar.
+        Büyük test ağlarında nx.Graph kurmadan motorlara veri sağlamak için kullanılır.
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        agirliklar = np.asarray(agirliklar)
+        trafikler = np.zeros(len(u)) if trafikler is None else np.asarray(trafikler, dtype=np.float64)
+
+        #Her kablo iki yönde yazılır, kaynağa göre kararlı sıralama komşu listelerini oluşturur
+        kaynaklar = np.concatenate([u, v])
+        sira = np.argsort(kaynaklar, kind='stable')
+        ofsetler = np.zeros(dugum_sayisi + 1, dtype=np.int64)
+        np.cumsum(np.bincount(kaynaklar, minlength=dugum_sayisi), out=ofsetler[1:])
+        return cls(range(dugum_sayisi) if etiketler is None else etiketler, ofsetler,
+                   np.concatenate([v, u])[sira],
+                   np.concatenate([agirliklar, agirliklar])[sira],
+                   np.concatenate([trafikler, trafikler])[sira])
+
+    @property
+    def dugum_sayisi(self):
+        return len(self.etiketler)
+
+    @property
+    def kenar_sayisi(self):
+        #Yönsüz ağda her kablo CSR içinde iki kez (u->v ve v->u) bulunur
+        return len(self.komsular) // 2
+
+    def listeler(self):
+        #Dijkstra döngüsünün kullandığı ofset ve komşu listeleri
+        if self._listeler is None:
+            self._listeler = (self.ofsetler.tolist(), self.komsular.tolist())
+        return self._listeler
+
+    def maliyet_dizisi(self, maliyet_modeli=None):
+        #Kenar başına efektif maliyetler NumPy dizisi olarak (vektörel motorlar için)
+        maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+        return maliyet_modeli.dizi(self.agirliklar, self.trafikler)
+
+    def maliyet_listesi(self, maliyet_modeli=None):
+        """
+        Kenar başına efektif maliyeti düz liste olarak döndürür, model verilmezse saf mesafe.
+        Liste her model için bir kez üretilir; trafik değişince kenar_guncelle onu yerinde düzeltir.
+        """
+        maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+        if maliyet_modeli.anahtar not in self._maliyet_listeleri:
+            self._maliyet_listeleri[maliyet_modeli.anahtar] = (maliyet_modeli, self.maliyet_dizisi(maliyet_modeli).tolist())
+        return self._maliyet_listeleri[maliyet_modeli.anahtar][1]
+
+    def trafikleri_degistir(self, trafikler):
+        #Trafik dizisini toptan değiştirir (ör. başka bir süreçten gelen anlık görüntü); maliyet listeleri ilk istekte yeniden üretilir
+        self.trafikler = np.asarray(trafikler, dtype=np.float64)
+        self._maliyet_listeleri.clear()
+
+    def kenar_konumu(self, u, v):
+        #u satırında v komşusunun CSR dizisindeki yerini buluyoruz
+        ofsetler, komsular = self.listeler()
+        for i in range(ofsetler[u], ofsetler[u + 1]):
+            if komsular[i] == v:
+                return i
+        raise KeyError((self.etiketler[u], self.etiketler[v]))
+
+    def kenar_guncelle(self, u, v, agirlik=None, trafik=None):
+        """
+        u-v kablosunun mesafesini ve/veya trafiğini her iki yönde günceller.
+        Daha önce üretilmiş maliyet listeleri de yerinde düzeltilir, böylece onları kullanan motorlar hemen yeni değeri görür.
+        """
+        if agirlik is not None and np.issubdtype(self.agirliklar.dtype, np.integer) and agirlik != int(agirlik):
+            self.agirliklar = self.agirliklar.astype(np.float64)
+        for a, b in ((u, v), (v, u)):
+            i = self.kenar_konumu(a, b)
+            if agirlik is not None:
+                self.agirliklar[i] = agirlik
+            if trafik is not None:
+                self.trafikler[i] = trafik
+            for maliyet_modeli, liste in self._maliyet_listeleri.values():
+                liste[i] = maliyet_modeli.tek(self.agirliklar[i].item(), self.trafikler[i].item())
+
+
+class KompaktDijkstra:
+    """
+    KompaktGraf üzerinde çalışan Dijkstra motoru.
+    Mesafe ve önceki düğüm dizileri bir kez ayrılır ve sorgular arasında yeniden kullanılır.
+    """
+    def __init__(self, graf):
+        self.graf = graf
+        n = graf.dugum_sayisi
+        self.mesafeler = [float('infinity')] * n
+        self.onceki = [-1] * n
+        #Her sorguda sadece dokunduğumuz düğümleri sıfırlıyoruz, tüm diziyi baştan kurmuyoruz
+        self._dokunulan = []
+
+    def _sifirla(self):
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        sonsuz = float('infinity')
+        for i in self._dokunulan:
+            mesafeler[i] = sonsuz
+            onceki[i] = -1
+        self._dokunulan.clear()
+
+    def calistir(self, kaynak, agirliklar, hedef=-1, izleme=None):
+        """
+        kaynak kimlikli düğümden Dijkstra çalıştırır, hedef verilirse ona ulaşınca durur.
+        Sonuçlar self.mesafeler ve self.onceki dizilerinde kalır.
+        izleme (Izleme) verilirse aynı arama sayaçlı döngüyle yapılır.
+        """
+        if izleme is not None:
+            return self._izlemeli_calistir(kaynak, agirliklar, hedef, izleme)
+        self._sifirla()
+        ofsetler, komsular = self.graf.listeler()
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        dokunulan = self._dokunulan
+        sonsuz = float('infinity')
+
+        mesafeler[kaynak] = 0
+        dokunulan.append(kaynak)
+        pq = [(0, kaynak)]
+
+        while pq:
+            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_dugum == hedef: break
+            if mevcut_mesafe > mesafeler[mevcut_dugum]: continue
+
+            #Komşular CSR dizisinde ardışık durduğu için sözlük araması yapmıyoruz
+            for i in range(ofsetler[mevcut_dugum], ofsetler[mevcut_dugum + 1]):
+                komsu = komsular[i]
+                yeni_mesafe = mevcut_mesafe + agirliklar[i]
+                if yeni_mesafe < mesafeler[komsu]:
+                    if mesafeler[komsu] == sonsuz:
+                        dokunulan.append(komsu)
+                    mesafeler[komsu] = yeni_mesafe
+                    onceki[komsu] = mevcut_dugum
+                    heapq.heappush(pq, (yeni_mesafe, komsu))
+
+    def _izlemeli_calistir(self, kaynak, agirliklar, hedef, izleme):
+        #calistir ile aynı döngü, sayaçlar yerel değişkenlerde tutulur ve sonunda izlemeye yazılır
+        t0 = time.perf_counter_ns()
+        self._sifirla()
+        ofsetler, komsular = self.graf.listeler()
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        dokunulan = self._dokunulan
+        sonsuz = float('infinity')
+
+        mesafeler[kaynak] = 0
+        dokunulan.append(kaynak)
+        pq = [(0, kaynak)]
+        itme, cekme, bayat_cekme, gevsetme, basarili, en_buyuk = 1, 0, 0, 0, 0, 1
+        t1 = time.perf_counter_ns()
+
+        while pq:
+            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+            cekme += 1
+            if mevcut_dugum == hedef: break
+            if mevcut_mesafe > mesafeler[mevcut_dugum]:
+                bayat_cekme += 1
+                continue
+
+            for i in range(ofsetler[mevcut_dugum], ofsetler[mevcut_dugum + 1]):
+                komsu = komsular[i]
+                gevsetme += 1
+                yeni_mesafe = mevcut_mesafe + agirliklar[i]
+                if yeni_mesafe < mesafeler[komsu]:
+                    basarili += 1
+                    if mesafeler[komsu] == sonsuz:
+                        dokunulan.append(komsu)
+                    mesafeler[komsu] = yeni_mesafe
+                    onceki[komsu] = mevcut_dugum
+                    heapq.heappush(pq, (yeni_mesafe, komsu))
+                    itme += 1
+                    if len(pq) > en_buyuk:
+                        en_buyuk = len(pq)
+
+        izleme.sure_ekle('hazirlik', t1 - t0)
+        izleme.sure_ekle('arama', time.perf_counter_ns() - t1)
+        izleme.topla(itme, cekme, bayat_cekme, gevsetme, basarili, 0, en_buyuk)
+
+    def hedeflere_calistir(self, kaynak, agirliklar, hedefler):
+        """
+        Aynı kaynaktan birden fazla hedef istendiğinde tek bir arama yapar.
+        Arama, istenen hedeflerin hepsinin mesafesi kesinleşince durur.
+        """
+        self._sifirla()
+        ofsetler, komsular = self.graf.listeler()
+        mesafeler = self.mesafeler
+        onceki = self.onceki
+        dokunulan = self._dokunulan
+        sonsuz = float('infinity')
+        kalan = set(hedefler)
+
+        mesafeler[kaynak] = 0
+        dokunulan.append(kaynak)
+        pq = [(0, kaynak)]
+
+        while pq:
+            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_mesafe > mesafeler[mevcut_dugum]: continue
+            #Kuyruktan ilk çıktığı anda düğümün mesafesi kesinleşmiştir
+            if mevcut_dugum in kalan:
+                kalan.discard(mevcut_dugum)
+                if not kalan: break
+
+            for i in range(ofsetler[mevcut_dugum], ofsetler[mevcut_dugum + 1]):
+                komsu = komsular[i]
+                yeni_mesafe = mevcut_mesafe + agirliklar[i]
+                if yeni_mesafe < mesafeler[komsu]:
+                    if mesafeler[komsu] == sonsuz:
+                        dokunulan.append(komsu)
+                    mesafeler[komsu] = yeni_mesafe
+                    onceki[komsu] = mevcut_dugum
+                    heapq.heappush(pq, (yeni_mesafe, komsu))
+
+    def yol_kimlikleri(self, hedef):
+        #Önceki düğüm dizisini geriye doğru izleyip rotayı tam sayı kimliklerle oluşturuyoruz
+        yol = []
+        adim = hedef
+        while adim != -1:
+            yol.append(adim)
+            adim = self.onceki[adim]
+        yol.reverse()
+        return yol
+
+    def yolu_kur(self, hedef):
+        #Rotayı router etiketleriyle döndürür
+        etiketler = self.graf.etiketler
+        return [etiketler[adim] for adim in self.yol_kimlikleri(hedef)]
+
+    def en_kisa_yol(self, baslangic, hedef, agirliklar, izleme=None):
+        #Etiketlerle çalışan arayüz, dönüş değeri orijinal dijkstra fonksiyonlarıyla aynıdır
+        indeks = self.graf.indeks
+        hedef_id = indeks[hedef]
+        self.calistir(indeks[baslangic], agirliklar, hedef_id, izleme)
+        if izleme is not None:
+            with izleme.asama('rota'):
+                return self.yolu_kur(hedef_id), self.mesafeler[hedef_id]
+        return self.yolu_kur(hedef_id), self.mesafeler[hedef_id]
+
+    def agac_hesapla(self, kaynak, agirliklar):
+        #Hedef vermeden tüm ağı dolaşıp en kısa yol ağacının kalıcı bir kopyasını çıkarıyoruz
+        self.calistir(kaynak, agirliklar)
+        return np.array(self.mesafeler, dtype=np.float64), np.array(self.onceki, dtype=np.int32)
+
+
+def paylasimli_bellege_yaz(diziler):
+    """
+    Dizileri işletim sisteminin paylaşımlı belleğine kopyalar.
+    Dönen tanım küçük bir sözlüktür, işçi süreçlere görev başına değil bir kez gönderilir.
+    Bloklar işimiz bitince close() ve unlink() ile serbest bırakılmalıdır.
+    """
+    diziler = {ad: np.ascontiguousarray(dizi) for ad, dizi in diziler.items()}
+    tanim, bloklar = paylasimli_bellek_ayir({ad: (dizi.shape, dizi.dtype) for ad, dizi in diziler.items()})
+    for blok, dizi in zip(bloklar, diziler.values()):
+        np.ndarray(dizi.shape, dtype=dizi.dtype, buffer=blok.buf)[...] = dizi
+    return tanim, bloklar
+
+
+def paylasimli_bellek_ayir(sekiller):
+    """
+    {ad: (şekil, tip)} için paylaşımlı bellekte sıfırla dolu diziler ayırır, süreç içinde hiçbir kopya oluşmaz
+    (sayfalar ilk yazıldıkları anda ayrılır). Dönüş paylasimli_bellege_yaz ile aynıdır: (tanım, bloklar).
+    """
+    tanim = {}
+    bloklar = []
+    for ad, (sekil, tip) in sekiller.items():
+        tip = np.dtype(tip)
+        sekil = tuple(sekil)
+        blok = shared_memory.SharedMemory(create=True, size=max(int(np.prod(sekil)) * tip.itemsize, 1))
+        tanim[ad] = (blok.name, sekil, tip.str)
+        bloklar.append(blok)
+    return tanim, bloklar
+
+
+def paylasimli_bellekten_oku(tanim):
+    #Başka bir sürecin yazdığı blokları kopyalamadan NumPy dizisi olarak açıyoruz
+    diziler = {}
+    bloklar = []
+    for ad, (isim, sekil, tip) in tanim.items():
+        blok = shared_memory.SharedMemory(name=isim)
+        diziler[ad] = np.ndarray(sekil, dtype=np.dtype(tip), buffer=blok.buf)
+        bloklar.append(blok)
+    return diziler, bloklar
@@ -0,0 +1,126 @@
+import time
+from collections import deque
+
+def _onceki_dongusu_var(onceki):
+    #Önceki düğüm işaretçileri bir döngü oluşturuyorsa o döngünün toplam ağırlığı negatiftir
+    durum = {}
+    for baslangic in onceki:
+        if baslangic in durum:
+            continue
+        yol = []
+        adim = baslangic
+        while adim is not None and adim not in durum:
+            durum[adim] = 'yolda'
+            yol.append(adim)
+            adim = onceki[adim]
+        if adim is not None and durum[adim] == 'yolda':
+            return True
+        for dugum in yol:
+            durum[dugum] = 'bitti'
+    return False
+
+
+def kuyruklu_bellman_ford(graph, baslangic, agirlik_anahtari='weight', izleme=None):
+    """
+    Kuyruk tabanlı Bellman-Ford (SPFA):
+    Her turda bütün kenarları gezmek yerine sadece mesafesi kısalan düğümlerin kenarlarını gevşetir.
+    Dönüş: (mesafeler, onceki, islem_sayisi). Negatif döngü varsa mesafeler ve onceki None olur.
+    İşlem sayısı bellman_ford_analizli gibi kontrol edilen her kenar için bir artar.
+    izleme (Izleme) verilirse kuyruk sayaçları da tutulan ayrı döngü çalışır.
+    """
+    if izleme is not None:
+        return _izlemeli_kuyruklu_bellman_ford(graph, baslangic, agirlik_anahtari, izleme)
+    islem_sayisi = 0
+    dugum_sayisi = graph.number_of_nodes()
+
+    mesafeler = {node: float('infinity') for node in graph.nodes}
+    mesafeler[baslangic] = 0
+    onceki = {node: None for node in graph.nodes}
+    #Rotadaki kenar sayısı: en kısa yol en fazla (Düğüm Sayısı - 1) kenardan oluşabilir
+    kenar_sayisi = {baslangic: 0}
+
+    #Mesafesi kısalmış ve komşularına haber vermesi gereken düğümlerin kuyruğu
+    kuyruk = deque([baslangic])
+    kuyrukta = {baslangic}
+    gevsetme = 0
+
+    while kuyruk:
+        u = kuyruk.popleft()
+        kuyrukta.discard(u)
+
+        for v, data in graph[u].items():
+            islem_sayisi += 1
+            yeni_mesafe = mesafeler[u] + data[agirlik_anahtari]
+            if yeni_mesafe < mesafeler[v]:
+                mesafeler[v] = yeni_mesafe
+                onceki[v] = u
+                kenar_sayisi[v] = kenar_sayisi[u] + 1
+                gevsetme += 1
+
+                #NEGATİF DÖNGÜ KONTROLÜ
+                #Rota düğüm sayısı kadar kenara ulaştıysa bir düğüm iki kez tekrar etmiştir
+                if kenar_sayisi[v] >= dugum_sayisi:
+                    return None, None, islem_sayisi
+                #Ayrıca her (Düğüm Sayısı) gevşetmede bir önceki işaretçilerini dolaşıp döngü arıyoruz,
+                #böylece döngü çoğu zaman kenar sayısı sınırına ulaşmadan çok önce yakalanır
+                if gevsetme % dugum_sayisi == 0 and _onceki_dongusu_var(onceki):
+                    return None, None, islem_sayisi
+
+                if v not in kuyrukta:
+                    kuyruk.append(v)
+                    kuyrukta.add(v)
+
+    return mesafeler, onceki, islem_sayisi
+
+
+def _izlemeli_kuyruklu_bellman_ford(graph, baslangic, agirlik_anahtari, izleme):
+    #kuyruklu_bellman_ford ile aynı döngü; kuyruğa ekleme/çekme ve kuyruğun en büyük boyu da sayılır
+    t0 = time.perf_counter_ns()
+    islem_sayisi = 0
+    dugum_sayisi = graph.number_of_nodes()
+
+    mesafeler = {node: float('infinity') for node in graph.nodes}
+    mesafeler[baslangic] = 0
+    onceki = {node: None for node in graph.nodes}
+    kenar_sayisi = {baslangic: 0}
+
+    kuyruk = deque([baslangic])
+    kuyrukta = {baslangic}
+    gevsetme = 0
+    itme, cekme, en_buyuk = 1, 0, 1
+    negatif_dongu = False
+    t1 = time.perf_counter_ns()
+
+    while kuyruk and not negatif_dongu:
+        u = kuyruk.popleft()
+        cekme += 1
+        kuyrukta.discard(u)
+
+        for v, data in graph[u].items():
+            islem_sayisi += 1
+            yeni_mesafe = mesafeler[u] + data[agirlik_anahtari]
+            if yeni_mesafe < mesafeler[v]:
+                mesafeler[v] = yeni_mesafe
+                onceki[v] = u
+                kenar_sayisi[v] = kenar_sayisi[u] + 1
+                gevsetme += 1
+
+                #NEGATİF DÖNGÜ KONTROLÜ
+                if kenar_sayisi[v] >= dugum_sayisi or \
+                        (gevsetme % dugum_sayisi == 0 and _onceki_dongusu_var(onceki)):
+                    negatif_dongu = True
+                    break
+
+                if v not in kuyrukta:
+                    kuyruk.append(v)
+                    kuyrukta.add(v)
+                    itme += 1
+                    if len(kuyruk) > en_buyuk:
+                        en_buyuk = len(kuyruk)
+
+    izleme.sure_ekle('hazirlik', t1 - t0)
+    izleme.sure_ekle('gevsetme', time.perf_counter_ns() - t1)
+    izleme.topla(itme, cekme, 0, islem_sayisi, gevsetme, 0, en_buyuk)
+    if negatif_dongu:
+        return None, None, islem_sayisi
+    return mesafeler, onceki, islem_sayisi
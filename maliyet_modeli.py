@@ -0,0 +1,102 @@
+import numpy as np
+
+#Trafik cezasının varsayılan katsayısı: tamamen kilitli bir yol (trafik=1.0) 11 kat maliyetli sayılır
+VARSAYILAN_CEZA_KATSAYISI = 10.0
+
+class MaliyetModeli:
+    """
+    Bir kenarın (mesafe, trafik) değerlerinden efektif maliyetini üreten model.
+    Efektif maliyetler trafik değerleri değiştiğinde bir kez düz diziye dökülür,
+    algoritmalar sıcak döngüde formül hesaplamak yerine bu diziyi okur.
+    """
+    #Önbellek anahtarlarında modeli ayırt etmek için kullanılır
+    anahtar = None
+    #Maliyet saf mesafe ise tam sayı ağırlıklar tam sayı maliyet verir
+    tam_sayi_korur = False
+
+    def tek(self, agirlik, trafik):
+        #Tek bir kenarın maliyeti
+        raise NotImplementedError
+
+    def dizi(self, agirliklar, trafikler):
+        #Bütün kenarların maliyeti tek seferde, NumPy dizisi olarak
+        return np.array([self.tek(a, t) for a, t in zip(agirliklar.tolist(), trafikler.tolist())])
+
+    def kenar_maliyeti(self, ozellikler):
+        #NetworkX kenar özellik sözlüğü üzerinden maliyet (sözlük tabanlı algoritmalar için)
+        return self.tek(ozellikler['weight'], ozellikler.get('traffic', 0))
+
+
+class MesafeMaliyeti(MaliyetModeli):
+    """Sadece fiziksel mesafe (weight), trafik görmezden gelinir."""
+    anahtar = 'mesafe'
+    tam_sayi_korur = True
+
+    def tek(self, agirlik, trafik):
+        return agirlik
+
+    def dizi(self, agirliklar, trafikler):
+        return agirliklar
+
+    def kenar_maliyeti(self, ozellikler):
+        return ozellikler['weight']
+
+
+class TrafikCezaliMaliyet(MaliyetModeli):
+    """Maliyet = Mesafe * (1 + (Trafik * Ceza_Katsayısı))"""
+    def __init__(self, ceza_katsayisi=VARSAYILAN_CEZA_KATSAYISI):
+        self.ceza_katsayisi = ceza_katsayisi
+        self.anahtar = ('trafik', ceza_katsayisi)
+
+    def tek(self, agirlik, trafik):
+        return agirlik * (1 + (trafik * self.ceza_katsayisi))
+
+    def dizi(self, agirliklar, trafikler):
+        return agirliklar * (1 + (trafikler * self.ceza_katsayisi))
+
+
+def maliyet_komsulugu(graph, maliyet_modeli):
+    """
+    Sözlük tabanlı Dijkstra döngüleri için {u: {v: efektif maliyet}} komşuluğu.
+    Bütün kenarların maliyeti model.dizi ile tek seferde hesaplanır, döngü kenar başına modeli çağırmaz.
+    Bir yolun trafiği değişince komsuluk_guncelle o kenarı yerinde düzeltir.
+    """
+    agirliklar = []
+    trafikler = []
+    for komsular in graph.adj.values():
+        for ozellikler in komsular.values():
+            agirliklar.append(ozellikler['weight'])
+            trafikler.append(ozellikler.get('traffic', 0))
+    maliyetler = iter(maliyet_modeli.dizi(np.asarray(agirliklar), np.asarray(trafikler, dtype=np.float64)).tolist())
+    return {u: {v: next(maliyetler) for v in komsular} for u, komsular in graph.adj.items()}
+
+
+def komsuluk_guncelle(komsuluk, graph, maliyet_modeli, u, v):
+    #u-v yolunun maliyetini hazır komşulukta yeniden hesaplar (yönsüz ağda iki yönde)
+    maliyet = maliyet_modeli.kenar_maliyeti(graph[u][v])
+    komsuluk[u][v] = maliyet
+    if not graph.is_directed():
+        komsuluk[v][u] = maliyet
+
+
+class OzelMaliyet(MaliyetModeli):
+    """
+    Kullanıcının verdiği fonksiyon(agirlik, trafik) ile hesaplanan maliyet.
+    Fonksiyon NumPy dizileriyle çalışabiliyorsa tüm kenarlar tek çağrıda hesaplanır.
+    """
+    def __init__(self, fonksiyon, anahtar=None):
+        self.fonksiyon = fonksiyon
+        self.anahtar = ('ozel', anahtar if anahtar is not None else id(fonksiyon))
+
+    def tek(self, agirlik, trafik):
+        return self.fonksiyon(agirlik, trafik)
+
+    def dizi(self, agirliklar, trafikler):
+        try:
+            sonuc = np.asarray(self.fonksiyon(agirliklar, trafikler), dtype=np.float64)
+            if sonuc.shape == agirliklar.shape:
+                return sonuc
+        except (TypeError, ValueError):
+            pass
+        #Fonksiyon dizilerle çalışmıyorsa (örneğin içinde if varsa) kenar kenar hesaplıyoruz
+        return super().dizi(agirliklar, trafikler)
@@ -0,0 +1,379 @@
+import asyncio
+import random
+import selectors
+import time
+import networkx as nx
+
+#RIP (RFC 2453) paket düzeni: 4 baytlık başlık + rota başına 20 baytlık kayıt, bir pakette en fazla 25 kayıt
+RIP_BASLIK = 4
+RIP_KAYIT = 20
+RIP_PAKET_KAYDI = 25
+
+UFUKLAR = ('yok', 'bolunmus_ufuk', 'zehirli_geri')
+
+
+class _SanalSecici(selectors.DefaultSelector):
+    #Hazır G/Ç yoksa beklemek yerine sanal saati bekleme süresi kadar ileri alır
+    saat = 0.0
+
+    def select(self, timeout=None):
+        olaylar = super().select(0)
+        if not olaylar and timeout:
+            self.saat += timeout
+        return olaylar
+
+
+class SanalZamanDongusu(asyncio.SelectorEventLoop):
+    """
+    Saati gerçek zaman yerine bir sonraki zamanlayıcıya atlayan olay döngüsü. Kablo gecikmeleri ve
+    periyotlar gerçekte beklenmez; ölçülen yakınsama süresi CPU yükünden bağımsız, tekrarlanabilir bir
+    simülasyon süresidir ve binlerce yönlendiricide bile paketler gecikme sırasıyla teslim edilir.
+    """
+    def __init__(self):
+        self._secici = _SanalSecici()
+        super().__init__(self._secici)
+
+    def time(self):
+        return self._secici.saat
+
+
+class Yonlendirici:
+    """
+    Mesafe vektörü simülasyonundaki tek bir yönlendirici; kendi asyncio görevinde gelen kutusunu dinler.
+    Komşulardan son alınan vektörler saklanır ve her hedefin rotası bu vektörlerden Bellman-Ford
+    denklemiyle seçilir: min(kablo maliyeti + komşunun ilan ettiği metrik).
+    """
+    def __init__(self, ad, simulasyon):
+        self.ad = ad
+        self.sim = simulasyon
+        #komsu -> (kablo maliyeti, kablo gecikmesi saniye)
+        self.komsular = {}
+        self.komsu_vektorleri = {}
+        #hedef -> (metrik, sonraki atlama); ulaşılamayan hedefler (sonsuz, None) olarak kalır
+        self.tablo = {ad: (0, ad)}
+        #Son tetiklemeli güncellemeden beri değişen hedefler -> değişimden önceki sonraki atlama
+        self.degisenler = {ad: None}
+        self.tetik_bekliyor = False
+        self.gelen = asyncio.Queue()
+
+    async def calis(self):
+        gelen = self.gelen
+        while True:
+            gonderen, vektor, tam = await gelen.get()
+            self._vektor_al(gonderen, vektor, tam)
+            self.sim._is_bitti()
+
+    async def periyodik(self, periyot, rng):
+        #RIP gibi periyodik tam tablo; yönlendiriciler senkronlanmasın diye aralık +-%50 titretilir
+        while True:
+            await asyncio.sleep(periyot * rng.uniform(0.5, 1.5))
+            self._gonder(self.tablo, None, tam=True)
+
+    def _vektor_al(self, gonderen, vektor, tam):
+        if gonderen not in self.komsular:
+            #Kopan kablodan gecikmeyle gelen paket
+            return
+        eski = self.komsu_vektorleri[gonderen]
+        if tam:
+            #Tam tabloda bulunmayan hedefler komşu tarafından geri çekilmiş sayılır
+            for hedef in set(eski).difference(vektor):
+                del eski[hedef]
+                self._rota_sec(hedef)
+        eski.update(vektor)
+
+        maliyet = self.komsular[gonderen][0]
+        tablo = self.tablo
+        for hedef, metrik in vektor.items():
+            mevcut = tablo.get(hedef)
+            aday = maliyet + metrik
+            if mevcut is None or mevcut[1] is None or (mevcut[1] != gonderen and aday < mevcut[0]):
+                #Hızlı yol: gönderen daha iyi bir rota getirdiyse komşuları taramadan ona geçilir
+                if aday < self.sim.sonsuz:
+                    self._rota_yaz(hedef, mevcut, aday, gonderen)
+            elif mevcut[1] == gonderen and aday != mevcut[0]:
+                #Kullandığımız rota değişti; kötüleştiyse başka bir komşu artık daha iyi olabilir
+                self._rota_sec(hedef)
+
+    def _rota_sec(self, hedef):
+        if hedef == self.ad:
+            return
+        sonsuz = self.sim.sonsuz
+        eski = self.tablo.get(hedef)
+        #Eşit maliyette mevcut sonraki atlama korunur, rota boşuna salınmaz
+        en_iyi, sonraki = sonsuz, None
+        if eski is not None and eski[1] in self.komsular:
+            aday = self.komsular[eski[1]][0] + self.komsu_vektorleri[eski[1]].get(hedef, sonsuz)
+            if aday < sonsuz:
+                en_iyi, sonraki = aday, eski[1]
+        for komsu, (maliyet, _) in self.komsular.items():
+            aday = maliyet + self.komsu_vektorleri[komsu].get(hedef, sonsuz)
+            if aday < en_iyi:
+                en_iyi, sonraki = aday, komsu
+
+        if eski == (en_iyi, sonraki) or (eski is None and sonraki is None):
+            return
+        self._rota_yaz(hedef, eski, en_iyi, sonraki)
+
+    def _rota_yaz(self, hedef, eski, metrik, sonraki):
+        self.tablo[hedef] = (metrik, sonraki)
+        if hedef not in self.degisenler:
+            self.degisenler[hedef] = eski[1] if eski is not None else None
+        self.sim._rota_degisti()
+        if self.sim.tetiklemeli:
+            self._tetikle()
+
+    def _tetikle(self):
+        #Kısa süre içindeki değişiklikler tek bir tetiklemeli güncellemede toplanır
+        if self.tetik_bekliyor:
+            return
+        self.tetik_bekliyor = True
+        self.sim._is_basladi()
+        self.sim._zamanla(self.sim.tetik_gecikmesi, Yonlendirici._tetik_zamani, self)
+
+    def _tetik_zamani(self):
+        self.tetik_bekliyor = False
+        degisenler, self.degisenler = self.degisenler, {}
+        self._gonder(degisenler, degisenler, tam=False)
+        self.sim._is_bitti()
+
+    def _gonder(self, hedefler, eski_atlamalar, tam):
+        sim = self.sim
+        ufuk, sonsuz, tablo = sim.ufuk, sim.sonsuz, self.tablo
+        #Vektör bütün komşular için aynıdır, sadece rotası o komşudan geçen hedefler farklılaşır;
+        #ortak vektör bir kez kurulur ve alıcılar onu sadece okuduğu için paylaşılır
+        ortak = {}
+        komsu_uzerinden = {}
+        for hedef in hedefler:
+            metrik, sonraki = tablo[hedef]
+            ortak[hedef] = metrik
+            if ufuk != 'yok' and sonraki != self.ad and sonraki is not None:
+                komsu_uzerinden.setdefault(sonraki, []).append(hedef)
+
+        for komsu, (_, gecikme) in self.komsular.items():
+            vektor = ortak
+            ozel = komsu_uzerinden.get(komsu)
+            if ozel:
+                vektor = dict(ortak)
+                for hedef in ozel:
+                    if ufuk == 'zehirli_geri':
+                        vektor[hedef] = sonsuz
+                    #Bölünmüş ufuk: rota bu komşuya yeni döndüyse komşu eski ilanımızı hala tutuyordur; RIP'te bu
+                    #kayıt zaman aşımıyla silinir, tetiklemeli güncellemelerde onun yerine bir kez geri çekiyoruz
+                    elif tam or eski_atlamalar[hedef] in (None, komsu):
+                        del vektor[hedef]
+                    else:
+                        vektor[hedef] = sonsuz
+            if vektor or tam:
+                sim._ilet(self.ad, komsu, gecikme, vektor, tam)
+
+
+class MesafeVektoruSimulasyonu:
+    """
+    RIP benzeri asenkron mesafe vektörü protokolü. Her yönlendirici ayrı bir asyncio görevidir;
+    vektörler kablo gecikmesi kadar sonra komşunun gelen kutusuna düşer. Tek süreçte binlerce
+    yönlendirici çalışabilir, çünkü bekleyen paketler iş parçacığı değil zamanlayıcı kaydıdır.
+    ufuk: 'yok', 'bolunmus_ufuk' (split horizon) ya da 'zehirli_geri' (poison reverse).
+    tetiklemeli=True ise rota değişiklikleri tetik_gecikmesi saniye toplanıp sadece değişen rotalarla
+    ilan edilir (RIP'teki tetik sönümlemesi; 0 her değişikliği ayrı pakette gönderir ve mesaj sayısını
+    1000 düğümlü ağda iki katından fazla artırır); periyot (saniye) verilirse ayrıca periyodik tam tablo gönderilir.
+    metrik: 'agirlik' (kablo ağırlığı) ya da 'atlama' (RIP'teki gibi her kablo 1).
+    gecikme(u, v, ozellikler) kablo gecikmesini saniye olarak döndürür; verilmezse ağırlık * zaman_olcegi.
+    sonsuz: ulaşılamaz metriği; verilmezse 'atlama'da RIP'teki 16, 'agirlik'ta bütün kablo maliyetlerinin
+    toplamı + 1 (hiçbir gerçek yol buna ulaşamaz).
+    """
+    def __init__(self, graph, ufuk='zehirli_geri', tetiklemeli=True, periyot=None, metrik='agirlik',
+                 gecikme=None, zaman_olcegi=0.001, sonsuz=None, tetik_gecikmesi=0.01, seed=42):
+        if ufuk not in UFUKLAR:
+            raise ValueError(f"Bilinmeyen ufuk kuralı: {ufuk}")
+        if metrik not in ('agirlik', 'atlama'):
+            raise ValueError(f"Bilinmeyen metrik: {metrik}")
+        if not tetiklemeli and periyot is None:
+            raise ValueError("Tetiklemeli güncelleme kapalıyken periyot verilmelidir")
+        self.ufuk = ufuk
+        self.tetiklemeli = tetiklemeli
+        self.periyot = periyot
+        self.tetik_gecikmesi = tetik_gecikmesi
+        self._rng = random.Random(seed)
+
+        maliyet = (lambda ozellikler: 1) if metrik == 'atlama' else (lambda ozellikler: ozellikler['weight'])
+        if gecikme is None:
+            gecikme = lambda u, v, ozellikler: ozellikler['weight'] * zaman_olcegi
+        if sonsuz is None:
+            sonsuz = 16 if metrik == 'atlama' else sum(maliyet(d) for _, _, d in graph.edges(data=True)) + 1
+        self.sonsuz = sonsuz
+
+        self.yonlendiriciler = {}
+        for dugum in graph.nodes:
+            self.yonlendiriciler[dugum] = Yonlendirici(dugum, self)
+        for u, v, ozellikler in graph.edges(data=True):
+            if u == v:
+                continue
+            bilgi = (maliyet(ozellikler), gecikme(u, v, ozellikler))
+            for a, b in ((u, v), (v, u)):
+                self.yonlendiriciler[a].komsular[b] = bilgi
+                self.yonlendiriciler[a].komsu_vektorleri[b] = {}
+        self.en_buyuk_gecikme = max((b[1] for y in self.yonlendiriciler.values() for b in y.komsular.values()),
+                                    default=0)
+
+        self.mesaj = 0
+        self.bayt = 0
+        self.rota_degisimi = 0
+        self.son_degisim = None
+        self._bekleyen = 0
+        self._zamanlananlar = {}
+        self._gorevler = []
+        self._sakin = None
+        self._evre = None
+
+    def _is_basladi(self):
+        self._bekleyen += 1
+        self._sakin.clear()
+
+    def _is_bitti(self):
+        self._bekleyen -= 1
+        if self._bekleyen == 0:
+            self._sakin.set()
+
+    def _rota_degisti(self):
+        self.rota_degisimi += 1
+        self.son_degisim = asyncio.get_running_loop().time()
+
+    def _ilet(self, gonderen, alici, gecikme, vektor, tam):
+        kayit = len(vektor)
+        paket = max(1, -(-kayit // RIP_PAKET_KAYDI))
+        self.mesaj += paket
+        self.bayt += paket * RIP_BASLIK + kayit * RIP_KAYIT
+        self._is_basladi()
+        self._zamanla(gecikme, self.yonlendiriciler[alici].gelen.put_nowait, (gonderen, vektor, tam))
+
+    def _zamanla(self, gecikme, geri_cagri, arguman):
+        #Aynı ana düşen işler tek zamanlayıcıda toplanır; paket başına bir TimerHandle açmak büyük
+        #ağlarda olay döngüsünün zamanlayıcı yığınını simülasyonun kendisinden pahalı yapar
+        dongu = asyncio.get_running_loop()
+        zaman = dongu.time() + gecikme
+        isler = self._zamanlananlar.get(zaman)
+        if isler is None:
+            isler = self._zamanlananlar[zaman] = []
+            dongu.call_at(zaman, self._zamani_gelenler, zaman)
+        isler.append((geri_cagri, arguman))
+
+    def _zamani_gelenler(self, zaman):
+        for geri_cagri, arguman in self._zamanlananlar.pop(zaman):
+            geri_cagri(arguman)
+
+    def _evre_ac(self):
+        if self._evre is None:
+            self._evre = (asyncio.get_running_loop().time(), time.perf_counter(),
+                          self.mesaj, self.bayt, self.rota_degisimi)
+
+    def baslat(self):
+        #Çalışan bir olay döngüsü içinde çağrılır; her yönlendirici önce sadece kendini ilan eder
+        self._sakin = asyncio.Event()
+        self._sakin.set()
+        self._evre_ac()
+        for yonlendirici in self.yonlendiriciler.values():
+            self._gorevler.append(asyncio.create_task(yonlendirici.calis()))
+            if self.periyot is not None:
+                self._gorevler.append(asyncio.create_task(yonlendirici.periyodik(self.periyot, self._rng)))
+            if self.tetiklemeli:
+                yonlendirici._tetikle()
+
+    async def yakinsa(self, zaman_asimi=None):
+        """
+        Ağ sakinleşene kadar bekler ve bu evrenin (başlangıçtan ya da son kablo kopmasından beri) ölçümlerini döndürür:
+        yakinsama_s (son rota değişikliğine kadar geçen süre, olay döngüsünün saatiyle), gercek_s (duvar saati),
+        mesaj (RIP paketi), bayt, rota_degisimi.
+        Sadece tetiklemeli modda ağ tamamen susar; periyodik modda 1.5 periyot boyunca hiçbir rota değişmezse yakınsamış sayılır.
+        """
+        if not self._gorevler:
+            self.baslat()
+        self._evre_ac()
+        baslangic, gercek, mesaj, bayt, degisim = self._evre
+        await asyncio.wait_for(self._sessizlik(baslangic), zaman_asimi)
+        self._evre = None
+        son = self.son_degisim if self.son_degisim is not None and self.son_degisim > baslangic else baslangic
+        return {
+            'yakinsama_s': son - baslangic,
+            'gercek_s': time.perf_counter() - gercek,
+            'mesaj': self.mesaj - mesaj,
+            'bayt': self.bayt - bayt,
+            'rota_degisimi': self.rota_degisimi - degisim,
+        }
+
+    async def _sessizlik(self, baslangic):
+        if self.periyot is None:
+            await self._sakin.wait()
+            return
+        sessizlik = 1.5 * self.periyot + self.en_buyuk_gecikme
+        dongu = asyncio.get_running_loop()
+        while True:
+            son = max(baslangic, self.son_degisim or baslangic)
+            kalan = son + sessizlik - dongu.time()
+            if kalan <= 0:
+                return
+            await asyncio.sleep(kalan)
+
+    def baglanti_kopar(self, u, v):
+        #Kablonun iki ucu kopmayı hemen fark eder (RIP'teki 180 saniyelik zaman aşımı beklenmez)
+        self._evre_ac()
+        for a, b in ((u, v), (v, u)):
+            yonlendirici = self.yonlendiriciler[a]
+            del yonlendirici.komsular[b]
+            del yonlendirici.komsu_vektorleri[b]
+            for hedef, (_, sonraki) in list(yonlendirici.tablo.items()):
+                if sonraki == b:
+                    yonlendirici._rota_sec(hedef)
+
+    async def durdur(self):
+        for gorev in self._gorevler:
+            gorev.cancel()
+        await asyncio.gather(*self._gorevler, return_exceptions=True)
+        self._gorevler = []
+
+    def tablo(self, yonlendirici):
+        #{hedef: (metrik, sonraki atlama)}; ulaşılamayan hedeflerin metriği sonsuz'dur
+        return dict(self.yonlendiriciler[yonlendirici].tablo)
+
+    def mesafe(self, kaynak, hedef):
+        metrik, sonraki = self.yonlendiriciler[kaynak].tablo.get(hedef, (self.sonsuz, None))
+        return float('infinity') if sonraki is None else metrik
+
+
+def baglanti_kopmasi_senaryosu(graph, kopacak_baglanti=None, zaman_asimi=None, sanal_zaman=True, **ayarlar):
+    """
+    Simülasyonu baştan yakınsatır; kopacak_baglanti (u, v) verilirse kabloyu koparıp tekrar yakınsatır.
+    sanal_zaman=True ise SanalZamanDongusu kullanılır, False ise gecikmeler gerçekten beklenir.
+    ayarlar MesafeVektoruSimulasyonu'na aktarılır.
+    Dönüş: {'ilk': ölçümler, 'kopma': ölçümler ya da None, 'simulasyon': yakınsamış tablolarıyla simülasyon}
+    """
+    async def calistir():
+        sim = MesafeVektoruSimulasyonu(graph, **ayarlar)
+        try:
+            ilk = await sim.yakinsa(zaman_asimi)
+            kopma = None
+            if kopacak_baglanti is not None:
+                sim.baglanti_kopar(*kopacak_baglanti)
+                kopma = await sim.yakinsa(zaman_asimi)
+        finally:
+            await sim.durdur()
+        return {'ilk': ilk, 'kopma': kopma, 'simulasyon': sim}
+    if not sanal_zaman:
+        return asyncio.run(calistir())
+    dongu = SanalZamanDongusu()
+    try:
+        return dongu.run_until_complete(calistir())
+    finally:
+        dongu.close()
+
+
+def sayma_sonsuza_senaryosu(ufuk='yok', uzunluk=3, **ayarlar):
+    """
+    Sonsuza sayma (count-to-infinity): R0 - R1 - ... zincirinde R0-R1 kablosu koptuğunda, ufuk kuralı yoksa
+    R1 ve R2 eski rotaları birbirine ilan ederek R0'ın metriğini sonsuz'a kadar adım adım artırır.
+    Bölünmüş ufuk ya da zehirli geri bu döngüyü keser; kopma evresindeki rota_degisimi farkı gösterir.
+    Varsayılan metrik RIP'teki gibi atlama sayısı, sonsuz 16'dır.
+    """
+    ayarlar.setdefault('metrik', 'atlama')
+    zincir = nx.path_graph([f"R{i}" for i in range(uzunluk)])
+    nx.set_edge_attributes(zincir, 1, 'weight')
+    return baglanti_kopmasi_senaryosu(zincir, ('R0', 'R1'), ufuk=ufuk, **ayarlar)
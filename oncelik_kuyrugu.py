@@ -0,0 +1,216 @@
+import heapq
+
+class IkiliYigin:
+    """
+    heapq üzerine kurulu klasik ikili yığın. Ondalıklı ağırlıklar için tek seçenektir.
+    Bütün kuyruklar aynı arayüzü sunar: ekle(anahtar, dugum), cek() -> (anahtar, dugum), len().
+    """
+    def __init__(self, en_buyuk_agirlik=None):
+        self.yigin = []
+
+    def ekle(self, anahtar, dugum):
+        heapq.heappush(self.yigin, (anahtar, dugum))
+
+    def cek(self):
+        return heapq.heappop(self.yigin)
+
+    def __len__(self):
+        return len(self.yigin)
+
+
+class IndeksliYigin:
+    """
+    Gerçek decrease-key destekli indeksli ikili yığın. Her düğüm kuyrukta en fazla bir kez bulunur,
+    konum sözlüğü düğümün dizideki yerini tutar. Daha kısa bir mesafeyle tekrar ekle() çağrıldığında
+    yeni kayıt açılmaz, mevcut kaydın anahtarı küçültülüp yukarı kaydırılır; bayat kayıt hiç oluşmaz.
+    """
+    def __init__(self, en_buyuk_agirlik=None):
+        self.anahtarlar = []
+        self.dugumler = []
+        self.konum = {}
+
+    def ekle(self, anahtar, dugum):
+        i = self.konum.get(dugum)
+        if i is None:
+            i = len(self.dugumler)
+            self.anahtarlar.append(anahtar)
+            self.dugumler.append(dugum)
+        elif anahtar >= self.anahtarlar[i]:
+            return
+        self._yukari(i, anahtar, dugum)
+
+    def _yukari(self, i, anahtar, dugum):
+        #Boşluğu (hole) yukarı taşıyıp elemanı en sonda tek seferde yerine yazıyoruz
+        anahtarlar, dugumler, konum = self.anahtarlar, self.dugumler, self.konum
+        while i > 0:
+            ebeveyn = (i - 1) >> 1
+            if anahtarlar[ebeveyn] <= anahtar:
+                break
+            anahtarlar[i] = anahtarlar[ebeveyn]
+            tasinan = dugumler[ebeveyn]
+            dugumler[i] = tasinan
+            konum[tasinan] = i
+            i = ebeveyn
+        anahtarlar[i] = anahtar
+        dugumler[i] = dugum
+        konum[dugum] = i
+
+    def cek(self):
+        anahtarlar, dugumler, konum = self.anahtarlar, self.dugumler, self.konum
+        en_kucuk_anahtar, en_kucuk = anahtarlar[0], dugumler[0]
+        del konum[en_kucuk]
+        anahtar, dugum = anahtarlar.pop(), dugumler.pop()
+        n = len(dugumler)
+        if n:
+            #Son eleman köke konup aşağı kaydırılır
+            i = 0
+            while True:
+                cocuk = 2 * i + 1
+                if cocuk >= n:
+                    break
+                if cocuk + 1 < n and anahtarlar[cocuk + 1] < anahtarlar[cocuk]:
+                    cocuk += 1
+                if anahtarlar[cocuk] >= anahtar:
+                    break
+                anahtarlar[i] = anahtarlar[cocuk]
+                tasinan = dugumler[cocuk]
+                dugumler[i] = tasinan
+                konum[tasinan] = i
+                i = cocuk
+            anahtarlar[i] = anahtar
+            dugumler[i] = dugum
+            konum[dugum] = i
+        return en_kucuk_anahtar, en_kucuk
+
+    def __len__(self):
+        return len(self.dugumler)
+
+
+class DialKovalari:
+    """
+    Dial'in dairesel kova kuyruğu: 0..C tam sayı ağırlıklarda her mesafe değeri için bir kova vardır.
+    Dijkstra'da kuyruktaki anahtarlar her zaman [mevcut, mevcut + C] aralığında kaldığı için
+    C + 1 kova yeterlidir. Ekleme O(1), çekme boş kovaları geçmek kadar sürer.
+    """
+    def __init__(self, en_buyuk_agirlik):
+        self.boy = en_buyuk_agirlik + 1
+        self.kovalar = [[] for _ in range(self.boy)]
+        self.mevcut = 0
+        self.adet = 0
+
+    def ekle(self, anahtar, dugum):
+        self.kovalar[anahtar % self.boy].append(dugum)
+        self.adet += 1
+
+    def cek(self):
+        kovalar, boy = self.kovalar, self.boy
+        anahtar = self.mevcut
+        kova = kovalar[anahtar % boy]
+        while not kova:
+            anahtar += 1
+            kova = kovalar[anahtar % boy]
+        self.mevcut = anahtar
+        self.adet -= 1
+        return anahtar, kova.pop()
+
+    def __len__(self):
+        return self.adet
+
+
+class RadixYigini:
+    """
+    Tekdüze (monoton) tam sayı anahtarlar için radix yığını. Bir anahtar, son çekilen anahtarla
+    farklılaştığı en yüksek bite göre kovalanır; en küçük dolu kova boşaltılırken elemanları
+    daha alt kovalara dağılır. Maliyet ağırlık üst sınırının logaritmasıyla büyür, C'den bağımsızdır.
+    """
+    def __init__(self, en_buyuk_agirlik=None):
+        self.kovalar = [[]]
+        self.son = 0
+        self.adet = 0
+
+    def ekle(self, anahtar, dugum):
+        kova = (anahtar ^ self.son).bit_length()
+        kovalar = self.kovalar
+        while len(kovalar) <= kova:
+            kovalar.append([])
+        kovalar[kova].append((anahtar, dugum))
+        self.adet += 1
+
+    def cek(self):
+        kovalar = self.kovalar
+        if not kovalar[0]:
+            i = 1
+            while not kovalar[i]:
+                i += 1
+            #En küçük dolu kovanın minimumu yeni referans olur, kovadaki herkes daha alta iner
+            dagitilan = kovalar[i]
+            kovalar[i] = []
+            son = min(anahtar for anahtar, _ in dagitilan)
+            self.son = son
+            for anahtar, dugum in dagitilan:
+                kovalar[(anahtar ^ son).bit_length()].append((anahtar, dugum))
+        self.adet -= 1
+        return kovalar[0].pop()
+
+    def __len__(self):
+        return self.adet
+
+
+KUYRUKLAR = {
+    'heapq': IkiliYigin,
+    'indeksli': IndeksliYigin,
+    'dial': DialKovalari,
+    'radix': RadixYigini,
+}
+
+
+def agirlik_bilgisi(graph, agirlik_anahtari='weight'):
+    #Ağırlıkların hepsi negatif olmayan (Python) tam sayı mı ve en büyüğü kaç
+    en_buyuk = 0
+    for _, _, agirlik in graph.edges(data=agirlik_anahtari):
+        if not isinstance(agirlik, int) or agirlik < 0:
+            return False, None
+        if agirlik > en_buyuk:
+            en_buyuk = agirlik
+    return True, en_buyuk
+
+
+def kuyruk_sec(tam_sayi, en_buyuk_agirlik, dugum_sayisi):
+    """
+    Ağırlık türüne göre kuyruk adını seçer: en büyük ağırlığı düğüm sayısını geçmeyen tam sayı
+    ağırlıklarda 'dial', diğer durumlarda 'heapq'. 'indeksli' yığın bellek için seçilir, hız için değil
+    (bkz. yigin_bellegini_olc), bu yüzden otomatik seçilmez.
+    Dial'in C + 1 kovayı kurması ve boş kovaları taraması C ile büyür; C düğüm sayısını aştığında
+    heapq'nun C ile yazılmış log n işlemleri öne geçer. Radix yığını ölçümlerde (kuyruk_gecisini_olc)
+    CPython'da heapq'yu hiçbir C değerinde belirgin geçemediği için sadece açıkça istenirse kullanılır.
+    """
+    if tam_sayi and en_buyuk_agirlik <= dugum_sayisi:
+        return 'dial'
+    return 'heapq'
+
+
+def kuyruklu_dijkstra(graph, baslangic, hedef, kuyruk, maliyet=None):
+    """
+    Öncelik kuyruğu değiştirilebilen sözlük tabanlı Dijkstra. kuyruk: KUYRUKLAR'daki sınıflardan bir nesne.
+    maliyet(ozellikler) verilmezse kenar maliyeti 'weight' özelliğidir.
+    Dönüş: (mesafeler, onceki) sözlükleri; hedef kuyruktan çıktığında arama biter.
+    """
+    mesafeler = {node: float('infinity') for node in graph.nodes}
+    mesafeler[baslangic] = 0
+    onceki = {node: None for node in graph.nodes}
+    ekle, cek = kuyruk.ekle, kuyruk.cek
+    ekle(0, baslangic)
+
+    while kuyruk:
+        mevcut_mesafe, mevcut_dugum = cek()
+        if mevcut_dugum == hedef: break
+        #İndeksli yığında bayat kayıt oluşmaz, bu kontrol sadece tembel silmeli kuyruklar içindir
+        if mevcut_mesafe > mesafeler[mevcut_dugum]: continue
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            yeni_mesafe = mevcut_mesafe + (ozellikler['weight'] if maliyet is None else maliyet(ozellikler))
+            if yeni_mesafe < mesafeler[komsu]:
+                mesafeler[komsu] = yeni_mesafe
+                onceki[komsu] = mevcut_dugum
+                ekle(yeni_mesafe, komsu)
+    return mesafeler, onceki
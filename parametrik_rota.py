@@ -0,0 +1,234 @@
+import bisect
+import heapq
+from cok_yollu import _hedefe_mesafeler
+
+#Trafik cezalı maliyet iki ölçütün doğrusal birleşimidir:
+#  mesafe * (1 + trafik * c) = mesafe + c * (mesafe * trafik)
+#Bir yolun (toplam mesafe, toplam trafik yükü) ikilisi bilinirse her c için maliyeti aramasız hesaplanır.
+
+
+def trafik_yuku(ozellikler):
+    return ozellikler['weight'] * ozellikler.get('traffic', 0)
+
+
+def yol_olcutleri(graph, yol):
+    #Bir yolun (toplam mesafe, toplam trafik yükü) ikilisi
+    mesafe = yuk = 0
+    for u, v in zip(yol, yol[1:]):
+        mesafe += graph[u][v]['weight']
+        yuk += trafik_yuku(graph[u][v])
+    return mesafe, yuk
+
+
+def _iki_olcutlu_dijkstra(graph, kaynak, hedef, anahtar):
+    """
+    Yolları anahtar(mesafe, yuk) demetine göre karşılaştıran Dijkstra; eşitlikleri bozmak için ikinci bir ölçüt
+    verilebilir, ör. (mesafe + c * yuk, yuk). Dönüş: (mesafe, yuk, yol) ya da hedefe yol yoksa None.
+    """
+    olcutler = {kaynak: (0, 0)}
+    en_iyi = {kaynak: anahtar(0, 0)}
+    onceki = {kaynak: None}
+    kesinlesen = set()
+    pq = [(en_iyi[kaynak], kaynak)]
+    while pq:
+        _, mevcut_dugum = heapq.heappop(pq)
+        if mevcut_dugum in kesinlesen: continue
+        kesinlesen.add(mevcut_dugum)
+        if mevcut_dugum == hedef: break
+        mesafe, yuk = olcutler[mevcut_dugum]
+
+        for komsu, ozellikler in graph[mevcut_dugum].items():
+            if komsu in kesinlesen: continue
+            w = ozellikler['weight']
+            yeni = (mesafe + w, yuk + w * ozellikler.get('traffic', 0))
+            yeni_anahtar = anahtar(*yeni)
+            if komsu not in en_iyi or yeni_anahtar < en_iyi[komsu]:
+                en_iyi[komsu] = yeni_anahtar
+                olcutler[komsu] = yeni
+                onceki[komsu] = mevcut_dugum
+                heapq.heappush(pq, (yeni_anahtar, komsu))
+
+    if hedef not in kesinlesen:
+        return None
+    yol = []
+    adim = hedef
+    while adim is not None:
+        yol.append(adim)
+        adim = onceki[adim]
+    yol.reverse()
+    return olcutler[hedef][0], olcutler[hedef][1], yol
+
+
+def destekli_rotalar(graph, kaynak, hedef, ceza_araligi=(0, None), tolerans=1e-9):
+    """
+    Aralıktaki bir katsayıda en iyi olan bütün yollar (alt zarf), ikiye bölme (dichotomic) aramasıyla.
+    Önce aralığın iki ucundaki en iyi yollar bulunur; komşu iki yolun maliyetlerinin eşitlendiği c'de tek bir
+    Dijkstra ya ikisinden de ucuz yeni bir yol bulur (araya eklenir) ya da ikisinin zarfta komşu olduğunu kanıtlar.
+    Toplam Dijkstra sayısı zarftaki yol sayısının yaklaşık iki katıdır, taranan katsayı sayısından bağımsızdır.
+    Dönüş: [(mesafe, trafik_yuku, yol), ...] c arttıkça en iyi olan sırayla.
+    """
+    c_alt, c_ust = ceza_araligi
+    #Eşitlikte aralığın başında sonraki c'ler için iyi olan (az yüklü), sonunda önceki c'ler için iyi olan (çok yüklü) seçilir
+    sol = _iki_olcutlu_dijkstra(graph, kaynak, hedef, lambda m, y: (m + c_alt * y, y))
+    if sol is None:
+        return []
+    if c_ust is None:
+        sag = _iki_olcutlu_dijkstra(graph, kaynak, hedef, lambda m, y: (y, m))
+    else:
+        sag = _iki_olcutlu_dijkstra(graph, kaynak, hedef, lambda m, y: (m + c_ust * y, -y))
+    if sag[1] >= sol[1]:
+        return [sol]
+
+    zarf = [sol]
+    #Özyineleme yerine yığınla, sağa doğru sırayla (sol, sag) yol çiftlerini inceliyoruz
+    yigin = [sag]
+    while yigin:
+        p, q = zarf[-1], yigin[-1]
+        c = (q[0] - p[0]) / (p[1] - q[1])
+        r = _iki_olcutlu_dijkstra(graph, kaynak, hedef, lambda m, y: (m + c * y, y))
+        esik = p[0] + c * p[1]
+        if r[0] + c * r[1] < esik - tolerans * max(1.0, abs(esik)) and p[1] > r[1] > q[1]:
+            yigin.append(r)
+        else:
+            zarf.append(yigin.pop())
+    return zarf
+
+
+def _etiketler(graph, kaynak, hedef, c_alt, c_ust, bilinenler=()):
+    """
+    İki ölçütlü etiket kurma (Martins) araması. Her etiket bir kısmi yoldur: [mesafe, yuk, dugum, ebeveyn, canli,
+    alt, ust]; alt ve ust yolun aralığın iki ucundaki (c_alt ve c_ust) maliyetidir, c_ust None ise ust trafik yüküdür.
+    Maliyet c'ye göre doğrusal olduğu için aralığın iki ucunda da başka bir etiketten kötü olan etiket aralığın
+    hiçbir yerinde en iyi olamaz ve budanır. Aynı düğümdeki etiketler ve hedefe ulaşmış etiketler buna göre
+    karşılaştırılır; hedefe kalan mesafe için iki uçtaki maliyetlerle birer ters Dijkstra alt sınır verir.
+    bilinenler: önceden bilinen (mesafe, yuk, yol) hedef yolları (ör. destekli_rotalar); budama ilk etiketten başlar.
+    Dönüş: bilinenler dışında bulunan hedef etiketleri.
+    """
+    if c_ust is None:
+        ust_maliyet = trafik_yuku
+    else:
+        ust_maliyet = lambda ozellikler: ozellikler['weight'] * (1 + ozellikler.get('traffic', 0) * c_ust)
+    kalan_alt, _ = _hedefe_mesafeler(graph, hedef, lambda ozellikler: ozellikler['weight'] * (1 + ozellikler.get('traffic', 0) * c_alt))
+    kalan_ust, _ = _hedefe_mesafeler(graph, hedef, ust_maliyet)
+    if kaynak not in kalan_alt:
+        return []
+
+    #Kesinleşmiş hedef etiketleri: alt maliyetler artan, ust maliyetler azalan sırada (merdiven)
+    hedef_alt, hedef_ust = [], []
+    for mesafe, yuk, _ in sorted(bilinenler, key=lambda kayit: kayit[0] + c_alt * kayit[1]):
+        hedef_alt.append(mesafe + c_alt * yuk)
+        hedef_ust.append(yuk if c_ust is None else mesafe + c_ust * yuk)
+    def yenik(alt, ust):
+        #Bulunmuş bir hedef etiketi iki uçta da en az bu kadar iyi mi
+        i = bisect.bisect_right(hedef_alt, alt)
+        return i > 0 and hedef_ust[i - 1] <= ust
+
+    baslangic = [0, 0, kaynak, None, True, 0, 0]
+    dugum_etiketleri = {kaynak: [baslangic]}
+    bulunan = []
+    sayac = 0
+    #Kuyruk (alt, ust) sırasıyla boşalır; çekilen canlı bir etiketi daha sonra gelen bir etiket yenemez
+    pq = [(0, 0, sayac, baslangic)]
+    while pq:
+        alt, ust, _, etiket = heapq.heappop(pq)
+        if not etiket[4]:
+            continue
+        mesafe, yuk, dugum = etiket[0], etiket[1], etiket[2]
+        if dugum == hedef:
+            if not yenik(alt, ust):
+                #Bilinen yollar merdivende önceden durduğu için yeni etiket araya girebilir
+                i = bisect.bisect_right(hedef_alt, alt)
+                hedef_alt.insert(i, alt)
+                hedef_ust.insert(i, ust)
+                bulunan.append(etiket)
+            continue
+        #Etiket kuyruktayken daha iyi bir hedef etiketi bulunmuş olabilir
+        if yenik(alt + kalan_alt[dugum], ust + kalan_ust[dugum]):
+            etiket[4] = False
+            continue
+
+        for komsu, ozellikler in graph[dugum].items():
+            if komsu not in kalan_alt:
+                continue
+            w = ozellikler['weight']
+            wt = w * ozellikler.get('traffic', 0)
+            yeni_mesafe, yeni_yuk = mesafe + w, yuk + wt
+            yeni_alt = yeni_mesafe + c_alt * yeni_yuk
+            yeni_ust = yeni_yuk if c_ust is None else yeni_mesafe + c_ust * yeni_yuk
+            if yenik(yeni_alt + kalan_alt[komsu], yeni_ust + kalan_ust[komsu]):
+                continue
+
+            etiketler = dugum_etiketleri.setdefault(komsu, [])
+            if any(e[5] <= yeni_alt and e[6] <= yeni_ust for e in etiketler):
+                continue
+            #Yeni etiketin iki uçta da yendiği eski etiketler silinir (kuyrukta kalanlar çekilince atlanır)
+            kalanlar = []
+            for e in etiketler:
+                if yeni_alt <= e[5] and yeni_ust <= e[6]:
+                    e[4] = False
+                else:
+                    kalanlar.append(e)
+            yeni = [yeni_mesafe, yeni_yuk, komsu, etiket, True, yeni_alt, yeni_ust]
+            kalanlar.append(yeni)
+            dugum_etiketleri[komsu] = kalanlar
+            sayac += 1
+            heapq.heappush(pq, (yeni_alt, yeni_ust, sayac, yeni))
+    return bulunan
+
+
+def _etiket_yolu(etiket):
+    yol = []
+    while etiket is not None:
+        yol.append(etiket[2])
+        etiket = etiket[3]
+    yol.reverse()
+    return yol
+
+
+class ParametrikRota:
+    """
+    Bir kaynak-hedef çifti için ceza katsayısı aralığındaki bütün en iyi rotalar ve rotanın değiştiği kırılma noktaları.
+    Her c için en iyi rota (mesafe, trafik yükü) doğrularının alt zarfıdır; bir kez hesaplandıktan sonra
+    herhangi bir katsayının rotası yeni bir arama yapmadan ikili aramayla bulunur.
+    """
+    def __init__(self, ceza_araligi, rotalar):
+        self.ceza_araligi = ceza_araligi
+        #Alt zarftaki yollar [(mesafe, trafik_yuku, yol), ...], c arttıkça sırayla en iyi olanlar
+        self.rotalar = rotalar
+        #rotalar[i], kirilma_noktalari[i-1] ile kirilma_noktalari[i] arasında en iyidir
+        self.kirilma_noktalari = [(q[0] - p[0]) / (p[1] - q[1]) for p, q in zip(rotalar, rotalar[1:])]
+
+    @classmethod
+    def hesapla(cls, graph, kaynak, hedef, ceza_araligi=(0, None)):
+        #ceza_araligi: (en küçük, en büyük) ceza katsayısı; en büyük None ise üst sınır yoktur
+        return cls(ceza_araligi, destekli_rotalar(graph, kaynak, hedef, ceza_araligi))
+
+    def rota(self, ceza_katsayisi):
+        #Verilen katsayıda en iyi yol ve maliyeti: (yol, mesafe * (1 + trafik * c) toplamı); yol yoksa (None, sonsuz)
+        c_alt, c_ust = self.ceza_araligi
+        if ceza_katsayisi < c_alt or (c_ust is not None and ceza_katsayisi > c_ust):
+            raise ValueError(f"Ceza katsayısı {ceza_katsayisi} hesaplanan aralığın dışında: {self.ceza_araligi}")
+        if not self.rotalar:
+            return None, float('infinity')
+        mesafe, yuk, yol = self.rotalar[bisect.bisect_left(self.kirilma_noktalari, ceza_katsayisi)]
+        return yol, mesafe + ceza_katsayisi * yuk
+
+    def araliklar(self):
+        #[(c başlangıcı, c bitişi, yol, mesafe, trafik_yuku), ...]; son aralığın bitişi üst sınırdır (None: sınırsız)
+        c_alt, c_ust = self.ceza_araligi
+        sinirlar = [c_alt] + self.kirilma_noktalari + [c_ust]
+        return [(sinirlar[i], sinirlar[i + 1], yol, mesafe, yuk)
+                for i, (mesafe, yuk, yol) in enumerate(self.rotalar)]
+
+
+def pareto_cephesi(graph, kaynak, hedef):
+    """
+    (mesafe, trafik yükü) Pareto cephesi: hiçbiri diğerinden hem daha kısa hem daha az yüklü olmayan bütün yollar,
+    [(mesafe, trafik_yuku, yol), ...] mesafeye göre artan. Cephe, hiçbir katsayıda en iyi olmayan (zarfın üstünde
+    kalan) yolları da içerir; bunlar için etiket araması gerekir. Zarftaki yollar önceden bulunup etiket
+    aramasına hedef olarak verilir, böylece budama aramanın başından itibaren işler.
+    """
+    destekli = destekli_rotalar(graph, kaynak, hedef)
+    cephe = destekli + [(e[0], e[1], _etiket_yolu(e)) for e in _etiketler(graph, kaynak, hedef, 0, None, destekli)]
+    cephe.sort(key=lambda kayit: (kayit[0], kayit[1]))
+    return cephe
@@ -1,58 +1,35 @@
 import networkx as nx
 import matplotlib.pyplot as plt
-import heapq
-import random
+import ag_uretici
+from cift_yonlu_dijkstra import cift_yonlu_dijkstra, mesafe_maliyeti
+from kuyruklu_bellman_ford import kuyruklu_bellman_ford
+from yer_isaretleri import YerIsaretleri
+from izleme import Izleme, izlemeli_dijkstra, izlemeli_bellman_ford
 
 class GelismisAgAnalizi:
-    def __init__(self, dugum_sayisi=15):
+    def __init__(self, dugum_sayisi=15, topoloji='erdos_renyi', ortalama_derece=None, seed=42):
         #Görselliğin temiz ve okunaklı olması için 15-20 arası düğüm sayısı idealdir
-        #Erdos-Renyi modeli ile rastgele bağlantılara sahip bir ağ oluşturuyoruz
-        self.graph = nx.erdos_renyi_graph(dugum_sayisi, 0.3, seed=42)
+        #Varsayılan olarak Erdos-Renyi modeli ile rastgele bağlantılara sahip bir ağ oluşturuyoruz
+        #(bağlantı ihtimali 0.3, yani ortalama derece 0.3 * (n - 1)); büyük analizler için
+        #ag_uretici'deki diğer topolojiler ve ortalama derece seçilebilir
+        if ortalama_derece is None:
+            ortalama_derece = 0.3 * (dugum_sayisi - 1)
         
-        #Ağdaki her bağlantıya (kabloya) rastgele bir gecikme süresi (ağırlık) atıyoruz
-        for (u, v) in self.graph.edges():
-            self.graph.edges[u, v]['weight'] = random.randint(1, 20)
+        #Ağdaki her bağlantıya (kabloya) tohumlu rastgele bir gecikme süresi (1-20 ms ağırlık) atanır
+        self.graph = ag_uretici.uret(topoloji, dugum_sayisi, ortalama_derece, seed=seed,
+                                     en_buyuk_agirlik=20, trafik=False)
+
+        #ALT aramasının yer işareti tabloları ilk ihtiyaçta hazırlanır
+        self.yer_isaretleri = None
             
     def dijkstra_analizli(self, baslangic, hedef):
         """
         Hem en kısa yolu bulur hem de algoritmanın kaç işlem yaptığını (eforunu) sayar.
+        İşlem sayısı = kuyruktan çekilen düğümler + kontrol edilen komşular (izleme sayaçlarından).
         """
-        islem_sayisi = 0
-        
-        #Başlangıçta tüm düğümlere olan mesafeyi sonsuz, başlangıç düğümünü 0 yapıyoruz
-        mesafeler = {node: float('infinity') for node in self.graph.nodes}
-        mesafeler[baslangic] = 0
-        
-        #Dijkstra'nın kalbi olan öncelik kuyruğunu başlatıyoruz
-        pq = [(0, baslangic)]
-        
-        #Yolu geriye doğru takip edebilmek için kimden geldiğimizi not ediyoruz
-        onceki = {node: None for node in self.graph.nodes}
-        
-        while pq:
-            #Kuyruktan en düşük maliyetli düğümü çekiyoruz ve işlem sayacını artırıyoruz
-            mevcut_mesafe, mevcut_dugum = heapq.heappop(pq)
-            islem_sayisi += 1 
-
-            #Eğer hedef düğüme ulaştıysak döngüyü bitiriyoruz
-            if mevcut_dugum == hedef:
-                break
-            
-            #Daha kısa bir yol zaten bulunduysa bu adımı atlıyoruz
-            if mevcut_mesafe > mesafeler[mevcut_dugum]:
-                continue
-                
-            #Mevcut düğümün tüm komşularını geziyoruz
-            for komsu, ozellikler in self.graph[mevcut_dugum].items():
-                islem_sayisi += 1 #Her komşu kontrolü işlemci için bir yüktür, bunu sayıyoruz
-                agirlik = ozellikler['weight']
-                yeni_mesafe = mevcut_mesafe + agirlik
-                
-                #Daha kısa bir yol bulduysak bilgileri güncelliyoruz
-                if yeni_mesafe < mesafeler[komsu]:
-                    mesafeler[komsu] = yeni_mesafe
-                    onceki[komsu] = mevcut_dugum
-                    heapq.heappush(pq, (yeni_mesafe, komsu))
+        izleme = Izleme()
+        mesafeler, onceki = izlemeli_dijkstra(self.graph, baslangic, hedef, mesafe_maliyeti, izleme)
+        islem_sayisi = izleme.cekme + izleme.gevsetme
         
         #ROTAYI OLUŞTURMA
         #Hedef düğümden başlayıp geriye, start noktasına kadar gidiyoruz
@@ -64,42 +41,41 @@ class GelismisAgAnalizi:
             
         return yol, mesafeler[hedef], islem_sayisi
 
+    def cift_yonlu_dijkstra_analizli(self, baslangic, hedef):
+        """
+        Aramayı hem başlangıçtan hem hedeften yürütüp ortada buluşturur ve işlem sayısını döndürür.
+        İşlemler dijkstra_analizli ile aynı şekilde (kuyruktan çekme + komşu kontrolü) sayılır.
+        """
+        return cift_yonlu_dijkstra(self.graph, baslangic, hedef)
+
+    def yer_isaretlerini_hazirla(self, k=4, secim='en_uzak'):
+        """
+        ALT aramasında kullanılacak k yer işaretini seçip mesafe tablolarını hesaplar.
+        Ağırlıklar değiştiğinde tablolar yeniden hazırlanmalıdır.
+        """
+        self.yer_isaretleri = YerIsaretleri.graftan(self.graph, k, secim)
+        return self.yer_isaretleri
+
+    def alt_dijkstra_analizli(self, baslangic, hedef):
+        """
+        Dijkstra'yı yer işaretlerinden gelen üçgen eşitsizliği sınırlarıyla hedefe yönlendirir (ALT).
+        İşlem sayısı olarak kesinleşen düğüm sayısı döner; k ile bellek arasındaki dengeyi ayarlamak için.
+        """
+        if self.yer_isaretleri is None:
+            self.yer_isaretlerini_hazirla()
+        return self.yer_isaretleri.en_kisa_yol(self.graph, baslangic, hedef)
+
     def bellman_ford_analizli(self, baslangic, hedef):
         """
         Bellman-Ford algoritmasının aynı yolu bulmak için ne kadar çok işlem yaptığını sayar.
+        Bellman-Ford tüm kenarları (Düğüm Sayısı - 1) kez gezmek zorundadır; her kenar kontrolü bir işlemdir.
         """
-        islem_sayisi = 0
-        
-        #Başlangıç ayarları Dijkstra ile aynıdır
-        mesafeler = {node: float('infinity') for node in self.graph.nodes}
-        mesafeler[baslangic] = 0
-        onceki = {node: None for node in self.graph.nodes}
-        
-        dugum_sayisi = self.graph.number_of_nodes()
-        
-        #Bellman-Ford mantığı: Tüm kenarları (Düğüm Sayısı - 1) kez gezmek zorundadır
-        for _ in range(dugum_sayisi - 1):
-            degisim_var = False
-            
-            #Ağdaki bütün bağlantıları tek tek kontrol ediyoruz (Brute-Force yaklaşımı)
-            for u, v, data in self.graph.edges(data=True):
-                islem_sayisi += 1 #Her kenar kontrolü bir işlemdir
-                
-                #YÖN 1: u'dan v'ye gidiş kontrolü
-                if mesafeler[u] + data['weight'] < mesafeler[v]:
-                    mesafeler[v] = mesafeler[u] + data['weight']
-                    onceki[v] = u
-                    degisim_var = True
-                
-                #YÖN 2: v'den u'ya gidiş kontrolü (Yönsüz ağ olduğu için)
-                if mesafeler[v] + data['weight'] < mesafeler[u]:
-                    mesafeler[u] = mesafeler[v] + data['weight']
-                    onceki[u] = v
-                    degisim_var = True
-                    
-            #Eğer bu turda hiçbir güncelleme yapmadıysak işlemi erken bitiriyoruz
-            if not degisim_var:
-                break
+        izleme = Izleme()
+        mesafeler, onceki = izlemeli_bellman_ford(self.graph, baslangic, izleme)
+        #Yönsüz ağda her kenar iki yönde gevşetilir, ama bir kenar kontrolü tek işlem sayılır
+        islem_sayisi = izleme.gevsetme // 2
+        if mesafeler is None:
+            return [], None, islem_sayisi
                 
         #Yolu oluşturuyoruz (Sadece karşılaştırma grafiğinde göstermek için)
         yol = []
@@ -112,11 +88,32 @@ class GelismisAgAnalizi:
             
         return yol, mesafeler[hedef], islem_sayisi
 
+    def bellman_ford_kuyruklu_analizli(self, baslangic, hedef):
+        """
+        Kuyruk tabanlı Bellman-Ford (SPFA) ile aynı yolu bulur ve kontrol ettiği kenar sayısını sayar.
+        Her turda tüm kenarları değil, sadece mesafesi kısalan düğümlerin kenarlarını gezer.
+        """
+        mesafeler, onceki, islem_sayisi = kuyruklu_bellman_ford(self.graph, baslangic)
+        if mesafeler is None:
+            return [], None, islem_sayisi
+
+        yol = []
+        if mesafeler[hedef] != float('infinity'):
+            curr = hedef
+            while curr is not None:
+                yol.insert(0, curr)
+                curr = onceki[curr]
+
+        return yol, mesafeler[hedef], islem_sayisi
+
     def karsilastirmali_cizim(self, baslangic, hedef):
         #1. ANALİZ ADIMI
         #Her iki algoritmayı da çalıştırıp sonuçları ve işlem sayılarını alıyoruz
         d_yol, d_maliyet, d_islem = self.dijkstra_analizli(baslangic, hedef)
         b_yol, b_maliyet, b_islem = self.bellman_ford_analizli(baslangic, hedef)
+        c_yol, c_maliyet, c_islem = self.cift_yonlu_dijkstra_analizli(baslangic, hedef)
+        k_yol, k_maliyet, k_islem = self.bellman_ford_kuyruklu_analizli(baslangic, hedef)
+        a_yol, a_maliyet, a_kesinlesen = self.alt_dijkstra_analizli(baslangic, hedef)
 
         #2. GÖRSELLEŞTİRME ADIMI
         #Düğümlerin ekrandaki yerini sabitliyoruz
@@ -146,6 +143,15 @@ class GelismisAgAnalizi:
             f"BELLMAN-FORD ALGORİTMASI\n"
             f"• Bulunan Maliyet: {b_maliyet} ms\n"
             f"• İşlem Sayısı (Efor): {b_islem} adım\n\n"
+            f"KUYRUKLU BELLMAN-FORD (SPFA)\n"
+            f"• Bulunan Maliyet: {k_maliyet} ms\n"
+            f"• İşlem Sayısı (Efor): {k_islem} adım\n\n"
+            f"ÇİFT YÖNLÜ DIJKSTRA\n"
+            f"• Bulunan Maliyet: {c_maliyet} ms\n"
+            f"• İşlem Sayısı (Efor): {c_islem} adım\n\n"
+            f"ALT ({len(self.yer_isaretleri.yer_isaretleri)} YER İŞARETİ)\n"
+            f"• Bulunan Maliyet: {a_maliyet} ms\n"
+            f"• Kesinleşen Router: {a_kesinlesen}\n\n"
             f"SONUÇ: Dijkstra aynı yolu {round(b_islem/d_islem, 1)} kat\ndaha az işlemle buldu!"
         )
         
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+class EnKisaYolAgaci:
+    """
+    Tek bir kaynaktan ağdaki tüm düğümlere giden en kısa yol ağacı.
+    Herhangi bir hedefin rotası yeniden arama yapmadan bu ağaçtan okunur.
+    """
+    def __init__(self, graf, kaynak, mesafeler, onceki, tam_sayi=False):
+        self.graf = graf
+        self.kaynak = kaynak
+        self.mesafeler = mesafeler
+        self.onceki = onceki
+        #Ağırlıklar tam sayıysa maliyeti orijinal Dijkstra gibi tam sayı olarak döndürüyoruz
+        self.tam_sayi = tam_sayi
+
+    @property
+    def bayt(self):
+        return self.mesafeler.nbytes + self.onceki.nbytes
+
+    def maliyet(self, hedef):
+        mesafe = self.mesafeler[self.graf.indeks[hedef]].item()
+        if self.tam_sayi and mesafe != float('infinity'):
+            return int(mesafe)
+        return mesafe
+
+    def yol(self, hedef):
+        #Dönüş değeri dijkstra_kendi_kodumuz ile aynıdır: (rota, toplam maliyet)
+        etiketler = self.graf.etiketler
+        yol = []
+        adim = self.graf.indeks[hedef]
+        while adim != -1:
+            yol.append(etiketler[adim])
+            adim = self.onceki[adim]
+        yol.reverse()
+        return yol, self.maliyet(hedef)
+
+
+class RotaOnbellegi:
+    """
+    (kaynak, maliyet modeli, topoloji sürümü) anahtarıyla en kısa yol ağaçlarını saklayan LRU önbellek.
+    Toplam dizi boyutu bellek bütçesini aşınca en uzun süredir kullanılmayan ağaç atılır.
+    """
+    def __init__(self, bellek_butcesi=256 * 1024 * 1024):
+        self.bellek_butcesi = bellek_butcesi
+        self._agaclar = OrderedDict()
+        self.kullanilan_bellek = 0
+
+        #Önbelleği boyutlandırabilmek için sayaçlar
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye = 0
+
+    def __len__(self):
+        return len(self._agaclar)
+
+    def getir(self, anahtar):
+        agac = self._agaclar.get(anahtar)
+        if agac is None:
+            self.iskalama += 1
+            return None
+        #Kullanılan ağacı kuyruğun sonuna taşıyoruz, böylece en son tahliye edilir
+        self._agaclar.move_to_end(anahtar)
+        self.isabet += 1
+        return agac
+
+    def ekle(self, anahtar, agac):
+        eski = self._agaclar.pop(anahtar, None)
+        if eski is not None:
+            self.kullanilan_bellek -= eski.bayt
+        self._agaclar[anahtar] = agac
+        self.kullanilan_bellek += agac.bayt
+
+        #Bütçe aşıldıysa en eski ağaçlardan başlayarak yer açıyoruz (son eklenen her zaman kalır)
+        while self.kullanilan_bellek > self.bellek_butcesi and len(self._agaclar) > 1:
+            _, atilan = self._agaclar.popitem(last=False)
+            self.kullanilan_bellek -= atilan.bayt
+            self.tahliye += 1
+
+    def gecersiz_kil(self):
+        #Topoloji değiştiğinde eski sürüme ait bütün ağaçlar işe yaramaz hale gelir
+        self._agaclar.clear()
+        self.kullanilan_bellek = 0
+
+    def istatistikler(self):
+        toplam = self.isabet + self.iskalama
+        return {
+            'isabet': self.isabet,
+            'iskalama': self.iskalama,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+            'tahliye': self.tahliye,
+            'agac_sayisi': len(self._agaclar),
+            'kullanilan_bellek': self.kullanilan_bellek,
+            'bellek_butcesi': self.bellek_butcesi,
+        }
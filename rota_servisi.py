@@ -0,0 +1,403 @@
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+import ag_uretici
+from ikili_topoloji import graf_kaydet, yukle
+from kompakt_graf import KompaktDijkstra, paylasimli_bellege_yaz, paylasimli_bellekten_oku
+from maliyet_modeli import MesafeMaliyeti, TrafikCezaliMaliyet
+from sensitive_dijikstra import AkilliAgSimulasyonu
+
+#HTTP yanıtlarında kullanılan durum kodları
+_NEDENLER = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def maliyet_modeli_coz(ad='trafik', ceza=None):
+    #Sorgudaki maliyet adını modele çevirir: 'mesafe' (klasik) ya da 'trafik' (modifiye, ceza katsayısı isteğe bağlı)
+    if ad == 'mesafe':
+        return MesafeMaliyeti()
+    if ad == 'trafik':
+        if ceza is None:
+            return TrafikCezaliMaliyet()
+        ceza = float(ceza)
+        #Negatif katsayı trafiği ödüllendirip negatif kenar maliyeti üretebilir, Dijkstra bunu kaldıramaz
+        if not ceza >= 0:
+            raise ValueError(f"Ceza katsayısı negatif olamaz: {ceza}")
+        return TrafikCezaliMaliyet(ceza)
+    raise ValueError(f"Bilinmeyen maliyet modeli: {ad}")
+
+
+#İşçi süreç başına bir kez kurulan motor ve paylaşımlı trafik dizisi
+_ISCI = {}
+
+def _isci_baslat(dosya_yolu, paylasimli_tanim):
+    #Topoloji dosyası diske eşlenerek açılır, bütün işçiler aynı sayfaları paylaşır
+    diziler, bloklar = paylasimli_bellekten_oku(paylasimli_tanim)
+    _ISCI['motor'] = KompaktDijkstra(yukle(dosya_yolu, dogrula=False))
+    _ISCI['trafikler'] = diziler['trafikler']
+    _ISCI['sayac'] = diziler['sayac']
+    _ISCI['bloklar'] = bloklar
+    _ISCI['surum'] = 0
+
+
+def _trafigi_esitle():
+    """
+    Ana sürecin yayınladığı trafik dizisinin tutarlı bir kopyasını alır (seqlock).
+    Sayaç yazım sırasında tektir; kopyalamadan önce ve sonra aynı çift değeri okuyana kadar tekrar denenir.
+    Sürüm değişmediyse kopya alınmaz, maliyet listeleri sorgular arasında yeniden kullanılır.
+    """
+    paylasilan, sayac = _ISCI['trafikler'], _ISCI['sayac']
+    while True:
+        once = int(sayac[0])
+        if once // 2 == _ISCI['surum'] and once % 2 == 0:
+            return _ISCI['surum']
+        if once % 2:
+            time.sleep(0)
+            continue
+        kopya = paylasilan.copy()
+        if int(sayac[0]) == once:
+            break
+    _ISCI['motor'].graf.trafikleri_degistir(kopya)
+    _ISCI['surum'] = once // 2
+    return _ISCI['surum']
+
+
+def _isci_rota(kaynak, hedef, maliyet_modeli):
+    #Kaynak ve hedef tam sayı kimliklerdir; dönüş (rota etiketleri, maliyet, trafik sürümü)
+    surum = _trafigi_esitle()
+    motor = _ISCI['motor']
+    motor.calistir(kaynak, motor.graf.maliyet_listesi(maliyet_modeli), hedef)
+    return motor.yolu_kur(hedef), motor.mesafeler[hedef], surum
+
+
+class RotaServisi:
+    """
+    Topolojiyi bir kez yükleyip rota(kaynak, hedef, maliyet) sorgularını cevaplayan uzun ömürlü servis.
+    Aramalar işçi süreç havuzunda yapılır, olay döngüsü arama sürerken başka istekleri kabul etmeye devam eder.
+    Aynı anda gelen özdeş sorgular (aynı çift, aynı maliyet modeli, aynı trafik sürümü) tek aramayı bekler.
+    Trafik güncellemeleri ana süreçteki simülasyona uygulanır ve paylaşımlı bellek üzerinden işçilere yayınlanır.
+    dosya_yolu: AgSimulasyonu.topoloji_kaydet ya da AkilliAgSimulasyonu.topoloji_kaydet ile yazılmış topoloji.
+    isci_sayisi=0 verilirse aramalar olay döngüsünün içinde yapılır (kıyaslama için).
+    """
+    def __init__(self, dosya_yolu, isci_sayisi=None):
+        self.dosya_yolu = dosya_yolu
+        self.isci_sayisi = (os.cpu_count() or 1) if isci_sayisi is None else isci_sayisi
+        self.simulasyon = AkilliAgSimulasyonu()
+        self.simulasyon.topoloji_yukle(dosya_yolu)
+        self.graf = self.simulasyon.kompakt_motor().graf
+
+        #Trafik sürümü her güncelleme partisinde bir artar; birleştirme anahtarının parçasıdır
+        self.surum = 0
+        #Sürmekte olan aramalar: (kaynak, hedef, model anahtarı, sürüm) -> Future
+        self._bekleyenler = {}
+        self.sayaclar = {'sorgu': 0, 'arama': 0, 'birlesen': 0, 'guncelleme': 0}
+
+        self._havuz = None
+        self._bloklar = []
+        self._acik_bloklar = []
+        self._sunucu = None
+        #Açık istemci bağlantıları: görev -> yazıcı; kapanışta bunlar da kapatılır
+        self._baglantilar = {}
+
+    async def baslat(self, host='127.0.0.1', port=0, unix_soketi=None):
+        #Havuzu ve HTTP sunucusunu açar; dönüş dinlenen adres ((host, port) ya da soket yolu)
+        if self.isci_sayisi:
+            paylasimli_tanim, self._bloklar = paylasimli_bellege_yaz({
+                'trafikler': np.asarray(self.graf.trafikler, dtype=np.float64),
+                'sayac': np.zeros(1, dtype=np.int64),
+            })
+            #Yazmak için açılan görünümlerin blokları servis kapanana kadar açık kalmalıdır
+            diziler, self._acik_bloklar = paylasimli_bellekten_oku(paylasimli_tanim)
+            self._paylasilan_trafik, self._sayac = diziler['trafikler'], diziler['sayac']
+            self._havuz = ProcessPoolExecutor(max_workers=self.isci_sayisi, initializer=_isci_baslat,
+                                              initargs=(self.dosya_yolu, paylasimli_tanim))
+        if unix_soketi is not None:
+            self._sunucu = await asyncio.start_unix_server(self._baglanti, path=unix_soketi)
+            return unix_soketi
+        self._sunucu = await asyncio.start_server(self._baglanti, host, port)
+        return self._sunucu.sockets[0].getsockname()[:2]
+
+    async def durdur(self):
+        if self._sunucu is not None:
+            self._sunucu.close()
+            #Sunucuyu kapatmak açık bağlantıları kapatmaz; onları kapatınca işleyiciler EOF görüp kendiliğinden biter
+            for yazici in self._baglantilar.values():
+                yazici.close()
+            await asyncio.gather(*self._baglantilar, return_exceptions=True)
+            await self._sunucu.wait_closed()
+            self._sunucu = None
+        if self._havuz is not None:
+            self._havuz.shutdown(wait=True, cancel_futures=True)
+            self._havuz = None
+        #Bloğa bakan NumPy görünümleri dururken blok kapatılamaz
+        self._paylasilan_trafik = self._sayac = None
+        for blok in self._acik_bloklar:
+            blok.close()
+        for blok in self._bloklar:
+            blok.close()
+            blok.unlink()
+        self._bloklar = self._acik_bloklar = []
+
+    def router(self, ad):
+        #URL'den gelen adlar metindir; etiketler tam sayıysa sayıya çevirip tekrar bakıyoruz
+        indeks = self.graf.indeks
+        if ad in indeks:
+            return ad
+        if isinstance(ad, str):
+            try:
+                if int(ad) in indeks:
+                    return int(ad)
+            except ValueError:
+                pass
+        raise KeyError(ad)
+
+    async def rota(self, kaynak, hedef, maliyet_modeli=None):
+        """
+        kaynak -> hedef en kısa rotası: {'yol': [...], 'maliyet': .., 'surum': ..}; yol yoksa yol boş, maliyet None.
+        maliyet_modeli verilmezse modifiye_dijkstra'nın trafik cezalı modeli kullanılır.
+        """
+        maliyet_modeli = maliyet_modeli or self.simulasyon.maliyet_modeli
+        kaynak, hedef = self.router(kaynak), self.router(hedef)
+        self.sayaclar['sorgu'] += 1
+
+        anahtar = (kaynak, hedef, maliyet_modeli.anahtar, self.surum)
+        gelecek = self._bekleyenler.get(anahtar)
+        if gelecek is None:
+            gelecek = asyncio.ensure_future(self._ara(kaynak, hedef, maliyet_modeli))
+            self._bekleyenler[anahtar] = gelecek
+            gelecek.add_done_callback(lambda _: self._bekleyenler.pop(anahtar, None))
+            self.sayaclar['arama'] += 1
+        else:
+            self.sayaclar['birlesen'] += 1
+        #Bir istemcinin vazgeçmesi aynı aramayı bekleyen diğerlerini iptal etmemeli
+        yol, maliyet, surum = await asyncio.shield(gelecek)
+        if maliyet == float('infinity'):
+            return {'yol': [], 'maliyet': None, 'surum': surum}
+        return {'yol': yol, 'maliyet': maliyet, 'surum': surum}
+
+    async def _ara(self, kaynak, hedef, maliyet_modeli):
+        if self._havuz is None:
+            #Havuzsuz mod: arama olay döngüsünü arama boyunca bloklar
+            yol, maliyet = self.simulasyon.modifiye_dijkstra(kaynak, hedef, kompakt=True, maliyet_modeli=maliyet_modeli)
+            return yol, maliyet, self.surum
+        indeks = self.graf.indeks
+        dongu = asyncio.get_running_loop()
+        return await dongu.run_in_executor(self._havuz, _isci_rota, indeks[kaynak], indeks[hedef], maliyet_modeli)
+
+    def trafik_guncelle(self, guncellemeler):
+        """
+        (u, v, trafik_yogunlugu) güncellemelerini tek parti olarak uygular ve yeni trafik sürümünü döndürür.
+        Bu sürümden sonra gelen sorgular yeni trafikle aranır, sürmekte olan aramalarla birleştirilmez.
+        """
+        guncellemeler = [(self.router(u), self.router(v), float(trafik)) for u, v, trafik in guncellemeler]
+        for u, v, _ in guncellemeler:
+            if not self.simulasyon.graph.has_edge(u, v):
+                raise KeyError((u, v))
+        self.simulasyon.trafik_toplu_guncelle(guncellemeler)
+        self.surum += 1
+        self.sayaclar['guncelleme'] += len(guncellemeler)
+
+        if self._havuz is not None:
+            indeks = self.graf.indeks
+            konumlar = []
+            for u, v, _ in guncellemeler:
+                ui, vi = indeks[u], indeks[v]
+                konumlar += [self.graf.kenar_konumu(ui, vi), self.graf.kenar_konumu(vi, ui)]
+            #Yazım boyunca sayaç tektir, işçiler bu arada okudukları kopyayı atıp yeniden dener
+            self._sayac[0] += 1
+            self._paylasilan_trafik[konumlar] = self.graf.trafikler[konumlar]
+            self._sayac[0] = 2 * self.surum
+        return self.surum
+
+    def durum(self):
+        return {'dugum_sayisi': self.graf.dugum_sayisi, 'kenar_sayisi': self.graf.kenar_sayisi,
+                'isci_sayisi': self.isci_sayisi, 'surum': self.surum, **self.sayaclar}
+
+    async def _yonlendir(self, yontem, hedef, govde):
+        #HTTP isteğini servis çağrısına çevirir; dönüş (durum kodu, JSON gövdesi)
+        adres = urlsplit(hedef)
+        try:
+            if adres.path == '/rota':
+                if yontem != 'GET':
+                    return 405, {'hata': 'GET bekleniyor'}
+                parametreler = {ad: degerler[-1] for ad, degerler in parse_qs(adres.query).items()}
+                eksik = [ad for ad in ('kaynak', 'hedef') if ad not in parametreler]
+                if eksik:
+                    return 400, {'hata': f"Eksik parametre: {', '.join(eksik)}"}
+                maliyet_modeli = maliyet_modeli_coz(parametreler.get('maliyet', 'trafik'), parametreler.get('ceza'))
+                return 200, await self.rota(parametreler['kaynak'], parametreler['hedef'], maliyet_modeli)
+            if adres.path == '/trafik':
+                if yontem != 'POST':
+                    return 405, {'hata': 'POST bekleniyor'}
+                #Gövde trafik_akisi.jsonl_kaynagi ile aynı kayıtlardır: tek kayıt ya da kayıt listesi
+                kayitlar = json.loads(govde)
+                if isinstance(kayitlar, dict):
+                    kayitlar = [kayitlar]
+                surum = self.trafik_guncelle([(k['u'], k['v'], k['traffic']) for k in kayitlar])
+                return 200, {'surum': surum, 'guncellenen': len(kayitlar)}
+            if adres.path == '/durum':
+                return 200, self.durum()
+            return 404, {'hata': f"Bilinmeyen adres: {adres.path}"}
+        except KeyError as hata:
+            return 404, {'hata': f"Haritada olmayan router ya da kablo: {hata.args[0]}"}
+        except (ValueError, TypeError) as hata:
+            return 400, {'hata': str(hata)}
+
+    async def _baglanti(self, okuyucu, yazici):
+        #Basit HTTP/1.1: bağlantı açık tutulur (keep-alive), istekler sırayla cevaplanır
+        gorev = asyncio.current_task()
+        self._baglantilar[gorev] = yazici
+        try:
+            while True:
+                istek_satiri = await okuyucu.readline()
+                if not istek_satiri:
+                    break
+                parcalar = istek_satiri.decode('latin-1').split()
+                basliklar = {}
+                while True:
+                    satir = await okuyucu.readline()
+                    if satir in (b'\r\n', b'\n', b''):
+                        break
+                    ad, _, deger = satir.decode('latin-1').partition(':')
+                    basliklar[ad.strip().lower()] = deger.strip()
+                govde = await okuyucu.readexactly(int(basliklar.get('content-length', 0)))
+
+                if len(parcalar) != 3:
+                    durum, yanit = 400, {'hata': 'Geçersiz istek satırı'}
+                else:
+                    durum, yanit = await self._yonlendir(parcalar[0], parcalar[1], govde)
+                kapat = parcalar[-1:] == ['HTTP/1.0'] or basliklar.get('connection', '').lower() == 'close'
+                veri = json.dumps(yanit, ensure_ascii=False).encode('utf-8')
+                yazici.write((f"HTTP/1.1 {durum} {_NEDENLER[durum]}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(veri)}\r\n"
+                              + ("Connection: close\r\n" if kapat else "") + "\r\n").encode('latin-1') + veri)
+                await yazici.drain()
+                if kapat:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._baglantilar[gorev]
+            yazici.close()
+
+
+async def _http_istegi(okuyucu, yazici, yontem, hedef, govde=None):
+    #Açık bağlantı üzerinden tek istek gönderip (durum kodu, JSON yanıt) döndürür
+    veri = b'' if govde is None else json.dumps(govde).encode('utf-8')
+    yazici.write((f"{yontem} {hedef} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(veri)}\r\n\r\n")
+                 .encode('latin-1') + veri)
+    await yazici.drain()
+    durum = int((await okuyucu.readline()).split()[1])
+    uzunluk = 0
+    while True:
+        satir = await okuyucu.readline()
+        if satir in (b'\r\n', b'\n', b''):
+            break
+        ad, _, deger = satir.decode('latin-1').partition(':')
+        if ad.strip().lower() == 'content-length':
+            uzunluk = int(deger)
+    return durum, json.loads(await okuyucu.readexactly(uzunluk))
+
+
+async def yuk_testi(adres, ciftler, istek_sayisi=2000, eszamanli=32, maliyet='trafik', kenarlar=(),
+                    guncelleme_orani=0.0, seed=42):
+    """
+    Servise eşzamanlı istemcilerle yük bindirir ve iş hacmi ile gecikme dağılımını raporlar.
+    adres: (host, port) ya da Unix soket yolu. Her istemci kendi bağlantısını açık tutar ve sıradaki isteği alır.
+    Rota sorguları ciftler listesinden rastgele seçilir; küçük bir çift kümesi birleştirmeyi (coalescing) ölçer.
+    guncelleme_orani > 0 ise isteklerin bu kadarı kenarlar arasından rastgele bir kablonun trafik güncellemesidir.
+    """
+    rng = random.Random(seed)
+    istekler = []
+    for _ in range(istek_sayisi):
+        if kenarlar and rng.random() < guncelleme_orani:
+            u, v = rng.choice(kenarlar)
+            istekler.append(('POST', '/trafik', {'u': u, 'v': v, 'traffic': round(rng.random(), 3)}))
+        else:
+            kaynak, hedef = rng.choice(ciftler)
+            istekler.append(('GET', f"/rota?kaynak={kaynak}&hedef={hedef}&maliyet={maliyet}", None))
+
+    async def baglan():
+        if isinstance(adres, str):
+            return await asyncio.open_unix_connection(adres)
+        return await asyncio.open_connection(*adres)
+
+    gecikmeler = {'GET': [], 'POST': []}
+    hatalar = 0
+    sira = iter(istekler)
+
+    async def istemci():
+        nonlocal hatalar
+        okuyucu, yazici = await baglan()
+        try:
+            for yontem, hedef, govde in sira:
+                t0 = time.perf_counter()
+                durum, _ = await _http_istegi(okuyucu, yazici, yontem, hedef, govde)
+                gecikmeler[yontem].append(time.perf_counter() - t0)
+                if durum != 200:
+                    hatalar += 1
+        finally:
+            yazici.close()
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(istemci() for _ in range(eszamanli)))
+    sure = time.perf_counter() - baslangic
+
+    okuyucu, yazici = await baglan()
+    _, sunucu_durumu = await _http_istegi(okuyucu, yazici, 'GET', '/durum')
+    yazici.close()
+
+    rapor = {'istek': istek_sayisi, 'eszamanli': eszamanli, 'sure_s': sure, 'is_hacmi_rps': istek_sayisi / sure,
+             'hata': hatalar, 'sunucu': sunucu_durumu}
+    for yontem, ad in (('GET', 'rota'), ('POST', 'trafik')):
+        if gecikmeler[yontem]:
+            p50, p99 = np.percentile(np.asarray(gecikmeler[yontem]) * 1000, [50, 99])
+            rapor[ad] = {'sayi': len(gecikmeler[yontem]), 'p50_ms': float(p50), 'p99_ms': float(p99),
+                         'en_fazla_ms': max(gecikmeler[yontem]) * 1000}
+    return rapor
+
+
+async def servis_kiyaslamasi(dosya_yolu, ciftler, kenarlar=(), isci_sayisi=None, unix_soketi=None, **ayarlar):
+    #Servisi yerel adreste açar, yuk_testi ile ölçer ve kapatır; ayarlar yuk_testi'ne aktarılır
+    servis = RotaServisi(dosya_yolu, isci_sayisi)
+    adres = await servis.baslat(unix_soketi=unix_soketi)
+    try:
+        return await yuk_testi(adres, ciftler, kenarlar=kenarlar, **ayarlar)
+    finally:
+        await servis.durdur()
+
+
+def _raporu_yaz(baslik, rapor):
+    print(f"{baslik}: {rapor['istek']} istek / {rapor['sure_s']:.2f} s = {rapor['is_hacmi_rps']:.0f} istek/s, "
+          f"hata {rapor['hata']}")
+    for ad in ('rota', 'trafik'):
+        if ad in rapor:
+            print(f"  {ad:7s} n={rapor[ad]['sayi']:5d}  p50 {rapor[ad]['p50_ms']:7.2f} ms  "
+                  f"p99 {rapor[ad]['p99_ms']:7.2f} ms  en fazla {rapor[ad]['en_fazla_ms']:7.2f} ms")
+    sunucu = rapor['sunucu']
+    print(f"  sorgu {sunucu['sorgu']}, arama {sunucu['arama']}, birleşen {sunucu['birlesen']}, "
+          f"trafik sürümü {sunucu['surum']}")
+
+
+if __name__ == "__main__":
+    #Örnek ağı topoloji dosyasına yazıp servisi havuzlu ve havuzsuz modda aynı yük altında ölçüyoruz
+    graph = ag_uretici.uret('geometrik', 2000, 8, seed=42)
+    rng = random.Random(42)
+    dugumler = list(graph.nodes)
+    #Sıcak çiftler: gerçek trafikte sorguların çoğu az sayıda popüler çifte gelir
+    ciftler = [tuple(rng.sample(dugumler, 2)) for _ in range(100)]
+    kenarlar = list(graph.edges())
+
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya_yolu = os.path.join(dizin, 'topoloji.bin')
+        graf_kaydet(graph, dosya_yolu)
+        for baslik, isci_sayisi in (("İşçi havuzu", None), ("Havuzsuz (olay döngüsünde arama)", 0)):
+            rapor = asyncio.run(servis_kiyaslamasi(dosya_yolu, ciftler, kenarlar, isci_sayisi=isci_sayisi,
+                                                   istek_sayisi=2000, eszamanli=32, guncelleme_orani=0.01))
+            _raporu_yaz(baslik, rapor)
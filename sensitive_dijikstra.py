@@ -2,14 +2,41 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import heapq
 import random
+import numpy as np
+from kompakt_graf import KompaktGraf, KompaktDijkstra
+from rota_onbellegi import EnKisaYolAgaci, RotaOnbellegi
+from dinamik_agac import DinamikEnKisaYolAgaci
+from cift_yonlu_dijkstra import cift_yonlu_dijkstra
+from maliyet_modeli import MesafeMaliyeti, TrafikCezaliMaliyet, komsuluk_guncelle, maliyet_komsulugu
+from izleme import izlemeli_dijkstra
+from cok_yollu import EsitMaliyetliYollar, k_en_kisa_yollar
+from parametrik_rota import ParametrikRota, pareto_cephesi
+from oncelik_kuyrugu import KUYRUKLAR, kuyruklu_dijkstra
+from trafik_akisi import TrafikAkisi
+from ikili_topoloji import graf_kaydet, nx_yukle, yukle
 
 #Matlab tarzı ızgara görünümü için stil ayarı yapıyoruz
 plt.style.use('ggplot') 
 
 class AkilliAgSimulasyonu:
-    def __init__(self):
+    def __init__(self, maliyet_modeli=None):
         #NetworkX kütüphanesini kullanarak boş bir ağ grafiği oluşturuyoruz
         self.graph = nx.Graph()
+        #Geliştirilmiş algoritmanın kullandığı maliyet modeli (varsayılan: trafik cezalı, katsayı 10)
+        self.maliyet_modeli = maliyet_modeli or TrafikCezaliMaliyet()
+        #Dizi tabanlı motor ilk ihtiyaç anında kurulur
+        self._kompakt_motor = None
+        self._kompakt_kaynagi = None
+
+        #Aynı kaynaklardan tekrar tekrar gelen sorgular için en kısa yol ağaçlarını saklıyoruz
+        self.topoloji_surumu = 0
+        self.rota_onbellegi = RotaOnbellegi()
+        #Trafik değiştikçe baştan hesaplanmak yerine yerinde onarılan ağaçlar
+        self._dinamik_agaclar = {}
+        #hazir_maliyet=True ile istenen sabit maliyet kopyaları: model anahtarı -> (model, {u: {v: maliyet}})
+        #Kenar özellikleri graph üzerinde elle değiştirilirse maliyet_komsuluklarini_sifirla çağrılmalıdır
+        self._maliyet_komsuluklari = {}
+        self._komsuluk_kaynagi = None
 
     def yol_ekle(self, u, v, mesafe, trafik_yogunlugu):
         """
@@ -18,9 +45,147 @@ class AkilliAgSimulasyonu:
         """
         #Grafiğe iki nokta arasındaki hem fiziksel mesafeyi hem de trafik verisini ekliyoruz
         self.graph.add_edge(u, v, weight=mesafe, traffic=trafik_yogunlugu)
+        #Topoloji değiştiği için dondurulmuş kopya ve saklanan rotalar artık geçersiz
+        self._topoloji_degisti()
+
+    def _topoloji_degisti(self):
+        self._kompakt_motor = None
+        self.topoloji_surumu += 1
+        self.rota_onbellegi.gecersiz_kil()
+        self._dinamik_agaclar.clear()
+        self._maliyet_komsuluklari.clear()
+
+    def trafik_guncelle(self, u, v, trafik_yogunlugu=None, mesafe=None):
+        """
+        Tek bir yolun trafik (ve istenirse mesafe) değerini günceller.
+        Dinamik ağaçlar tam Dijkstra yerine sadece etkilenen kısımları onarılarak güncellenir.
+        Her kaynak için onarımın dokunduğu düğüm sayısını döndürür.
+        """
+        if trafik_yogunlugu is not None:
+            self.graph.edges[u, v]['traffic'] = trafik_yogunlugu
+        if mesafe is not None:
+            self.graph.edges[u, v]['weight'] = mesafe
+
+        graf = self.kompakt_motor().graf
+        ui, vi = graf.indeks[u], graf.indeks[v]
+        eski_maliyetler = {anahtar: agac.kenar_maliyeti(ui, vi) for anahtar, agac in self._dinamik_agaclar.items()}
+        graf.kenar_guncelle(ui, vi, agirlik=mesafe, trafik=trafik_yogunlugu)
+
+        #Önbellekteki sabit ağaçlar eski maliyetlere göre hesaplandığı için atılır
+        self.rota_onbellegi.gecersiz_kil()
+        for maliyet_modeli, komsuluk in self._maliyet_komsuluklari.values():
+            komsuluk_guncelle(komsuluk, self.graph, maliyet_modeli, u, v)
+
+        dokunulan = {}
+        for anahtar, agac in self._dinamik_agaclar.items():
+            dokunulan[anahtar] = agac.kenar_guncellendi(ui, vi, eski_maliyetler[anahtar])
+        return dokunulan
+
+    def trafik_toplu_guncelle(self, guncellemeler):
+        """
+        Birden fazla yolun trafiğini (u, v, trafik_yogunlugu) tek seferde günceller.
+        Her dinamik ağaç bütün değişiklikler için bir kez onarılır; dönüş değeri trafik_guncelle ile aynıdır.
+        """
+        graf = self.kompakt_motor().graf
+        degisimler = {anahtar: [] for anahtar in self._dinamik_agaclar}
+        for u, v, trafik_yogunlugu in guncellemeler:
+            self.graph.edges[u, v]['traffic'] = trafik_yogunlugu
+            ui, vi = graf.indeks[u], graf.indeks[v]
+            konum = graf.kenar_konumu(ui, vi)
+            for anahtar, agac in self._dinamik_agaclar.items():
+                degisimler[anahtar].append((ui, vi, agac.maliyetler[konum]))
+            graf.kenar_guncelle(ui, vi, trafik=trafik_yogunlugu)
+            for maliyet_modeli, komsuluk in self._maliyet_komsuluklari.values():
+                komsuluk_guncelle(komsuluk, self.graph, maliyet_modeli, u, v)
+
+        self.rota_onbellegi.gecersiz_kil()
+        return {anahtar: agac.kenarlar_guncellendi(degisimler[anahtar])
+                for anahtar, agac in self._dinamik_agaclar.items()}
+
+    def trafik_akisi(self, izlenen_rotalar=(), parti_boyutu=1000, sure_siniri_s=None):
+        """
+        Telemetri akışından gelen trafik güncellemelerini mikro partilerle uygulayan boru hattını kurar.
+        İzlenen rotalar modifiye_dijkstra'nın maliyet modeliyle tutulur ve her partide gerekirse yenilenir.
+        Kullanım: for rapor in sim.trafik_akisi(rotalar).isle(jsonl_kaynagi(sys.stdin)): ...
+        """
+        return TrafikAkisi(self, izlenen_rotalar, self.maliyet_modeli, parti_boyutu, sure_siniri_s)
 
-    def klasik_dijkstra(self, baslangic, hedef):
+    def dinamik_agac(self, kaynak, maliyet_modeli=None):
+        #Kaynağın trafik güncellemelerinde kendini onaran en kısa yol ağacı, ilk istekte bir kez kurulur
+        maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+        anahtar = (kaynak, maliyet_modeli.anahtar)
+        if anahtar not in self._dinamik_agaclar:
+            self._dinamik_agaclar[anahtar] = DinamikEnKisaYolAgaci(self.kompakt_motor().graf, kaynak, maliyet_modeli)
+        return self._dinamik_agaclar[anahtar]
+
+    def maliyet_komsulugu(self, maliyet_modeli):
+        #Kenar maliyetleri model başına bir kez hesaplanır, trafik_guncelle onları yerinde düzeltir
+        #graph.edges[u, v] dışarıdan değiştirilirse bu kopya bunu göremez, maliyet_komsuluklarini_sifirla gerekir
+        if self._komsuluk_kaynagi is not self.graph:
+            self._maliyet_komsuluklari.clear()
+            self._komsuluk_kaynagi = self.graph
+        if maliyet_modeli.anahtar not in self._maliyet_komsuluklari:
+            self._maliyet_komsuluklari[maliyet_modeli.anahtar] = (maliyet_modeli,
+                                                                  maliyet_komsulugu(self.graph, maliyet_modeli))
+        return self._maliyet_komsuluklari[maliyet_modeli.anahtar][1]
+
+    def maliyet_komsuluklarini_sifirla(self):
+        #Kenar verisi trafik_guncelle dışında değiştirildiğinde sabit maliyet kopyalarını atar
+        self._maliyet_komsuluklari.clear()
+
+    def kompakt_motor(self):
+        #Grafın CSR kopyasını ve onu kullanan Dijkstra motorunu bir kez kurup saklıyoruz
+        if self._kompakt_kaynagi is not self.graph:
+            self._topoloji_degisti()
+        if self._kompakt_motor is None:
+            self._kompakt_motor = KompaktDijkstra(KompaktGraf.graftan(self.graph))
+            self._kompakt_kaynagi = self.graph
+        return self._kompakt_motor
+
+    def topoloji_kaydet(self, dosya_yolu):
+        #Ağı ikili topoloji dosyasına yazar, servisler açılışta bu dosyayı diske eşleyerek yükler
+        graf_kaydet(self.graph, dosya_yolu)
+
+    def topoloji_yukle(self, dosya_yolu, dogrula=True):
+        """
+        topoloji_kaydet ile yazılmış ağı yükler. Dizi tabanlı motor doğrudan diske eşlenmiş (np.memmap)
+        dizilerle kurulur; aynı dosyayı açan işçi süreçler bu sayfaları paylaşır.
+        """
+        self.graph = nx_yukle(dosya_yolu, dogrula)
+        self._topoloji_degisti()
+        #Sağlama toplamı yukarıda bir kez kontrol edildi
+        self._kompakt_motor = KompaktDijkstra(yukle(dosya_yolu, dogrula=False))
+        self._kompakt_kaynagi = self.graph
+
+    def rota_tablosu(self, kaynak, maliyet_modeli=None):
+        #Kaynağın verilen maliyet modelindeki en kısa yol ağacını önbellekten verir, yoksa hesaplayıp saklar
+        maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+        motor = self.kompakt_motor()
+        anahtar = (kaynak, maliyet_modeli.anahtar, self.topoloji_surumu)
+        agac = self.rota_onbellegi.getir(anahtar)
+        if agac is None:
+            mesafeler, onceki = motor.agac_hesapla(motor.graf.indeks[kaynak], motor.graf.maliyet_listesi(maliyet_modeli))
+            tam_sayi = maliyet_modeli.tam_sayi_korur and np.issubdtype(motor.graf.agirliklar.dtype, np.integer)
+            agac = EnKisaYolAgaci(motor.graf, kaynak, mesafeler, onceki, tam_sayi)
+            self.rota_onbellegi.ekle(anahtar, agac)
+        return agac
+
+    def klasik_dijkstra(self, baslangic, hedef, kompakt=False, onbellek=False, dinamik=False, izleme=None,
+                        kuyruk='heapq'):
         #Klasik dijkstra algoritması sadece fiziksel mesafeye odaklanır ve trafik yoğunluğunu tamamen görmezden gelir
+        #kuyruk='indeksli' verilirse tembel silme yerine decrease-key yapan indeksli yığın kullanılır
+        if dinamik:
+            return self.dinamik_agac(baslangic).yol(hedef)
+        if onbellek:
+            return self.rota_tablosu(baslangic).yol(hedef)
+        if kompakt:
+            motor = self.kompakt_motor()
+            return motor.en_kisa_yol(baslangic, hedef, motor.graf.maliyet_listesi(), izleme)
+        if izleme is not None:
+            return self._izlemeli_dijkstra(baslangic, hedef, MesafeMaliyeti(), izleme)
+        if kuyruk != 'heapq':
+            return self._kuyruklu_dijkstra(baslangic, hedef, MesafeMaliyeti(), kuyruk)
+
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
         mesafeler[baslangic] = 0
         pq = [(0, baslangic)]
@@ -41,12 +206,30 @@ class AkilliAgSimulasyonu:
         
         return self._yolu_kur(hedef, onceki), mesafeler[hedef]
 
-    def modifiye_dijkstra(self, baslangic, hedef):
+    def modifiye_dijkstra(self, baslangic, hedef, kompakt=False, onbellek=False, dinamik=False, maliyet_modeli=None,
+                          izleme=None, kuyruk='heapq', hazir_maliyet=False):
         #Geliştirdiğimiz algoritma mesafenin yanında trafik yoğunluğunu da bir ceza puanı olarak hesaba katar
-        #Algoritmanın Formülü: Maliyet = Mesafe * (1 + (Trafik * Ceza_Katsayısı))
+        #Varsayılan Formül: Maliyet = Mesafe * (1 + (Trafik * Ceza_Katsayısı))
+        
+        #Trafik varsa o yolun maliyetini katsayı kadar artırarak algoritmayı o yoldan soğutuyoruz
+        maliyet_modeli = maliyet_modeli or self.maliyet_modeli
+
+        if dinamik:
+            return self.dinamik_agac(baslangic, maliyet_modeli).yol(hedef)
+        if onbellek:
+            return self.rota_tablosu(baslangic, maliyet_modeli).yol(hedef)
+        if kompakt:
+            #Efektif maliyetler kenar dizisine bir kez hesaplanır, döngüde çarpma yapılmaz
+            #Böylece modifiye algoritma klasik olanla birebir aynı döngüyü çalıştırır
+            motor = self.kompakt_motor()
+            return motor.en_kisa_yol(baslangic, hedef, motor.graf.maliyet_listesi(maliyet_modeli), izleme)
+        if izleme is not None:
+            return self._izlemeli_dijkstra(baslangic, hedef, maliyet_modeli, izleme)
+        if kuyruk != 'heapq':
+            return self._kuyruklu_dijkstra(baslangic, hedef, maliyet_modeli, kuyruk)
         
-        #Trafik varsa o yolun maliyetini 5 katına kadar artırarak algoritmayı o yoldan soğutuyoruz
-        CEZA_KATSAYISI = 10.0 
+        if hazir_maliyet:
+            return self._hazir_maliyetli_dijkstra(baslangic, hedef, maliyet_modeli)
         
         mesafeler = {node: float('infinity') for node in self.graph.nodes}
         mesafeler[baslangic] = 0
@@ -59,12 +242,8 @@ class AkilliAgSimulasyonu:
             if mevcut_maliyet > mesafeler[mevcut_dugum]: continue
 
             for komsu, ozellikler in self.graph[mevcut_dugum].items():
-                mesafe = ozellikler['weight']
-                trafik = ozellikler['traffic']
-                
-                
                 #Sadece mesafeyi toplamak yerine trafik yoğunluğuna göre dinamik bir maliyet hesaplıyoruz
-                efektif_maliyet = mesafe * (1 + (trafik * CEZA_KATSAYISI))
+                efektif_maliyet = maliyet_modeli.kenar_maliyeti(ozellikler)
                 
                 yeni_maliyet = mevcut_maliyet + efektif_maliyet
                 if yeni_maliyet < mesafeler[komsu]:
@@ -74,6 +253,75 @@ class AkilliAgSimulasyonu:
         
         return self._yolu_kur(hedef, onceki), mesafeler[hedef]
 
+    def _hazir_maliyetli_dijkstra(self, baslangic, hedef, maliyet_modeli):
+        #Aynı döngü, ama efektif maliyetler model başına bir kez hesaplanmış kopyadan okunur
+        #Kenar verisini graph üzerinde elle değiştiren kod maliyet_komsuluklarini_sifirla çağırmalıdır
+        komsuluk = self.maliyet_komsulugu(maliyet_modeli)
+        mesafeler = {node: float('infinity') for node in self.graph.nodes}
+        mesafeler[baslangic] = 0
+        pq = [(0, baslangic)]
+        onceki = {node: None for node in self.graph.nodes}
+
+        while pq:
+            mevcut_maliyet, mevcut_dugum = heapq.heappop(pq)
+            if mevcut_dugum == hedef: break
+            if mevcut_maliyet > mesafeler[mevcut_dugum]: continue
+
+            for komsu, efektif_maliyet in komsuluk[mevcut_dugum].items():
+                yeni_maliyet = mevcut_maliyet + efektif_maliyet
+                if yeni_maliyet < mesafeler[komsu]:
+                    mesafeler[komsu] = yeni_maliyet
+                    onceki[komsu] = mevcut_dugum
+                    heapq.heappush(pq, (yeni_maliyet, komsu))
+
+        return self._yolu_kur(hedef, onceki), mesafeler[hedef]
+
+    def cift_yonlu_dijkstra(self, baslangic, hedef, trafik_duyarli=False):
+        #Noktadan noktaya sorgular için iki uçtan ilerleyip ortada buluşan arama
+        #trafik_duyarli=True verilirse modifiye_dijkstra ile aynı maliyet modeli kullanılır
+        maliyet_modeli = self.maliyet_modeli if trafik_duyarli else MesafeMaliyeti()
+        yol, toplam, _ = cift_yonlu_dijkstra(self.graph, baslangic, hedef, maliyet_modeli.kenar_maliyeti)
+        return yol, toplam
+
+    def ecmp_dijkstra(self, baslangic, hedef=None, trafik_duyarli=False):
+        """
+        Eşit maliyetli bütün yolları koruyan Dijkstra (ECMP) DAG'ı; bkz. cok_yollu.EsitMaliyetliYollar.
+        trafik_duyarli=True verilirse eşitlik modifiye_dijkstra'nın maliyet modeline göre aranır.
+        """
+        maliyet_modeli = self.maliyet_modeli if trafik_duyarli else MesafeMaliyeti()
+        return EsitMaliyetliYollar.hesapla(self.graph, baslangic, hedef, maliyet_modeli.kenar_maliyeti)
+
+    def k_en_kisa_yollar(self, baslangic, hedef, k=3, trafik_duyarli=False):
+        #Yedek rotalar: en fazla k döngüsüz yol, artan maliyet sırasıyla [(yol, maliyet), ...]
+        maliyet_modeli = self.maliyet_modeli if trafik_duyarli else MesafeMaliyeti()
+        return k_en_kisa_yollar(self.graph, baslangic, hedef, k, maliyet_modeli.kenar_maliyeti)
+
+    def ceza_parametrik_rota(self, baslangic, hedef, ceza_araligi=(0, None)):
+        """
+        Ceza katsayısı aralığındaki bütün en iyi rotalar ve kırılma noktaları; bkz. parametrik_rota.ParametrikRota.
+        Katsayı taraması için her değerde modifiye_dijkstra çalıştırmak yerine bir kez hesaplanıp
+        .rota(c) ile sorgulanır. Maliyet, TrafikCezaliMaliyet'in formülüdür: mesafe * (1 + trafik * c).
+        """
+        return ParametrikRota.hesapla(self.graph, baslangic, hedef, ceza_araligi)
+
+    def pareto_cephesi(self, baslangic, hedef):
+        #Hiçbiri diğerinden hem kısa hem az yüklü olmayan bütün yollar [(mesafe, trafik_yuku, yol), ...]
+        return pareto_cephesi(self.graph, baslangic, hedef)
+
+    def _izlemeli_dijkstra(self, baslangic, hedef, maliyet_modeli, izleme):
+        #Sayaçlı döngü ayrı tutulur, böylece izleme kapalıyken normal döngüye hiçbir ek iş gelmez
+        mesafeler, onceki = izlemeli_dijkstra(self.graph, baslangic, hedef, maliyet_modeli.kenar_maliyeti, izleme)
+        with izleme.asama('rota'):
+            return self._yolu_kur(hedef, onceki), mesafeler[hedef]
+
+    def _kuyruklu_dijkstra(self, baslangic, hedef, maliyet_modeli, kuyruk):
+        #Trafik cezalı maliyetler ondalıklıdır, tam sayı isteyen kova kuyrukları burada kullanılamaz
+        if kuyruk != 'indeksli':
+            raise ValueError(f"Bilinmeyen kuyruk: {kuyruk}")
+        mesafeler, onceki = kuyruklu_dijkstra(self.graph, baslangic, hedef, KUYRUKLAR[kuyruk](),
+                                              maliyet_modeli.kenar_maliyeti)
+        return self._yolu_kur(hedef, onceki), mesafeler[hedef]
+
     def _yolu_kur(self, hedef, onceki_sozlugu):
         #Bulunan en kısa rotayı hedef noktadan geriye doğru giderek oluşturuyoruz
         yol = []
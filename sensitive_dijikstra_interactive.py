@@ -1,43 +1,75 @@
 import networkx as nx
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Button, TextBox
+from matplotlib.widgets import Button, Slider, TextBox
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 import heapq
-import random
 import math
+import numpy as np
+import ag_uretici
+from kompakt_graf import KompaktGraf, KompaktDijkstra
+from dinamik_agac import DinamikEnKisaYolAgaci
+from a_yildiz import a_yildiz
+from maliyet_modeli import VARSAYILAN_CEZA_KATSAYISI, MesafeMaliyeti, TrafikCezaliMaliyet
+from izleme import izlemeli_dijkstra
+from parametrik_rota import ParametrikRota
 
 #Grafiklerin daha temiz görünmesi için varsayılan stili kullanıyoruz
 plt.style.use('default') 
 
 class InteraktifAgSimulasyonu:
-    def __init__(self, dugum_sayisi=50):
+    def __init__(self, dugum_sayisi=50, maliyet_modeli=None, seed=42, yaricap=0.3):
+        #Geliştirilmiş algoritmanın ve puanlamanın kullandığı maliyet modeli
+        self.maliyet_modeli = maliyet_modeli or TrafikCezaliMaliyet()
+
         #Noktaların rastgele ama coğrafi olarak mantıklı dağılması için geometrik graf kullanıyoruz
-        self.graph = nx.random_geometric_graph(dugum_sayisi, radius=0.3, seed=42)
+        #Konumlar, mesafeler ve trafikler aynı tohumdan NumPy ile tek seferde üretilir
+        rng = np.random.default_rng(seed)
+        u, v, noktalar = ag_uretici.geometrik_kenarlari(dugum_sayisi, yaricap, rng)
+        #İki nokta arasındaki kuş uçuşu mesafeyi (Öklid) hesaplayıp ağırlık olarak atıyoruz
+        agirliklar = ag_uretici.oklid_agirliklari(u, v, noktalar)
+
+        #Gerçekçi bir simülasyon için yollara rastgele trafik yoğunluğu atıyoruz
+        #%50 ihtimalle yol açık (Yeşil, 0-0.40), %30 orta (Turuncu, 0.40-0.75), %20 kilit (Kırmızı, 0.75-1.0)
+        zar = rng.random(len(u))
+        alt = np.select([zar < 0.50, zar < 0.80], [0.0, 0.40], 0.75)
+        ust = np.select([zar < 0.50, zar < 0.80], [0.40, 0.75], 1.0)
+        trafikler = rng.uniform(alt, ust)
+
+        self.graph = ag_uretici.nx_grafi(dugum_sayisi, u, v, agirliklar, trafikler, noktalar)
         self.pos = nx.get_node_attributes(self.graph, 'pos')
-        
-        for (u, v) in self.graph.edges():
-            #İki nokta arasındaki kuş uçuşu mesafeyi (Öklid) hesaplayıp ağırlık olarak atıyoruz
-            x1, y1 = self.pos[u]
-            x2, y2 = self.pos[v]
-            dist = math.sqrt((x2-x1)**2 + (y2-y1)**2) * 100 
-            self.graph.edges[u, v]['weight'] = round(dist, 1)
-            
-            #Gerçekçi bir simülasyon için yollara rastgele trafik yoğunluğu atıyoruz
-            zar = random.random()
-            if zar < 0.50: 
-                #%50 ihtimalle yol açık (Yeşil)
-                self.graph.edges[u, v]['traffic'] = random.uniform(0.0, 0.40)
-            elif zar < 0.80:
-                #%30 ihtimalle trafik orta seviyede (Turuncu)
-                self.graph.edges[u, v]['traffic'] = random.uniform(0.40, 0.75)
-            else:
-                #%20 ihtimalle trafik kilit (Kırmızı)
-                self.graph.edges[u, v]['traffic'] = random.uniform(0.75, 1.0)
+
+        #A* sezgiseli: kuş uçuşu mesafe, kenar ağırlığı/Öklid uzunluğu oranının en küçüğüyle ölçeklenir
+        #Ağırlıklar yuvarlandığı için oran tam 100 olmayabilir, en küçük oranı alınca tahmin hiçbir kenarda gerçeği aşmaz
+        uzunluklar = np.hypot(*(noktalar[v] - noktalar[u]).T)
+        pozitif = uzunluklar > 0
+        self._sezgisel_olcek = float((agirliklar[pozitif] / uzunluklar[pozitif]).min()) if pozitif.any() else 0.0
+        self.son_genisletilen = 0
+
+        #Harita sabit olduğu için CSR kopyası ve motor ilk sorguda bir kez kurulur
+        self._kompakt_motor = None
+        #Trafik değiştikçe yerinde onarılan ağaçlar (kaynak -> ağaç)
+        self._dinamik_agaclar = {}
+
+    def kompakt_motor(self):
+        if self._kompakt_motor is None:
+            self._kompakt_motor = KompaktDijkstra(KompaktGraf.graftan(self.graph))
+        return self._kompakt_motor
+
+    def trafik_guncelle(self, u, v, trafik):
+        #Yolun trafiğini değiştirip dinamik ağaçları sadece etkilenen kısımlarından onarıyoruz
+        self.graph.edges[u, v]['traffic'] = trafik
+        graf = self.kompakt_motor().graf
+        ui, vi = graf.indeks[u], graf.indeks[v]
+        eski_maliyetler = {kaynak: agac.kenar_maliyeti(ui, vi) for kaynak, agac in self._dinamik_agaclar.items()}
+        graf.kenar_guncelle(ui, vi, trafik=trafik)
+        return {kaynak: agac.kenar_guncellendi(ui, vi, eski_maliyetler[kaynak])
+                for kaynak, agac in self._dinamik_agaclar.items()}
 
     def gercek_maliyet_hesapla(self, yol):
         #Karşılaştırmanın adil olması için her iki rotanın da hem mesafesini hem de trafik cezasını hesaplıyoruz
         toplam_km = 0
         toplam_puan = 0
-        CEZA_KATSAYISI = 10.0 
         
         if not yol: return 0, 0
 
@@ -45,17 +77,22 @@ class InteraktifAgSimulasyonu:
             u, v = yol[i], yol[i+1]
             data = self.graph[u][v]
             km = data['weight']
-            trafik = data['traffic']
             
             toplam_km += km
             #Geliştirdiğimiz algoritmada Mesafe * (1 + Trafik Cezası) formülü ile gerçek zorluğu buluyoruz
-            maliyet = km * (1 + (trafik * CEZA_KATSAYISI))
+            maliyet = self.maliyet_modeli.kenar_maliyeti(data)
             toplam_puan += maliyet
             
         return round(toplam_km, 2), round(toplam_puan, 2)
 
-    def klasik_dijkstra(self, baslangic, hedef):
+    def klasik_dijkstra(self, baslangic, hedef, kompakt=False, izleme=None):
         try:
+            if kompakt:
+                motor = self.kompakt_motor()
+                return motor.en_kisa_yol(baslangic, hedef, motor.graf.maliyet_listesi(), izleme)[0]
+            if izleme is not None:
+                return self._izlemeli_dijkstra(baslangic, hedef, MesafeMaliyeti(), izleme)
+
             #Klasik algoritma sadece fiziksel mesafeye bakar, trafiği görmezden gelir
             mesafeler = {node: float('infinity') for node in self.graph.nodes}
             mesafeler[baslangic] = 0
@@ -77,10 +114,20 @@ class InteraktifAgSimulasyonu:
         except:
             return []
 
-    def modifiye_dijkstra(self, baslangic, hedef):
+    def modifiye_dijkstra(self, baslangic, hedef, kompakt=False, dinamik=False, izleme=None):
         try:
             #Bizim geliştirdiğimiz algoritma: Mesafeyi trafik yoğunluğu ile çarparak sanal bir maliyet çıkarır
-            CEZA_KATSAYISI = 10.0
+            maliyet_modeli = self.maliyet_modeli
+            if dinamik:
+                if baslangic not in self._dinamik_agaclar:
+                    self._dinamik_agaclar[baslangic] = DinamikEnKisaYolAgaci(self.kompakt_motor().graf, baslangic, maliyet_modeli)
+                return self._dinamik_agaclar[baslangic].yol(hedef)[0]
+            if kompakt:
+                motor = self.kompakt_motor()
+                return motor.en_kisa_yol(baslangic, hedef, motor.graf.maliyet_listesi(maliyet_modeli), izleme)[0]
+            if izleme is not None:
+                return self._izlemeli_dijkstra(baslangic, hedef, maliyet_modeli, izleme)
+
             mesafeler = {node: float('infinity') for node in self.graph.nodes}
             mesafeler[baslangic] = 0
             pq = [(0, baslangic)]
@@ -92,11 +139,8 @@ class InteraktifAgSimulasyonu:
                 if mevcut_maliyet > mesafeler[mevcut_dugum]: continue
 
                 for komsu, ozellikler in self.graph[mevcut_dugum].items():
-                    mesafe = ozellikler['weight']
-                    trafik = ozellikler['traffic']
-                    
-                    #Dinamik Maliyet Hesabı: Yol tıkalıysa maliyeti 10 katına kadar artırıyoruz
-                    efektif_maliyet = mesafe * (1 + (trafik * CEZA_KATSAYISI))
+                    #Dinamik Maliyet Hesabı: Yol tıkalıysa maliyeti ceza katsayısı oranında artırıyoruz
+                    efektif_maliyet = maliyet_modeli.kenar_maliyeti(ozellikler)
                     
                     yeni_maliyet = mevcut_maliyet + efektif_maliyet
                     if yeni_maliyet < mesafeler[komsu]:
@@ -107,6 +151,31 @@ class InteraktifAgSimulasyonu:
         except:
             return []
 
+    def a_yildiz(self, baslangic, hedef, trafik_duyarli=False):
+        """
+        Router koordinatlarını kullanarak hedefe yönlendirilmiş arama (A*) yapar.
+        Trafik çarpanı her zaman 1 veya daha büyük olduğu için aynı kuş uçuşu tahmini cezalı maliyette de geçerlidir.
+        (Özel bir maliyet modeli kullanılıyorsa onun da mesafeden küçük olmaması gerekir.)
+        """
+        hx, hy = self.pos[hedef]
+        olcek = self._sezgisel_olcek
+        pos = self.pos
+        sezgisel = lambda dugum: olcek * math.hypot(pos[dugum][0] - hx, pos[dugum][1] - hy)
+        maliyet_modeli = self.maliyet_modeli if trafik_duyarli else MesafeMaliyeti()
+
+        yol, _, self.son_genisletilen = a_yildiz(self.graph, baslangic, hedef, sezgisel, maliyet_modeli.kenar_maliyeti)
+        return yol
+
+    def parametrik_rota(self, baslangic, hedef, ceza_araligi=(0, None)):
+        #Ceza katsayısı aralığındaki bütün en iyi rotalar; kaydırıcı her değerde yeni arama yapmadan bunu sorgular
+        return ParametrikRota.hesapla(self.graph, baslangic, hedef, ceza_araligi)
+
+    def _izlemeli_dijkstra(self, baslangic, hedef, maliyet_modeli, izleme):
+        #Sayaçlı döngü ayrı tutulur, böylece izleme kapalıyken normal döngüye hiçbir ek iş gelmez
+        _, onceki = izlemeli_dijkstra(self.graph, baslangic, hedef, maliyet_modeli.kenar_maliyeti, izleme)
+        with izleme.asama('rota'):
+            return self._yolu_kur(hedef, onceki)
+
     def _yolu_kur(self, hedef, onceki_sozlugu):
         #Bulunan en kısa yolu sondan başa doğru birleştirerek listeyi oluşturuyoruz
         yol = []
@@ -116,68 +185,157 @@ class InteraktifAgSimulasyonu:
             curr = onceki_sozlugu[curr]
         return yol
 
+class HaritaCizimi:
+    """
+    Haritayı her sorguda baştan çizmek yerine temel ağı (kablolar ve routerlar) bir kez kalıcı
+    koleksiyonlar olarak kurar. Sorgularda sadece iki rota katmanı ve sonuç kutusu güncellenir;
+    arka plan bir kez kopyalanıp (blitting) sadece bu hareketli parçalar üzerine çizilir.
+    """
+    #Bu kadar routerdan büyük haritalarda router ve trafik etiketleri okunmaz hale gelir
+    #ve her tam çizimde binlerce metin kutusu çizilmesi arayüzü yavaşlatır
+    ETIKET_SINIRI = 300
+
+    def __init__(self, simulasyon, ax):
+        self.simulasyon = simulasyon
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        graph = simulasyon.graph
+
+        #Router koordinatları ve kabloların uç indeksleri dizi olarak bir kez çıkarılır
+        dugumler = list(graph.nodes)
+        indeks = {dugum: i for i, dugum in enumerate(dugumler)}
+        self.koordinatlar = np.array([simulasyon.pos[dugum] for dugum in dugumler], dtype=np.float64)
+        self.kenarlar = list(graph.edges())
+        self.kenar_indeksi = {}
+        for i, (u, v) in enumerate(self.kenarlar):
+            self.kenar_indeksi[(u, v)] = i
+            self.kenar_indeksi[(v, u)] = i
+        uclar = np.array([(indeks[u], indeks[v]) for u, v in self.kenarlar], dtype=np.int64).reshape(-1, 2)
+        self.trafikler = np.array([graph.edges[u, v]['traffic'] for u, v in self.kenarlar], dtype=np.float64)
+
+        #1. KALICI TEMEL AĞ
+        self.kablolar = LineCollection(self.koordinatlar[uclar], zorder=1)
+        ax.add_collection(self.kablolar)
+        self.routerlar = ax.scatter(self.koordinatlar[:, 0], self.koordinatlar[:, 1], s=300, c='lightgrey', zorder=2)
+        self.etiketli = len(dugumler) <= self.ETIKET_SINIRI
+        if self.etiketli:
+            for dugum, (x, y) in zip(dugumler, self.koordinatlar):
+                ax.text(x, y, str(dugum), fontsize=8, fontweight='bold', ha='center', va='center', zorder=3)
+        #Kırmızı yolların yüzde etiketleri: kenar indeksi -> Text
+        self.trafik_etiketleri = {}
+        self._renkleri_uygula(np.arange(len(self.kenarlar)))
+
+        ax.set_title(f"{len(dugumler)} Router'lı Akıllı Ağ Simülasyonu", fontsize=14)
+        ax.set_axis_off()
+        ax.autoscale_view()
+
+        #2. HAREKETLİ KATMANLAR: sadece bunlar sorgudan sorguya değişir
+        self.rota_klasik, = ax.plot([], [], color='blue', linewidth=4, linestyle='--', alpha=0.7, zorder=4,
+                                    label='Dijkstra (Mesafe Duyarlı)', animated=True)
+        self.rota_modifiye, = ax.plot([], [], color='purple', linewidth=3, alpha=0.9, zorder=5,
+                                      label='Geliştirilmiş Dijkstra (Trafik Duyarlı)', animated=True)
+        self.sonuc_kutusu = ax.text(0.02, 0.98, "", transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                                    fontname='monospace', zorder=6, animated=True,
+                                    bbox=dict(boxstyle='round', facecolor='white', alpha=0.95, edgecolor='black'))
+        self.lejant = ax.legend(handles=[self.rota_klasik, self.rota_modifiye], loc='upper right')
+        self.lejant.set_animated(True)
+        self.lejant.set_visible(False)
+
+        #Tam çizimden sonra (pencere açılışı, yeniden boyutlandırma, trafik rengi değişimi) arka plan yeniden alınır
+        self._arka_plan = None
+        self.canvas.mpl_connect('draw_event', self._tam_cizimden_sonra)
+
+    def _renkleri_uygula(self, degisenler):
+        #Renk ve kalınlık dizileri vektörel hesaplanıp mevcut koleksiyona yerinde yazılır
+        trafikler = self.trafikler
+        kirmizi = trafikler > 0.75
+        turuncu = (trafikler > 0.40) & ~kirmizi
+        renkler = np.where(kirmizi[:, None], to_rgba('red'),
+                           np.where(turuncu[:, None], to_rgba('orange'), to_rgba('lightgreen')))
+        self.kablolar.set_color(renkler)
+        self.kablolar.set_linewidth(np.where(kirmizi, 2.0, np.where(turuncu, 1.5, 1.0)))
+
+        #Ekranın karışmaması için sadece Kırmızı (%75 üzeri) yollara yüzde etiketi basıyoruz
+        if not self.etiketli:
+            return
+        for i in degisenler.tolist():
+            etiket = self.trafik_etiketleri.get(i)
+            if not kirmizi[i]:
+                if etiket is not None:
+                    etiket.remove()
+                    del self.trafik_etiketleri[i]
+                continue
+            metin = f"%{int(trafikler[i] * 100)}"
+            if etiket is None:
+                u, v = self.kenarlar[i]
+                (x1, y1), (x2, y2) = self.simulasyon.pos[u], self.simulasyon.pos[v]
+                self.trafik_etiketleri[i] = self.ax.text(
+                    (x1 + x2) / 2, (y1 + y2) / 2, metin, fontsize=7, color='darkred', fontweight='bold',
+                    ha='center', va='center', zorder=3, bbox=dict(boxstyle='round', ec='white', fc='white'))
+            else:
+                etiket.set_text(metin)
+
+    def trafik_renklerini_guncelle(self, kablolar=None):
+        """
+        Trafiği değişen kabloların (u, v) rengini ve etiketini yeniden hesaplar; verilmezse hepsi okunur.
+        Temel ağ değiştiği için ardından tek bir tam çizim istenir.
+        """
+        graph = self.simulasyon.graph
+        if kablolar is None:
+            kablolar = self.kenarlar
+        degisenler = np.array([self.kenar_indeksi[(u, v)] for u, v in kablolar], dtype=np.int64)
+        self.trafikler[degisenler] = [graph.edges[u, v]['traffic'] for u, v in kablolar]
+        self._renkleri_uygula(degisenler)
+        self.canvas.draw_idle()
+
+    def _tam_cizimden_sonra(self, event):
+        if self.canvas.supports_blit:
+            self._arka_plan = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._hareketlileri_ciz()
+
+    def _hareketlileri_ciz(self):
+        for parca in (self.rota_klasik, self.rota_modifiye, self.sonuc_kutusu, self.lejant):
+            if parca.get_visible():
+                self.ax.draw_artist(parca)
+
+    def _rota_verisi(self, cizgi, yol):
+        if yol:
+            xy = np.array([self.simulasyon.pos[dugum] for dugum in yol], dtype=np.float64)
+            cizgi.set_data(xy[:, 0], xy[:, 1])
+        else:
+            cizgi.set_data([], [])
+
+    def guncelle(self, yol_klasik=None, yol_modifiye=None, sonuc_metni=""):
+        #Sadece iki rota katmanı ve sonuç kutusu değişir, temel ağa dokunulmaz
+        self._rota_verisi(self.rota_klasik, yol_klasik)
+        self._rota_verisi(self.rota_modifiye, yol_modifiye)
+        self.sonuc_kutusu.set_text(sonuc_metni)
+        self.sonuc_kutusu.set_visible(bool(sonuc_metni))
+        self.lejant.set_visible(bool(yol_klasik or yol_modifiye))
+
+        if self._arka_plan is None:
+            #Henüz tam çizim yapılmadıysa (ya da arka uç blitting desteklemiyorsa) normal çizim istenir
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._arka_plan)
+        self._hareketlileri_ciz()
+        self.canvas.blit(self.ax.bbox)
+
+
 #Simülasyonu başlatıyoruz ve arayüz pencerelerini ayarlıyoruz
 simulation = InteraktifAgSimulasyonu(dugum_sayisi=50)
 fig, ax = plt.subplots(figsize=(13, 8))
 #Alt kısımda buton ve kutucuklara yer açmak için boşluk bırakıyoruz
 plt.subplots_adjust(bottom=0.2) 
+harita = HaritaCizimi(simulation, ax)
+
+#Kaydırıcının katsayı aralığı; son sorgunun parametrik sonucu ve mesafe duyarlı rotası burada tutulur
+CEZA_ARALIGI = (0.0, 30.0)
+son_sorgu = {}
 
 def haritayi_ciz(yol_klasik=None, yol_modifiye=None, sonuc_metni=""):
-    ax.clear()
-    
-    #Kenarları trafik yoğunluğuna göre renklendiriyoruz (Yeşil-Turuncu-Kırmızı)
-    edges = simulation.graph.edges()
-    colors = []
-    widths = []
-    
-    for u, v in edges:
-        trafik = simulation.graph[u][v]['traffic']
-        
-        if trafik > 0.75:       #Çok Yoğun Trafik (Kırmızı)
-            colors.append('red')      
-            widths.append(2.0)
-        elif trafik > 0.40:     #Orta Yoğunluk (Turuncu)
-            colors.append('orange')   
-            widths.append(1.5)
-        else:                   #Rahat Trafik (Yeşil)
-            colors.append('lightgreen') 
-            widths.append(1.0)
-    
-    nx.draw(simulation.graph, simulation.pos, ax=ax, 
-            node_color='lightgrey', node_size=300, 
-            edge_color=colors, width=widths, 
-            with_labels=True, font_size=8, font_weight='bold')
-    
-    #Ekranın karışmaması için sadece Kırmızı (%75 üzeri) yollara yüzde etiketi basıyoruz
-    edge_labels = {}
-    for u, v, d in simulation.graph.edges(data=True):
-        if d['traffic'] > 0.75:
-             edge_labels[(u, v)] = f"%{int(d['traffic']*100)}"
-             
-    nx.draw_networkx_edge_labels(simulation.graph, simulation.pos, ax=ax, 
-                                 edge_labels=edge_labels, font_size=7, font_color='darkred', font_weight='bold')
-
-    #Klasik Dijkstra'nın bulduğu yolu Mavi ve Kesikli çizgiyle gösteriyoruz
-    if yol_klasik:
-        edges_k = list(zip(yol_klasik, yol_klasik[1:]))
-        nx.draw_networkx_edges(simulation.graph, simulation.pos, ax=ax, edgelist=edges_k, 
-                               edge_color='blue', width=4, style='dashed', alpha=0.7, label='Dijkstra (Mesafe Duyarlı)')
-        
-    #Bizim Akıllı Algoritmanın bulduğu yolu Mor ve Düz çizgiyle gösteriyoruz
-    if yol_modifiye:
-        edges_m = list(zip(yol_modifiye, yol_modifiye[1:]))
-        nx.draw_networkx_edges(simulation.graph, simulation.pos, ax=ax, edgelist=edges_m, 
-                               edge_color='purple', width=3, alpha=0.9, label='Geliştirilmiş Dijkstra (Trafik Duyarlı)')
-
-    #Sonuçları gösteren bilgi kutusunu sol üst köşeye yerleştiriyoruz
-    if sonuc_metni:
-        props = dict(boxstyle='round', facecolor='white', alpha=0.95, edgecolor='black')
-        ax.text(0.02, 0.98, sonuc_metni, transform=ax.transAxes, fontsize=10,
-                verticalalignment='top', bbox=props, fontname='monospace')
-
-    ax.set_title("50 Router'lı Akıllı Ağ Simülasyonu", fontsize=14)
-    if yol_klasik or yol_modifiye: ax.legend(loc='upper right')
-    plt.draw()
+    #Temel ağ bir kez kuruldu; burada sadece rotalar ve sonuç kutusu güncellenir
+    harita.guncelle(yol_klasik, yol_modifiye, sonuc_metni)
 
 def hesapla(event):
     try:
@@ -190,9 +348,11 @@ def hesapla(event):
             haritayi_ciz(sonuc_metni="HATA: Haritada görünen\nnumaraları giriniz.")
             return
 
-        #Her iki algoritmayı da çalıştırıp rotaları buluyoruz
-        path_k = simulation.klasik_dijkstra(start_node, end_node)
-        path_m = simulation.modifiye_dijkstra(start_node, end_node)
+        #Her iki algoritmayı da koordinatlarla hedefe yönlendirilmiş A* modunda çalıştırıp rotaları buluyoruz
+        path_k = simulation.a_yildiz(start_node, end_node)
+        gezilen_k = simulation.son_genisletilen
+        path_m = simulation.a_yildiz(start_node, end_node, trafik_duyarli=True)
+        gezilen_m = simulation.son_genisletilen
         
         if not path_k:
             haritayi_ciz(sonuc_metni="HATA: Yol bulunamadı!")
@@ -208,14 +368,20 @@ def hesapla(event):
             f"--- {start_node} -> {end_node} ANALİZİ ---\n\n"
             f" Dijkstra Algoritması\n"
             f"• Mesafe:   {km_k} km\n"
-            f"• SÜRE/PUAN: {puan_k}\n\n"
+            f"• SÜRE/PUAN: {puan_k}\n"
+            f"• Gezilen:  {gezilen_k} router\n\n"
             f" Geliştirilmiş Dijkstra Algoritması\n"
             f"• Mesafe:   {km_m} km\n"
-            f"• SÜRE/PUAN: {puan_m}\n\n"
+            f"• SÜRE/PUAN: {puan_m}\n"
+            f"• Gezilen:  {gezilen_m} router\n\n"
             f"SONUÇ: {round(fark, 2)} puan kâr!"
         )
 
         haritayi_ciz(path_k, path_m, sonuc_metni)
+
+        #Kaydırıcı için bütün katsayılardaki rotaları bir kez hesaplıyoruz
+        son_sorgu.update(baslangic=start_node, hedef=end_node, yol_klasik=path_k,
+                         parametrik=simulation.parametrik_rota(start_node, end_node, CEZA_ARALIGI))
         
     except ValueError:
         print("Lütfen sayı girin!")
@@ -231,6 +397,28 @@ axbtn = plt.axes([0.6, 0.05, 0.2, 0.075])
 btn = Button(axbtn, 'HESAPLA', color='lightgreen', hovercolor='0.975')
 btn.on_clicked(hesapla)
 
+def ceza_degisti(ceza_katsayisi):
+    #Rota aramasız, hesaplanmış alt zarftan okunur
+    if not son_sorgu:
+        return
+    parametrik = son_sorgu['parametrik']
+    yol, puan = parametrik.rota(ceza_katsayisi)
+    km, _ = simulation.gercek_maliyet_hesapla(yol)
+    kirilmalar = ", ".join(f"{c:.2f}" for c in parametrik.kirilma_noktalari) or "yok"
+    sonuc_metni = (
+        f"--- {son_sorgu['baslangic']} -> {son_sorgu['hedef']} CEZA KATSAYISI {ceza_katsayisi:.2f} ---\n\n"
+        f"• Mesafe:   {km} km\n"
+        f"• SÜRE/PUAN: {round(puan, 2)}\n\n"
+        f"Aralıktaki farklı rota: {len(parametrik.rotalar)}\n"
+        f"Rotanın değiştiği katsayılar:\n{kirilmalar}"
+    )
+    haritayi_ciz(son_sorgu['yol_klasik'], yol, sonuc_metni)
+
+axslider = plt.axes([0.2, 0.13, 0.6, 0.03])
+ceza_kaydirici = Slider(axslider, 'Ceza Katsayısı', CEZA_ARALIGI[0], CEZA_ARALIGI[1],
+                        valinit=VARSAYILAN_CEZA_KATSAYISI)
+ceza_kaydirici.on_changed(ceza_degisti)
+
 #Program açıldığında kullanıcıya talimat veriyoruz
 haritayi_ciz(sonuc_metni="Lütfen düğüm seçip hesaplayın.")
 plt.show()
\ No newline at end of file
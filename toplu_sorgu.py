@@ -0,0 +1,93 @@
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from kompakt_graf import KompaktGraf, KompaktDijkstra, paylasimli_bellege_yaz, paylasimli_bellekten_oku
+
+def _grubu_coz(motor, maliyetler, kaynak, hedefler):
+    #Bir kaynağın bütün hedefleri tek Dijkstra ile çözülür, sonuçlar kimlik listesi olarak döner
+    motor.hedeflere_calistir(kaynak, maliyetler, hedefler)
+    return {hedef: (motor.yol_kimlikleri(hedef), motor.mesafeler[hedef]) for hedef in hedefler}
+
+
+#İşçi süreç başına bir kez kurulan motor
+_ISCI = {}
+
+def _isci_baslat(topoloji_tanimi):
+    diziler, bloklar = paylasimli_bellekten_oku(topoloji_tanimi)
+    n = len(diziler['ofsetler']) - 1
+    graf = KompaktGraf(range(n), diziler['ofsetler'], diziler['komsular'], diziler['maliyetler'], np.zeros(0))
+    _ISCI['motor'] = KompaktDijkstra(graf)
+    _ISCI['maliyetler'] = graf.maliyet_listesi()
+    _ISCI['bloklar'] = bloklar
+
+
+def _isci_grubu_coz(kaynak, hedefler):
+    return _grubu_coz(_ISCI['motor'], _ISCI['maliyetler'], kaynak, hedefler)
+
+
+def toplu_rota(graf, maliyetler, ciftler, isci_sayisi=1, on_gonderim=None):
+    """
+    (kaynak, hedef) çiftlerini kaynağa göre gruplayıp her kaynak için tek bir arama yapar.
+    Sonuçlar (yol, maliyet) olarak, girişteki çift sırasıyla akıtılır (generator).
+    isci_sayisi > 1 ise kaynak grupları süreç havuzuna dağıtılır; on_gonderim aynı anda
+    havuzda bekleyen en fazla grup sayısıdır.
+    """
+    indeks = graf.indeks
+    etiketler = graf.etiketler
+    ciftler = [(indeks[kaynak], indeks[hedef]) for kaynak, hedef in ciftler]
+
+    #Grupları kaynağın ilk görüldüğü sırayla kuruyoruz, bu sıra çıktının ihtiyaç sırasıyla aynıdır
+    gruplar = {}
+    for kaynak, hedef in ciftler:
+        gruplar.setdefault(kaynak, {})[hedef] = None
+    #Bir grubun sonucu, o kaynağa ait son çift de teslim edilince bellekten atılır
+    kalan = Counter(kaynak for kaynak, _ in ciftler)
+    sonuclar = {}
+
+    def etiketle(sonuc):
+        yol, maliyet = sonuc
+        return [etiketler[i] for i in yol], maliyet
+
+    if isci_sayisi == 1:
+        motor = KompaktDijkstra(graf)
+        maliyet_listesi = maliyetler if isinstance(maliyetler, list) else np.asarray(maliyetler).tolist()
+        for kaynak, hedef in ciftler:
+            if kaynak not in sonuclar:
+                sonuclar[kaynak] = _grubu_coz(motor, maliyet_listesi, kaynak, list(gruplar[kaynak]))
+            yield etiketle(sonuclar[kaynak][hedef])
+            kalan[kaynak] -= 1
+            if not kalan[kaynak]:
+                del sonuclar[kaynak]
+        return
+
+    on_gonderim = on_gonderim or 4 * isci_sayisi
+    topoloji_tanimi, bloklar = paylasimli_bellege_yaz({
+        'ofsetler': graf.ofsetler,
+        'komsular': graf.komsular,
+        'maliyetler': np.asarray(maliyetler),
+    })
+    try:
+        with ProcessPoolExecutor(max_workers=isci_sayisi, initializer=_isci_baslat,
+                                 initargs=(topoloji_tanimi,)) as havuz:
+            #Grupları sırayla ve en fazla on_gonderim kadar önde olacak şekilde havuza veriyoruz
+            sira = deque(gruplar)
+            gonderilen = {}
+
+            def doldur():
+                while sira and len(gonderilen) < on_gonderim:
+                    kaynak = sira.popleft()
+                    gonderilen[kaynak] = havuz.submit(_isci_grubu_coz, kaynak, list(gruplar[kaynak]))
+
+            doldur()
+            for kaynak, hedef in ciftler:
+                if kaynak not in sonuclar:
+                    sonuclar[kaynak] = gonderilen.pop(kaynak).result()
+                    doldur()
+                yield etiketle(sonuclar[kaynak][hedef])
+                kalan[kaynak] -= 1
+                if not kalan[kaynak]:
+                    del sonuclar[kaynak]
+    finally:
+        for blok in bloklar:
+            blok.close()
+            blok.unlink()
@@ -0,0 +1,183 @@
+import csv
+import json
+import time
+import numpy as np
+
+def jsonl_kaynagi(dosya):
+    """
+    Her satırı {"u": .., "v": .., "traffic": ..} olan JSONL akışından (u, v, trafik) üretir.
+    dosya bir yol ya da açık bir dosya nesnesi (örneğin sys.stdin) olabilir.
+    """
+    if isinstance(dosya, str):
+        with open(dosya, encoding='utf-8') as akis:
+            yield from jsonl_kaynagi(akis)
+        return
+    for satir in dosya:
+        satir = satir.strip()
+        if not satir:
+            continue
+        kayit = json.loads(satir)
+        yield kayit['u'], kayit['v'], float(kayit['traffic'])
+
+
+def csv_kaynagi(dosya):
+    #Başlığı u,v,traffic olan CSV akışından (u, v, trafik) üretir
+    if isinstance(dosya, str):
+        with open(dosya, newline='', encoding='utf-8') as akis:
+            yield from csv_kaynagi(akis)
+        return
+    for kayit in csv.DictReader(dosya):
+        yield kayit['u'], kayit['v'], float(kayit['traffic'])
+
+
+def mikro_partiler(guncellemeler, parti_boyutu=1000, sure_siniri_s=None):
+    """
+    Güncelleme akışını mikro partilere böler ve aynı yola gelen tekrarlı güncellemeleri birleştirir
+    (sadece son değer kalır). Her parti (birleştirilmiş sözlük, ham güncelleme sayısı) olarak verilir.
+    sure_siniri_s verilirse yavaş akan kaynaklarda parti dolmasa da bu süre sonunda gönderilir.
+    """
+    parti = {}
+    ham = 0
+    baslangic = time.perf_counter()
+    for u, v, trafik in guncellemeler:
+        #Yönsüz ağda u-v ve v-u aynı kablodur
+        anahtar = (v, u) if (v, u) in parti else (u, v)
+        parti[anahtar] = trafik
+        ham += 1
+        if ham >= parti_boyutu or (sure_siniri_s is not None and time.perf_counter() - baslangic >= sure_siniri_s):
+            yield parti, ham
+            parti = {}
+            ham = 0
+            baslangic = time.perf_counter()
+    if ham:
+        yield parti, ham
+
+
+class TrafikAkisi:
+    """
+    Telemetriden gelen trafik güncellemelerini AkilliAgSimulasyonu'na mikro partiler halinde uygular.
+    İzlenen her rota için kaynağın dinamik en kısa yol ağacı tutulur; güncellemeler ağacı yerinde onarır
+    ve parti sonunda sadece maliyeti değişmiş olabilecek rotalar yeniden okunur.
+    """
+    def __init__(self, simulasyon, izlenen_rotalar=(), maliyet_modeli=None, parti_boyutu=1000, sure_siniri_s=None):
+        self.simulasyon = simulasyon
+        self.maliyet_modeli = maliyet_modeli or simulasyon.maliyet_modeli
+        self.parti_boyutu = parti_boyutu
+        self.sure_siniri_s = sure_siniri_s
+        #(kaynak, hedef) -> (yol, maliyet)
+        self.rotalar = {}
+        #CSV'den metin olarak gelen router adlarını ağdaki etiketlere çevirmek için
+        self._etiketler = {str(etiket): etiket for etiket in simulasyon.graph.nodes}
+
+        self.toplam_guncelleme = 0
+        self.uygulanan_guncelleme = 0
+        self.bilinmeyen_yol = 0
+        self.parti_sayisi = 0
+        self.yeniden_okunan_rota = 0
+        self.degisen_rota = 0
+        self._alim_suresi = 0.0
+        self._yenileme_sureleri = []
+
+        for kaynak, hedef in izlenen_rotalar:
+            self.izle(kaynak, hedef)
+
+    def izle(self, kaynak, hedef):
+        #Rota izlemeye alınırken kaynağın dinamik ağacı (yoksa) bir kez kurulur
+        agac = self.simulasyon.dinamik_agac(kaynak, self.maliyet_modeli)
+        self.rotalar[(kaynak, hedef)] = agac.yol(hedef)
+        return self.rotalar[(kaynak, hedef)]
+
+    def _etiket(self, router):
+        if router in self.simulasyon.graph:
+            return router
+        return self._etiketler.get(str(router))
+
+    def parti_uygula(self, parti):
+        """
+        Birleştirilmiş bir partiyi uygular ve değişen izlenen rotaları {(kaynak, hedef): (yol, maliyet)} döndürür.
+        """
+        sim = self.simulasyon
+        anahtar = self.maliyet_modeli.anahtar
+        #Onarımı herhangi bir düğüme dokunan kaynaklar ve trafiği değişen kablolar
+        etkilenen_kaynaklar = set()
+        degisen_kablolar = set()
+
+        guncellemeler = []
+        for (u, v), trafik in parti.items():
+            u, v = self._etiket(u), self._etiket(v)
+            if u is None or v is None or not sim.graph.has_edge(u, v):
+                self.bilinmeyen_yol += 1
+                continue
+            if sim.graph.edges[u, v].get('traffic') == trafik:
+                continue
+            guncellemeler.append((u, v, trafik))
+            degisen_kablolar.add((u, v))
+            degisen_kablolar.add((v, u))
+        self.uygulanan_guncelleme += len(guncellemeler)
+
+        #Partideki bütün değişiklikler için her ağaç tek bir onarım dalgasıyla güncellenir
+        if guncellemeler:
+            for (kaynak, agac_anahtari), dokunulan in sim.trafik_toplu_guncelle(guncellemeler).items():
+                if dokunulan and agac_anahtari == anahtar:
+                    etkilenen_kaynaklar.add(kaynak)
+
+        #ROTA YENİLEME: ağacı değişmeyen kaynakların rotaları aynen geçerlidir
+        t0 = time.perf_counter_ns()
+        degisenler = {}
+        for (kaynak, hedef), (eski_yol, eski_maliyet) in self.rotalar.items():
+            if kaynak not in etkilenen_kaynaklar:
+                continue
+            agac = sim.dinamik_agac(kaynak, self.maliyet_modeli)
+            yeni_maliyet = agac.mesafeler[agac.graf.indeks[hedef]]
+            #Maliyet aynı kaldıysa ve rotanın kablolarından hiçbiri güncellenmediyse rota aynıdır
+            if yeni_maliyet == eski_maliyet and not any(k in degisen_kablolar for k in zip(eski_yol, eski_yol[1:])):
+                continue
+            self.yeniden_okunan_rota += 1
+            yeni = agac.yol(hedef)
+            if yeni != (eski_yol, eski_maliyet):
+                self.rotalar[(kaynak, hedef)] = yeni
+                degisenler[(kaynak, hedef)] = yeni
+        self._yenileme_sureleri.append(time.perf_counter_ns() - t0)
+        self.degisen_rota += len(degisenler)
+        self.parti_sayisi += 1
+        return degisenler
+
+    def isle(self, guncellemeler):
+        """
+        Bir güncelleme akışını (jsonl_kaynagi, csv_kaynagi ya da (u, v, trafik) üreten herhangi bir generator)
+        sonuna kadar tüketir. Her parti için değişen rotaları içeren bir rapor sözlüğü üretir (generator).
+        """
+        akis = iter(mikro_partiler(guncellemeler, self.parti_boyutu, self.sure_siniri_s))
+        while True:
+            #Alım süresi: kaynağı okuma + birleştirme + uygulama (rota yenileme hariç)
+            t0 = time.perf_counter()
+            try:
+                parti, ham = next(akis)
+            except StopIteration:
+                self._alim_suresi += time.perf_counter() - t0
+                return
+            self.toplam_guncelleme += ham
+            degisenler = self.parti_uygula(parti)
+            self._alim_suresi += time.perf_counter() - t0 - self._yenileme_sureleri[-1] / 1e9
+            yield {
+                'ham_guncelleme': ham,
+                'birlesmis_guncelleme': len(parti),
+                'degisen_rotalar': degisenler,
+                'yenileme_ms': self._yenileme_sureleri[-1] / 1e6,
+            }
+
+    def istatistikler(self):
+        yenileme = np.asarray(self._yenileme_sureleri, dtype=np.float64) / 1e6
+        return {
+            'toplam_guncelleme': self.toplam_guncelleme,
+            'uygulanan_guncelleme': self.uygulanan_guncelleme,
+            #Aynı partide tekrar eden ya da trafiği zaten aynı olduğu için atlanan güncellemeler
+            'atlanan_guncelleme': self.toplam_guncelleme - self.uygulanan_guncelleme - self.bilinmeyen_yol,
+            'bilinmeyen_yol': self.bilinmeyen_yol,
+            'parti_sayisi': self.parti_sayisi,
+            'guncelleme_hizi': self.toplam_guncelleme / self._alim_suresi if self._alim_suresi else 0.0,
+            'yeniden_okunan_rota': self.yeniden_okunan_rota,
+            'degisen_rota': self.degisen_rota,
+            'yenileme_medyan_ms': float(np.median(yenileme)) if len(yenileme) else 0.0,
+            'yenileme_p95_ms': float(np.percentile(yenileme, 95)) if len(yenileme) else 0.0,
+        }
@@ -0,0 +1,183 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from kompakt_graf import (KompaktGraf, KompaktDijkstra, paylasimli_bellek_ayir, paylasimli_bellege_yaz,
+                          paylasimli_bellekten_oku)
+
+def sonraki_sekme_satiri(onceki, kaynak):
+    """
+    Tek kaynaklı en kısa yol ağacından o router'ın yönlendirme tablosu satırını çıkarır.
+    Her hedef için paketin kaynaktan çıkarken gideceği ilk komşu yazılır, ulaşılamayan hedefler -1'dir.
+    """
+    n = len(onceki)
+    dugumler = np.arange(n, dtype=np.int32)
+
+    #Her düğüm ebeveynini gösterir, kaynağın doğrudan çocukları ise kendilerini gösterir
+    #Bu gösterimi kendisiyle art arda bileştirince (pointer jumping) her düğüm kaynağın çocuğu olan atasına ulaşır
+    ata = np.where((onceki == kaynak) | (onceki == -1), dugumler, onceki).astype(np.int32)
+    while True:
+        yeni_ata = ata[ata]
+        if np.array_equal(yeni_ata, ata):
+            break
+        ata = yeni_ata
+
+    #Ağaçta olmayan (ulaşılamayan) düğümlerin ilk sekmesi yoktur, kaynağın kendisi ise kendine yönlendirir
+    satir = np.where(onceki == -1, -1, ata).astype(np.int32)
+    satir[kaynak] = kaynak
+    return satir
+
+
+class YonlendirmeTablolari:
+    """
+    Tüm router'ların tam yönlendirme tabloları.
+    mesafeler[s, t] s'den t'ye en kısa maliyet, sonraki_sekme[s, t] s'nin t için seçtiği komşudur.
+    Matrisler paylaşımlı bellek bloklarının üzerindeyse bloklar tablolarla birlikte yaşar; kapat() (ya da with
+    bloğu) belleği hemen geri verir. kapat()'tan sonra dizilere dışarıda tutulan referans kalmamalıdır.
+    """
+    def __init__(self, etiketler, mesafeler, sonraki_sekme, bloklar=()):
+        self.etiketler = etiketler
+        self.indeks = {etiket: i for i, etiket in enumerate(etiketler)}
+        self.mesafeler = mesafeler
+        self.sonraki_sekme = sonraki_sekme
+        self._bloklar = list(bloklar)
+
+    def kapat(self):
+        #Önce bloklara bakan diziler bırakılır, aksi halde blok kapatılamaz
+        self.mesafeler = self.sonraki_sekme = None
+        for blok in self._bloklar:
+            blok.close()
+        self._bloklar = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *hata):
+        self.kapat()
+
+    def mesafe(self, kaynak, hedef):
+        return self.mesafeler[self.indeks[kaynak], self.indeks[hedef]].item()
+
+    def sonraki(self, kaynak, hedef):
+        #Paketin kaynaktan çıkacağı komşu router, yol yoksa None
+        sekme = self.sonraki_sekme[self.indeks[kaynak], self.indeks[hedef]]
+        return None if sekme == -1 else self.etiketler[sekme]
+
+    def yol(self, kaynak, hedef):
+        #Her router'ın kendi tablosuna bakarak paketi hop-hop ilerletiyoruz
+        if self.sonraki(kaynak, hedef) is None:
+            return []
+        yol = [kaynak]
+        while yol[-1] != hedef:
+            yol.append(self.sonraki(yol[-1], hedef))
+        return yol
+
+
+#İşçi süreç başına bir kez kurulan durum (topoloji ve çıktı dizileri)
+_ISCI = {}
+
+def _isci_baslat(topoloji_tanimi, cikti_tanimi, cikti_dosyalari):
+    diziler, bloklar = paylasimli_bellekten_oku(topoloji_tanimi)
+    n = len(diziler['ofsetler']) - 1
+    graf = KompaktGraf(range(n), diziler['ofsetler'], diziler['komsular'], diziler['maliyetler'], np.zeros(0))
+    _ISCI['motor'] = KompaktDijkstra(graf)
+    _ISCI['maliyetler'] = graf.maliyet_listesi()
+
+    #Satırlar ya diskteki .npy dosyalarına ya da paylaşımlı bellekteki matrislere doğrudan yazılır
+    if cikti_dosyalari is not None:
+        _ISCI['mesafeler'] = np.load(cikti_dosyalari[0], mmap_mode='r+')
+        _ISCI['sonraki_sekme'] = np.load(cikti_dosyalari[1], mmap_mode='r+')
+    else:
+        ciktilar, cikti_bloklari = paylasimli_bellekten_oku(cikti_tanimi)
+        _ISCI['mesafeler'] = ciktilar['mesafeler']
+        _ISCI['sonraki_sekme'] = ciktilar['sonraki_sekme']
+        bloklar += cikti_bloklari
+    #Bloklara referans tutmazsak çöp toplayıcı eşlemeyi kapatır
+    _ISCI['bloklar'] = bloklar
+
+
+def _kaynaklari_isle(kaynaklar):
+    motor = _ISCI['motor']
+    maliyetler = _ISCI['maliyetler']
+    mesafe_matrisi = _ISCI['mesafeler']
+    sonraki_matrisi = _ISCI['sonraki_sekme']
+    for kaynak in kaynaklar:
+        mesafeler, onceki = motor.agac_hesapla(kaynak, maliyetler)
+        mesafe_matrisi[kaynak] = mesafeler
+        sonraki_matrisi[kaynak] = sonraki_sekme_satiri(onceki, kaynak)
+    if isinstance(mesafe_matrisi, np.memmap):
+        mesafe_matrisi.flush()
+        sonraki_matrisi.flush()
+    return len(kaynaklar)
+
+
+def yonlendirme_tablolari_hesapla(graf, maliyetler, isci_sayisi=None, cikti_dizini=None, parca_boyutu=32):
+    """
+    Her router için bir kez tek kaynaklı Dijkstra çalıştırıp tüm ağın yönlendirme tablolarını üretir.
+    Kaynaklar parçalara bölünüp ProcessPoolExecutor işçilerine dağıtılır; topoloji paylaşımlı
+    bellekte durur ve her işçi onu bir kez açar.
+    cikti_dizini verilirse satırlar diskteki .npy dosyalarına akıtılır ve sonuç bellek eşlemeli döner.
+    Verilmezse işçiler paylaşımlı bellekte ayrılan matrislere yazar ve sonuç kopyalanmadan o blokların üzerinde
+    döner; tepe bellek bir kez 12·n² bayttır.
+    """
+    n = graf.dugum_sayisi
+    isci_sayisi = isci_sayisi or os.cpu_count() or 1
+
+    topoloji_tanimi, bloklar = paylasimli_bellege_yaz({
+        'ofsetler': graf.ofsetler,
+        'komsular': graf.komsular,
+        'maliyetler': np.asarray(maliyetler),
+    })
+    cikti_tanimi = None
+    cikti_dosyalari = None
+    cikti_bloklari = []
+    try:
+        if cikti_dizini is not None:
+            os.makedirs(cikti_dizini, exist_ok=True)
+            cikti_dosyalari = (os.path.join(cikti_dizini, 'mesafeler.npy'),
+                               os.path.join(cikti_dizini, 'sonraki_sekme.npy'))
+            #Dosyaları boş olarak oluşturuyoruz, satırları işçiler dolduracak
+            np.lib.format.open_memmap(cikti_dosyalari[0], mode='w+', dtype=np.float64, shape=(n, n))
+            np.lib.format.open_memmap(cikti_dosyalari[1], mode='w+', dtype=np.int32, shape=(n, n))
+        else:
+            #Matrisler ana süreçte kurulup kopyalanmaz, doğrudan paylaşımlı bellekte ayrılır
+            cikti_tanimi, cikti_bloklari = paylasimli_bellek_ayir({
+                'mesafeler': ((n, n), np.float64),
+                'sonraki_sekme': ((n, n), np.int32),
+            })
+
+        parcalar = [range(i, min(i + parca_boyutu, n)) for i in range(0, n, parca_boyutu)]
+        if isci_sayisi == 1:
+            #Tek işçide süreç havuzu kurmanın maliyetine girmiyoruz
+            _isci_baslat(topoloji_tanimi, cikti_tanimi, cikti_dosyalari)
+            try:
+                for parca in parcalar:
+                    _kaynaklari_isle(parca)
+            finally:
+                _ISCI.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=isci_sayisi, initializer=_isci_baslat,
+                                     initargs=(topoloji_tanimi, cikti_tanimi, cikti_dosyalari)) as havuz:
+                for _ in havuz.map(_kaynaklari_isle, parcalar):
+                    pass
+
+        if cikti_dosyalari is not None:
+            mesafeler = np.load(cikti_dosyalari[0], mmap_mode='r')
+            sonraki_sekme = np.load(cikti_dosyalari[1], mmap_mode='r')
+        else:
+            mesafeler = np.ndarray((n, n), dtype=np.float64, buffer=cikti_bloklari[0].buf)
+            sonraki_sekme = np.ndarray((n, n), dtype=np.int32, buffer=cikti_bloklari[1].buf)
+            #Blokların adı hemen silinir: eşleme tablolar kapatılana kadar geçerli kalır, süreç çökse bile
+            #sistemde sahipsiz paylaşımlı bellek kalmaz
+            for blok in cikti_bloklari:
+                blok.unlink()
+    except BaseException:
+        for blok in cikti_bloklari:
+            blok.close()
+            blok.unlink()
+        raise
+    finally:
+        for blok in bloklar:
+            blok.close()
+            blok.unlink()
+
+    return YonlendirmeTablolari(graf.etiketler, mesafeler, sonraki_sekme, cikti_bloklari)
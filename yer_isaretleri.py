@@ -0,0 +1,178 @@
+import random
+import numpy as np
+from kompakt_graf import KompaktGraf, KompaktDijkstra
+from maliyet_modeli import MesafeMaliyeti
+from a_yildiz import a_yildiz
+
+class YerIsaretleri:
+    """
+    ALT (A*, Landmarks, Triangle inequality): koordinatı olmayan ağlarda A* için sezgisel üretir.
+    Seçilen k yer işaretinden (landmark) tüm düğümlere ve tüm düğümlerden yer işaretlerine
+    mesafeler önceden hesaplanır. Üçgen eşitsizliğinden her L için:
+        d(v, t) >= d(L, t) - d(L, v)   ve   d(v, t) >= d(v, L) - d(t, L)
+    Bu sınırların en büyüğü gerçek kalan maliyeti hiçbir zaman aşmaz, dolayısıyla A* en kısa yolu bulur.
+    """
+    def __init__(self, etiketler, yer_isaretleri, ileri, geri=None, maliyet_modeli=None):
+        self.etiketler = list(etiketler)
+        self.indeks = {etiket: i for i, etiket in enumerate(self.etiketler)}
+        #Yer işaretlerinin düğüm kimlikleri
+        self.yer_isaretleri = np.asarray(yer_isaretleri, dtype=np.int64)
+        #ileri[i, v] = d(L_i, v), geri[i, v] = d(v, L_i); k x n boyutlu float64 tablolar
+        self.ileri = np.asarray(ileri, dtype=np.float64)
+        #Yönsüz ağda iki tablo aynıdır ve tek kopya tutulur
+        self.geri = self.ileri if geri is None else np.asarray(geri, dtype=np.float64)
+        #Tablolar bu modelin maliyetleriyle hesaplandı; sınırlar sadece aynı maliyetle aranan yollar için geçerlidir
+        self.maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+
+    @classmethod
+    def graftan(cls, graph, k=8, secim='en_uzak', maliyet_modeli=None, seed=42):
+        """
+        NetworkX grafı üzerinde k yer işareti seçip mesafe tablolarını hesaplar.
+        secim: 'en_uzak' (seçilenlere en uzak düğüm) veya 'kacinma' (avoid: alt sınırın en zayıf kaldığı bölge)
+        """
+        maliyet_modeli = maliyet_modeli or MesafeMaliyeti()
+        graf = KompaktGraf.graftan(graph)
+        motor = KompaktDijkstra(graf)
+        maliyetler = graf.maliyet_listesi(maliyet_modeli)
+        n = graf.dugum_sayisi
+        k = min(k, n)
+        rnd = random.Random(seed)
+
+        #Yönlü ağlarda "yer işaretine olan" mesafeler ters graf üzerinden hesaplanır
+        ters = None
+        if graph.is_directed():
+            ters_graf = KompaktGraf.graftan(graph.reverse(copy=False))
+            ters = (KompaktDijkstra(ters_graf), ters_graf.maliyet_listesi(maliyet_modeli))
+
+        secilenler = []
+        ileri = np.empty((k, n))
+        geri = np.empty((k, n)) if ters else None
+
+        def ekle(yer_isareti):
+            i = len(secilenler)
+            secilenler.append(yer_isareti)
+            ileri[i] = motor.agac_hesapla(yer_isareti, maliyetler)[0]
+            if ters:
+                geri[i] = ters[0].agac_hesapla(yer_isareti, ters[1])[0]
+
+        if secim == 'en_uzak':
+            #İlk yer işareti rastgele bir düğüme en uzak düğümdür, sonrakiler seçilenlere en uzak olanlardır
+            #Ulaşılamayan düğümler (başka bileşenler) aday sayılmaz, yer işaretleri ana bileşene harcanır
+            en_yakin = motor.agac_hesapla(rnd.randrange(n), maliyetler)[0]
+            while len(secilenler) < k:
+                aday = int(np.argmax(np.where(np.isfinite(en_yakin), en_yakin, -1)))
+                if not en_yakin[aday] > 0:
+                    break
+                ekle(aday)
+                yeni = ileri[len(secilenler) - 1]
+                en_yakin = yeni.copy() if len(secilenler) == 1 else np.minimum(en_yakin, yeni)
+        elif secim == 'kacinma':
+            #Kök rastgele seçilir; kökün bileşeni tamamen kapsanmışsa birkaç farklı kök denenir
+            deneme = 0
+            while len(secilenler) < k and deneme < 10:
+                aday = cls._kacinma_adayi(motor, maliyetler, ileri[:len(secilenler)], secilenler, rnd.randrange(n))
+                if aday is None:
+                    deneme += 1
+                    continue
+                ekle(aday)
+        else:
+            raise ValueError(f"Bilinmeyen yer işareti seçimi: {secim}")
+
+        m = len(secilenler)
+        return cls(graf.etiketler, secilenler, ileri[:m], geri[:m] if ters else None, maliyet_modeli)
+
+    @staticmethod
+    def _kacinma_adayi(motor, maliyetler, ileri, secilenler, kok):
+        """
+        Avoid seçimi: kökün en kısa yol ağacında her düğümün ağırlığı gerçek mesafe ile mevcut alt sınır
+        arasındaki farktır. Alt ağacında yer işareti olmayan ve toplam ağırlığı en büyük dala inilir,
+        ulaşılan yaprak yeni yer işaretidir.
+        """
+        mesafeler, onceki = motor.agac_hesapla(kok, maliyetler)
+        ulasilan = np.isfinite(mesafeler)
+        if len(ileri):
+            with np.errstate(invalid='ignore'):
+                alt_sinir = np.abs(ileri - ileri[:, [kok]])
+            alt_sinir = np.where(np.isfinite(alt_sinir), alt_sinir, 0).max(axis=0)
+        else:
+            alt_sinir = np.zeros(len(mesafeler))
+        agirlik = np.where(ulasilan, mesafeler - alt_sinir, 0)
+
+        #Alt ağaç toplamlarını yapraktan köke doğru (azalan mesafe sırasıyla) biriktiriyoruz
+        boyut = agirlik.copy()
+        isaretli = np.zeros(len(mesafeler), dtype=bool)
+        isaretli[secilenler] = True
+        for v in np.argsort(-np.where(ulasilan, mesafeler, -1), kind='stable').tolist():
+            if not ulasilan[v]:
+                continue
+            ebeveyn = onceki[v]
+            if ebeveyn != -1:
+                isaretli[ebeveyn] |= isaretli[v]
+                boyut[ebeveyn] += boyut[v]
+        boyut[isaretli] = 0
+
+        cocuklar = {}
+        for v, ebeveyn in enumerate(onceki.tolist()):
+            if ebeveyn != -1:
+                cocuklar.setdefault(ebeveyn, []).append(v)
+        adim = kok
+        while True:
+            adaylar = [c for c in cocuklar.get(adim, []) if boyut[c] > 0]
+            if not adaylar:
+                return adim if adim != kok else None
+            adim = max(adaylar, key=lambda c: boyut[c])
+
+    @property
+    def bayt(self):
+        #Tabloların bellekte kapladığı yer (k ayarlanırken bellek ile kesinleşen düğüm sayısı kıyaslanır)
+        return self.ileri.nbytes + (self.geri.nbytes if self.geri is not self.ileri else 0)
+
+    def sinir_dizisi(self, hedef):
+        #Tüm düğümlerin hedefe olan alt sınırları tek bir NumPy işlemiyle hesaplanır
+        t = self.indeks[hedef]
+        with np.errstate(invalid='ignore'):
+            adaylar = np.concatenate([self.ileri[:, [t]] - self.ileri, self.geri - self.geri[:, [t]]])
+        #Ulaşılamayan düğümlerde sonsuz - sonsuz tanımsızdır, o yer işareti sınıra katkı vermez
+        adaylar = np.where(np.isfinite(adaylar), adaylar, 0)
+        return np.maximum(adaylar.max(axis=0), 0) if len(adaylar) else np.zeros(len(self.etiketler))
+
+    def sezgisel(self, hedef):
+        """
+        a_yildiz'in beklediği sezgisel(dugum) fonksiyonunu üretir.
+        Sınır bütün ağ için değil, sadece A*'ın gördüğü düğümler için ilk istendiğinde o düğümün tablo
+        sütunundan hesaplanır ve sorgu boyunca saklanır; sorgunun işi kesinleşen düğüm sayısıyla orantılı kalır.
+        """
+        t = self.indeks[hedef]
+        ileri, geri = self.ileri, self.geri
+        hedef_ileri = ileri[:, t].tolist()
+        hedef_geri = geri[:, t].tolist()
+        indeks = self.indeks
+        sonsuz = float('infinity')
+        sinirlar = {}
+
+        def sezgisel(dugum):
+            v = indeks[dugum]
+            sinir = sinirlar.get(v)
+            if sinir is None:
+                #d(L, t) - d(L, v) ve d(v, L) - d(t, L); ulaşılamayan uçlarda fark sonsuz ya da tanımsızdır (nan),
+                #karşılaştırma yanlış çıkar ve o yer işareti sınıra katkı vermez
+                sinir = 0.0
+                for a, b in zip(hedef_ileri, ileri[:, v].tolist()):
+                    if sinir < a - b < sonsuz:
+                        sinir = a - b
+                for a, b in zip(geri[:, v].tolist(), hedef_geri):
+                    if sinir < a - b < sonsuz:
+                        sinir = a - b
+                sinirlar[v] = sinir
+            return sinir
+        return sezgisel
+
+    def en_kisa_yol(self, graph, baslangic, hedef, maliyet=None):
+        """
+        ALT sorgusu: Dijkstra'yı yer işareti sınırlarıyla hedefe yönlendirir.
+        maliyet verilmezse tabloların hesaplandığı modelin maliyeti kullanılır; başka bir maliyet verilirse
+        sınırlar gerçek kalan maliyeti aşabilir ve en kısa yol garanti edilmez.
+        Dönüş: (yol, toplam maliyet, kesinleşen düğüm sayısı)
+        """
+        maliyet = maliyet or self.maliyet_modeli.kenar_maliyeti
+        return a_yildiz(graph, baslangic, hedef, self.sezgisel(hedef), maliyet)